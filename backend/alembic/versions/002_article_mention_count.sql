@@ -0,0 +1,4 @@
+-- brandguard/backend/alembic/versions/002_article_mention_count.sql
+-- Near-duplicate articles are folded into one canonical row
+
+ALTER TABLE articles ADD COLUMN mention_count INTEGER NOT NULL DEFAULT 1;
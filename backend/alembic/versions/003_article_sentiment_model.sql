@@ -0,0 +1,5 @@
+-- brandguard/backend/alembic/versions/003_article_sentiment_model.sql
+-- Track which sentiment model scored each article so stale rows can be rescored
+
+ALTER TABLE articles ADD COLUMN sentiment_model VARCHAR(255);
+CREATE INDEX idx_articles_sentiment_model ON articles(sentiment_model);
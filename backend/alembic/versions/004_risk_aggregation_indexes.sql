@@ -0,0 +1,5 @@
+-- brandguard/backend/alembic/versions/004_risk_aggregation_indexes.sql
+-- Risk factors are aggregated per company over a created_at window
+
+CREATE INDEX idx_articles_company_created ON articles(company_id, created_at);
+CREATE INDEX idx_reviews_company_created ON reviews(company_id, created_at);
@@ -0,0 +1,15 @@
+-- brandguard/backend/alembic/versions/005_sentiment_daily_rollups.sql
+-- Daily sentiment sums per company and source type, maintained on ingest.
+-- Populate after migrating with:
+--   python -m app.services.analyzers.sentiment_rollups --rebuild
+
+CREATE TABLE sentiment_daily_rollups (
+    company_id INTEGER NOT NULL REFERENCES companies(id),
+    day DATE NOT NULL,
+    source_type VARCHAR(20) NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    score_sum FLOAT NOT NULL DEFAULT 0.0,
+    score_sq_sum FLOAT NOT NULL DEFAULT 0.0,
+    confidence_sum FLOAT NOT NULL DEFAULT 0.0,
+    PRIMARY KEY (company_id, day, source_type)
+);
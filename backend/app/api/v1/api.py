@@ -1,7 +1,8 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import companies
+from app.api.v1.endpoints import companies, sentiment
 
 api_router = APIRouter()
 
 # تسجيل routers
 api_router.include_router(companies.router, prefix="/companies", tags=["companies"])
+api_router.include_router(sentiment.router, prefix="/sentiment", tags=["sentiment"])
@@ -11,7 +11,16 @@ from datetime import datetime
 from app.core.security import get_current_user
 from app.db.session import get_db
 from app.models.company import Company
-from app.schemas.company import CompanyCreate, CompanyResponse, CompanyUpdate
+from app.schemas.company import (
+    CompanyCreate,
+    CompanyResponse,
+    CompanyUpdate,
+    RefreshBatchRequest,
+    TrendBatchRequest,
+)
+from app.services.analyzers.result_cache import get_result_cache
+from app.services.analyzers.risk_scorer import RiskScoringEngine
+from app.services.analyzers.risk_state import get_risk_state_store
 from app.services.analyzers.trend_analyzer import TrendAnalyzer
 from app.services.data_collectors.news_collector import LegalNewsCollector
 
@@ -115,7 +124,7 @@ def get_company_trends(
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
 
-    analyzer = TrendAnalyzer(db)
+    analyzer = TrendAnalyzer(db, result_cache=get_result_cache())
     trends = analyzer.analyze_company_trends(company_id, days)
 
     return {
@@ -127,6 +136,72 @@ def get_company_trends(
     }
 
 
+@router.get("/{company_id}/risk")
+def get_company_risk(
+    company_id: int,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Get the current risk score of a company, read from its incrementally
+    maintained factor state
+    """
+    company = (
+        db.query(Company).filter(Company.id == company_id, Company.is_active).first()
+    )
+
+    if not company:
+        raise HTTPException(status_code=404, detail="Company not found")
+
+    engine = RiskScoringEngine(
+        db, state_store=get_risk_state_store(), result_cache=get_result_cache()
+    )
+    return {
+        "company_id": company_id,
+        "company_name": company.name,
+        "risk": engine.calculate_risk_score(company_id),
+    }
+
+
+@router.post("/trends:batch")
+def get_company_trends_batch(
+    request: TrendBatchRequest,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Get trend analysis for several companies at once, e.g. a brand and its
+    competitors; all companies are loaded and analyzed together
+    """
+    company_ids = list(dict.fromkeys(request.company_ids))
+    companies = {
+        company.id: company
+        for company in db.query(Company).filter(
+            Company.id.in_(company_ids), Company.is_active
+        )
+    }
+    found = [company_id for company_id in company_ids if company_id in companies]
+
+    analyzer = TrendAnalyzer(db, result_cache=get_result_cache())
+    trends = analyzer.analyze_companies(found, request.days) if found else {}
+
+    return {
+        "analysis_period_days": request.days,
+        "companies": [
+            {
+                "company_id": company_id,
+                "company_name": companies[company_id].name,
+                "trends": trends[company_id],
+                "summary": analyzer.generate_trend_summary(trends[company_id]),
+            }
+            for company_id in found
+        ],
+        "not_found": [
+            company_id for company_id in company_ids if company_id not in companies
+        ],
+    }
+
+
 @router.post("/{company_id}/refresh")
 async def refresh_company_data(
     company_id: int,
@@ -172,6 +247,42 @@ async def refresh_company_data(
     }
 
 
+@router.post("/refresh:batch")
+async def refresh_companies_batch(
+    request: RefreshBatchRequest,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Collect news for many companies in one cycle; shared feeds are fetched
+    once and matched against every company's keywords
+    """
+    query = db.query(Company).filter(Company.is_active)
+    if request.company_ids is not None:
+        query = query.filter(Company.id.in_(request.company_ids))
+    companies = query.all()
+    found = {company.id for company in companies}
+
+    collector = LegalNewsCollector(db)
+    new_articles = await collector.collect_for_portfolio(companies, request.days_back)
+
+    return {
+        "companies": [
+            {
+                "company_id": company.id,
+                "company_name": company.name,
+                "new_articles": len(new_articles[company.id]),
+            }
+            for company in companies
+        ],
+        "not_found": [
+            company_id
+            for company_id in dict.fromkeys(request.company_ids or [])
+            if company_id not in found
+        ],
+    }
+
+
 @router.put("/{company_id}", response_model=CompanyResponse)
 def update_company(
     company_id: int,
@@ -0,0 +1,27 @@
+# brandguard/backend/app/api/v1/endpoints/sentiment.py
+from fastapi import APIRouter, Depends
+from starlette.concurrency import run_in_threadpool
+
+from app.core.security import get_current_user
+from app.schemas.sentiment import SentimentBatchRequest, SentimentBatchResponse
+from app.services.analyzers.sentiment_analyzer import get_sentiment_analyzer
+
+router = APIRouter()
+
+
+@router.post("/batch", response_model=SentimentBatchResponse)
+async def analyze_sentiment_batch(
+    request: SentimentBatchRequest,
+    current_user=Depends(get_current_user),
+):
+    """
+    Analyze many texts in one call
+
+    Texts are micro-batched together with concurrent requests from other
+    clients, so the model sees full batches instead of single texts.
+    Without PRELOAD_MODELS the first call loads the model, which is done in
+    a worker thread to keep the event loop serving other requests.
+    """
+    analyzer = await run_in_threadpool(get_sentiment_analyzer)
+    results = await analyzer.analyze_many_async(request.texts)
+    return {"results": results}
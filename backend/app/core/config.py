@@ -29,6 +29,37 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "BrandGuard"
     API_V1_STR: str = "/api/v1"
 
+    # Sentiment analysis
+    SENTIMENT_MODEL_NAME: str = "distilbert-base-uncased-finetuned-sst-2-english"
+    SENTIMENT_BACKEND: str = "pytorch"  # pytorch, onnx, onnx-int8
+    SENTIMENT_ONNX_DIR: str = "model_cache/onnx"
+    PRELOAD_MODELS: bool = True
+    SENTIMENT_MAX_BATCH_SIZE: int = 32
+    SENTIMENT_MAX_WAIT_MS: float = 5.0
+    SENTIMENT_LONG_DOCUMENT: bool = True
+    SENTIMENT_CACHE_MAX_ENTRIES: int = 10000
+    SENTIMENT_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+
+    # Risk scoring
+    RISK_MODEL_DIR: str = "model_cache/risk"
+
+    # Trend and risk results, valid until the company's data changes
+    RESULT_CACHE_TTL_SECONDS: int = 24 * 3600
+
+    # Collection
+    DEDUP_WINDOW_DAYS: int = 7
+    DEDUP_THRESHOLD: float = 0.8
+    COLLECTOR_MAX_CONCURRENCY: int = 10
+    COLLECTOR_MAX_PER_HOST: int = 2
+    RATE_LIMIT_BURST: int = 3
+    RATE_LIMIT_REDIS_TIMEOUT_SECONDS: float = 0.5
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 10
+    HTTP_TIMEOUT_SECONDS: float = 30
+    HTTP_RETRIES: int = 2
+    FEED_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    FEED_CACHE_TTL_SECONDS: int = 24 * 3600
+
     # Compliance
     DATA_RETENTION_DAYS: int = 365
 
@@ -1,12 +1,49 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.responses import JSONResponse
 import asyncpg
 import redis
 import os
 
+from app.core.config import settings
+from app.core.security import get_current_user
+
 app = FastAPI(title="BrandGuard API")
 
 
+@app.on_event("startup")
+async def preload_ml_models():
+    # No-op when gunicorn already preloaded the models before forking
+    if settings.PRELOAD_MODELS:
+        from starlette.concurrency import run_in_threadpool
+
+        from app.services.analyzers.model_registry import preload_models
+
+        await run_in_threadpool(preload_models)
+
+
+@app.on_event("shutdown")
+async def close_http_sessions():
+    from app.services.data_collectors.http_client import close_http_client
+
+    await close_http_client()
+
+
+@app.get("/metrics/http", dependencies=[Depends(get_current_user)])
+async def http_client_metrics():
+    """Connection reuse and per-host latency of the collectors' HTTP client"""
+    from app.services.data_collectors.http_client import get_http_client
+
+    return get_http_client().stats()
+
+
+@app.get("/metrics/feeds", dependencies=[Depends(get_current_user)])
+async def feed_cache_metrics():
+    """304s, memoized and fresh parses, and size of the feed cache"""
+    from app.services.data_collectors.feed_cache import get_feed_cache
+
+    return get_feed_cache().stats()
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
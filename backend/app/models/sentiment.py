@@ -1,7 +1,18 @@
 # brandguard/backend/app/models/sentiment.py
 from datetime import datetime
 from sqlalchemy import Boolean
-from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.orm import relationship
 
 from app.db.base import Base
 
@@ -12,6 +23,7 @@ class Article(Base):
     id = Column(Integer, primary_key=True, index=True)
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
     source_id = Column(Integer, ForeignKey("data_sources.id"), nullable=False)
+    source = relationship("DataSource")
 
     # Article data
     title = Column(String, nullable=False)
@@ -24,9 +36,13 @@ class Article(Base):
     # positive, negative, neutral
     sentiment = Column(String, default="neutral")
     confidence_score = Column(Float, default=0.0)  # 0-1
+    # Model name/version that produced sentiment and confidence_score
+    sentiment_model = Column(String, nullable=True, index=True)
     keywords = Column(JSON, default=list)
     entities = Column(JSON, default=list)
     relevance_score = Column(Float, default=0.0)  # 0-1
+    # Near-duplicate copies folded into this article
+    mention_count = Column(Integer, default=1, nullable=False)
 
     # Compliance
     is_public = Column(Boolean, default=True)
@@ -56,3 +72,18 @@ class Review(Base):
     # Compliance
     platform_terms_compliant = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class SentimentRollup(Base):
+    """Per-day sentiment sums of one company's articles or reviews"""
+
+    __tablename__ = "sentiment_daily_rollups"
+
+    company_id = Column(Integer, ForeignKey("companies.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    source_type = Column(String, primary_key=True)  # article, review
+
+    count = Column(Integer, default=0, nullable=False)
+    score_sum = Column(Float, default=0.0, nullable=False)  # scores are 0-1
+    score_sq_sum = Column(Float, default=0.0, nullable=False)
+    confidence_sum = Column(Float, default=0.0, nullable=False)
@@ -1,5 +1,5 @@
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
 
 
 class CompanyBase(BaseModel):
@@ -24,3 +24,14 @@ class CompanyResponse(CompanyBase):
 
     class Config:
         from_attributes = True
+
+
+class TrendBatchRequest(BaseModel):
+    company_ids: List[int] = Field(..., min_length=1, max_length=50)
+    days: int = Field(90, ge=7, le=365)
+
+
+class RefreshBatchRequest(BaseModel):
+    # All active companies when omitted
+    company_ids: Optional[List[int]] = Field(None, min_length=1, max_length=1000)
+    days_back: int = Field(7, ge=1, le=365)
@@ -0,0 +1,16 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class SentimentBatchRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=1000)
+
+
+class SentimentResult(BaseModel):
+    sentiment: str
+    confidence: float
+    method: str
+
+
+class SentimentBatchResponse(BaseModel):
+    results: List[SentimentResult]
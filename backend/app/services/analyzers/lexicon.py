@@ -0,0 +1,193 @@
+# brandguard/backend/app/services/analyzers/lexicon.py
+import string
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+POSITIVE_WORDS = frozenset(
+    {
+        "good",
+        "great",
+        "excellent",
+        "awesome",
+        "fantastic",
+        "amazing",
+        "wonderful",
+        "perfect",
+        "best",
+        "love",
+        "like",
+        "happy",
+        "positive",
+        "success",
+        "successful",
+        "win",
+        "winner",
+        "profit",
+        "growth",
+        "improve",
+        "improvement",
+        "better",
+        "strong",
+        "stable",
+    }
+)
+
+NEGATIVE_WORDS = frozenset(
+    {
+        "bad",
+        "terrible",
+        "awful",
+        "horrible",
+        "worst",
+        "hate",
+        "dislike",
+        "sad",
+        "negative",
+        "failure",
+        "fail",
+        "problem",
+        "issue",
+        "error",
+        "crash",
+        "loss",
+        "decline",
+        "drop",
+        "weak",
+        "poor",
+        "disappoint",
+        "disappointment",
+    }
+)
+
+NEUTRAL_WORDS = frozenset(
+    {
+        "company",
+        "release",
+        "announce",
+        "report",
+        "today",
+        "yesterday",
+        "week",
+        "month",
+        "year",
+        "quarter",
+        "results",
+    }
+)
+
+POSITIVE, NEGATIVE, NEUTRAL = 0, 1, 2
+
+# Punctuation becomes whitespace so "great!" and "company's" still match
+_PUNCTUATION = str.maketrans(
+    {
+        char: " "
+        for char in string.punctuation + "\u2018\u2019\u201c\u201d\u2013\u2014\u2026"
+    }
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, strip punctuation and split in a single pass of C calls"""
+    return text.lower().translate(_PUNCTUATION).split()
+
+
+class LexiconScorer:
+    """
+    Compiled word-list sentiment scorer
+    - Word lists are merged once into a single word -> class lookup
+    - Each text is tokenized once and counted in one pass
+    - Batch scoring classifies an (n, 3) count matrix with NumPy
+    """
+
+    def __init__(
+        self,
+        positive: Sequence[str] = POSITIVE_WORDS,
+        negative: Sequence[str] = NEGATIVE_WORDS,
+        neutral: Sequence[str] = NEUTRAL_WORDS,
+    ):
+        self.term_class: Dict[str, int] = {}
+        for words, column in (
+            (neutral, NEUTRAL),
+            (negative, NEGATIVE),
+            (positive, POSITIVE),
+        ):
+            for word in words:
+                self.term_class[word] = column
+
+    def count(self, text: str) -> List[int]:
+        """Positive, negative and neutral keyword counts for one text"""
+        counts = [0, 0, 0]
+        lookup = self.term_class.get
+        for token in tokenize(text):
+            column = lookup(token)
+            if column is not None:
+                counts[column] += 1
+        return counts
+
+    def count_batch(self, texts: Sequence[str]) -> np.ndarray:
+        """(n, 3) keyword counts for many texts"""
+        flat = []
+        lookup = self.term_class.get
+        for text in texts:
+            counts = [0, 0, 0]
+            for token in tokenize(text):
+                column = lookup(token)
+                if column is not None:
+                    counts[column] += 1
+            flat.extend(counts)
+        return np.array(flat, dtype=np.int64).reshape(len(texts), 3)
+
+    def classify(self, counts: Sequence[int]) -> Optional[Tuple[str, float]]:
+        """Label and confidence for one text's counts; None without keywords"""
+        positive_count, negative_count, neutral_count = counts
+        total = positive_count + negative_count + neutral_count
+        if total == 0:
+            return None
+
+        positive_score = positive_count / total
+        negative_score = negative_count / total
+
+        if positive_score > negative_score and positive_score > 0.3:
+            return "POSITIVE", min(positive_score, 0.9)
+        if negative_score > positive_score and negative_score > 0.3:
+            return "NEGATIVE", min(negative_score, 0.9)
+        return "NEUTRAL", 0.5
+
+    def classify_batch(
+        self, counts: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized labels, confidences and has-keywords mask for (n, 3) counts"""
+        total = counts.sum(axis=1)
+        has_keywords = total > 0
+        safe_total = np.where(has_keywords, total, 1)
+
+        positive_score = counts[:, POSITIVE] / safe_total
+        negative_score = counts[:, NEGATIVE] / safe_total
+
+        is_positive = (positive_score > negative_score) & (positive_score > 0.3)
+        is_negative = (
+            ~is_positive & (negative_score > positive_score) & (negative_score > 0.3)
+        )
+
+        labels = np.where(
+            is_positive, "POSITIVE", np.where(is_negative, "NEGATIVE", "NEUTRAL")
+        )
+        confidences = np.where(
+            is_positive,
+            np.minimum(positive_score, 0.9),
+            np.where(is_negative, np.minimum(negative_score, 0.9), 0.5),
+        )
+        return labels, confidences, has_keywords
+
+
+DEFAULT_LEXICON = LexiconScorer()
+
+__all__ = [
+    "LexiconScorer",
+    "tokenize",
+    "DEFAULT_LEXICON",
+    "POSITIVE_WORDS",
+    "NEGATIVE_WORDS",
+    "NEUTRAL_WORDS",
+]
@@ -0,0 +1,97 @@
+# brandguard/backend/app/services/analyzers/long_document.py
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+_WORD_SPANS = re.compile(r"\S+")
+
+# Rough words-per-token ratio used when no fast tokenizer is available
+_WORDS_PER_TOKEN = 0.75
+
+
+def split_windows(
+    texts: Sequence[str],
+    tokenizer=None,
+    window_tokens: int = 510,
+    overlap_tokens: int = 64,
+) -> List[List[Tuple[str, int]]]:
+    """
+    Split each text into overlapping windows of at most window_tokens tokens.
+
+    Returns one list of (window_text, token_count) per input text. Windows
+    are cut on token boundaries using the tokenizer's offset mapping, so each
+    one fits the model without truncation. All texts are tokenized in a single
+    call. Without a fast tokenizer, whitespace words are used as a
+    conservative stand-in for tokens.
+    """
+    spans_per_text = _token_spans(texts, tokenizer)
+    if spans_per_text is None:
+        window_tokens = max(1, int(window_tokens * _WORDS_PER_TOKEN))
+        overlap_tokens = int(overlap_tokens * _WORDS_PER_TOKEN)
+        spans_per_text = [
+            [match.span() for match in _WORD_SPANS.finditer(text)] for text in texts
+        ]
+
+    step = max(1, window_tokens - overlap_tokens)
+    windows = []
+    for text, spans in zip(texts, spans_per_text):
+        if len(spans) <= window_tokens:
+            windows.append([(text, max(1, len(spans)))])
+            continue
+
+        doc_windows = []
+        for start in range(0, len(spans), step):
+            end = min(start + window_tokens, len(spans))
+            window_text = text[spans[start][0] : spans[end - 1][1]]
+            doc_windows.append((window_text, end - start))
+            if end == len(spans):
+                break
+        windows.append(doc_windows)
+
+    return windows
+
+
+def combine_window_scores(
+    outputs: Sequence[Dict], weights: Sequence[int]
+) -> Tuple[str, float]:
+    """
+    Combine per-window classifier outputs into one label and confidence.
+
+    Each window's output is turned into a probability of being positive
+    (score for POSITIVE, 1 - score for NEGATIVE, 0.5 otherwise) and the
+    probabilities are averaged weighted by window length in tokens. A
+    single window therefore keeps the model's own label and score.
+    """
+    total_weight = float(sum(weights))
+    if total_weight <= 0:
+        return "NEUTRAL", 0.5
+
+    positive = 0.0
+    for output, weight in zip(outputs, weights):
+        label = output["label"].upper()
+        score = float(output["score"])
+        if label == "POSITIVE":
+            probability = score
+        elif label == "NEGATIVE":
+            probability = 1.0 - score
+        else:
+            probability = 0.5
+        positive += weight * probability
+    positive /= total_weight
+
+    if positive > 0.5:
+        return "POSITIVE", positive
+    if positive < 0.5:
+        return "NEGATIVE", 1.0 - positive
+    return "NEUTRAL", 0.5
+
+
+def _token_spans(texts: Sequence[str], tokenizer) -> Optional[List[List[tuple]]]:
+    if tokenizer is None or getattr(tokenizer, "is_fast", False) is not True:
+        return None
+    encoded = tokenizer(
+        list(texts), add_special_tokens=False, return_offsets_mapping=True
+    )
+    return [list(offsets) for offsets in encoded["offset_mapping"]]
+
+
+__all__ = ["split_windows", "combine_window_scores"]
@@ -0,0 +1,119 @@
+# brandguard/backend/app/services/analyzers/micro_batcher.py
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Dynamic micro-batching front-end for a synchronous batch function
+    - Requests arriving within max_wait_ms of each other share one batch
+    - A batch is flushed early once max_batch_size requests are queued
+    - The batch function runs on a dedicated worker thread, never on the loop
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="micro-batcher"
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its result"""
+        self._ensure_started()
+        future = self._loop.create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def submit_many(self, items: Sequence[Any]) -> List[Any]:
+        """Queue several items at once; results keep the input order"""
+        self._ensure_started()
+        futures = []
+        for item in items:
+            future = self._loop.create_future()
+            self._queue.put_nowait((item, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def aclose(self):
+        """Stop the collector task and release the worker thread"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._executor.shutdown(wait=False)
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+        # Queues and futures are bound to one event loop
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._collect_batches())
+
+    async def _collect_batches(self):
+        loop = self._loop
+        max_wait = self.max_wait_ms / 1000.0
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + max_wait
+
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Callers that went away (e.g. cancelled requests) are skipped
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if batch:
+                await self._run_batch(batch)
+
+    async def _run_batch(self, batch: List[tuple]):
+        items = [item for item, _ in batch]
+        try:
+            results = await self._loop.run_in_executor(
+                self._executor, self.batch_fn, items
+            )
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"batch function returned {len(results)} results "
+                    f"for {len(items)} items"
+                )
+        except Exception as e:
+            logger.error(f"Micro-batch of {len(items)} items failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+__all__ = ["MicroBatcher"]
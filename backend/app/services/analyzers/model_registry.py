@@ -0,0 +1,140 @@
+# brandguard/backend/app/services/analyzers/model_registry.py
+import gc
+import logging
+import os
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of loaded models
+    - Each key is loaded once, on first use, and shared by every caller
+    - Concurrent first requests for the same key wait for a single load
+    - Failed loads are cached as None so callers fall back without retrying
+    """
+
+    def __init__(self):
+        self._models: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the model for key, loading it with loader on first use"""
+        if key in self._models:
+            return self._models[key]
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if key not in self._models:
+                self._models[key] = loader()
+            return self._models[key]
+
+    def is_loaded(self, key: Hashable) -> bool:
+        return key in self._models
+
+    def clear(self):
+        """Forget all loaded models (mainly for tests)"""
+        with self._lock:
+            self._models.clear()
+            self._key_locks.clear()
+
+    def _reinit_locks(self):
+        # A lock held by another thread at fork time would never be released
+        # in the child, so children start with fresh locks. Loaded models are
+        # kept and shared with the parent copy-on-write.
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+
+model_registry = ModelRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=model_registry._reinit_locks)
+
+
+def _load_sentiment_pipeline(model_name: str):
+    """Build a transformers sentiment pipeline, or None when unavailable"""
+    try:
+        from transformers import pipeline
+
+        sentiment_pipeline = pipeline("sentiment-analysis", model=model_name)
+        logger.info(f"Loaded sentiment analysis model: {model_name}")
+        return sentiment_pipeline
+    except ImportError as e:
+        logger.warning(f"Transformers not available: {e}. Using simple analyzer.")
+    except Exception as e:
+        logger.error(f"Error loading model: {e}")
+    return None
+
+
+def _load_pytorch_sentiment_pipeline(model_name: str) -> Tuple[Any, str]:
+    return _load_sentiment_pipeline(model_name), "pytorch"
+
+
+def _load_onnx_sentiment_pipeline(model_name: str, backend: str) -> Tuple[Any, str]:
+    """Build an ONNX Runtime pipeline, falling back to PyTorch on failure"""
+    from app.services.analyzers.onnx_backend import load_onnx_pipeline
+
+    try:
+        return load_onnx_pipeline(model_name, quantize=backend == "onnx-int8"), backend
+    except ImportError as e:
+        logger.warning(f"ONNX Runtime backend not available: {e}. Using PyTorch.")
+    except Exception as e:
+        logger.error(f"Error loading ONNX model: {e}. Using PyTorch.")
+    return get_sentiment_model(model_name)
+
+
+def get_sentiment_model(model_name: str, backend: str = "pytorch") -> Tuple[Any, str]:
+    """
+    Shared sentiment pipeline for model_name and the backend serving it
+
+    backend is "pytorch", "onnx" or "onnx-int8"; the backend returned is
+    "pytorch" when an ONNX one could not be loaded. The pipeline is None
+    when no model can be loaded at all.
+    """
+    if backend == "pytorch":
+        loader = partial(_load_pytorch_sentiment_pipeline, model_name)
+    else:
+        loader = partial(_load_onnx_sentiment_pipeline, model_name, backend)
+    return model_registry.get(("sentiment", model_name, backend), loader)
+
+
+def get_sentiment_pipeline(model_name: str, backend: str = "pytorch"):
+    """Shared sentiment pipeline for model_name (None if it cannot be loaded)"""
+    return get_sentiment_model(model_name, backend)[0]
+
+
+def preload_models(model_names: Optional[Iterable[str]] = None):
+    """
+    Load models up front, e.g. in the gunicorn master before workers fork.
+
+    Objects that exist before the fork are shared copy-on-write; freezing
+    the GC afterwards keeps collections in the workers from touching (and
+    therefore copying) the pages that hold the model objects.
+    """
+    from app.core.config import settings
+
+    from app.services.analyzers.risk_model import load_risk_model
+
+    for model_name in model_names or [settings.SENTIMENT_MODEL_NAME]:
+        get_sentiment_pipeline(model_name, settings.SENTIMENT_BACKEND)
+    load_risk_model()
+
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+
+
+__all__ = [
+    "ModelRegistry",
+    "model_registry",
+    "get_sentiment_model",
+    "get_sentiment_pipeline",
+    "preload_models",
+]
@@ -0,0 +1,109 @@
+# brandguard/backend/app/services/analyzers/onnx_backend.py
+import logging
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+ONNX_BACKENDS = ("onnx", "onnx-int8")
+
+_FP32_FILE = "model.onnx"
+_INT8_FILE = "model_quantized.onnx"
+
+
+def load_onnx_pipeline(model_name: str, quantize: bool = False, cache_dir: str = None):
+    """
+    Build a sentiment pipeline served by ONNX Runtime on CPU.
+
+    The model is exported to ONNX on first use and kept under cache_dir;
+    with quantize=True the export is additionally quantized to int8 using
+    dynamic quantization, which needs no calibration data. The returned object
+    is a regular transformers pipeline, so callers keep the same contract.
+    """
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from transformers import AutoTokenizer, pipeline
+
+    if cache_dir is None:
+        from app.core.config import settings
+
+        cache_dir = settings.SENTIMENT_ONNX_DIR
+
+    model_dir = Path(cache_dir) / _slug(model_name)
+    fp32_dir = model_dir / "fp32"
+    if not (fp32_dir / _FP32_FILE).exists():
+        _export(model_name, fp32_dir)
+
+    target_dir, file_name = fp32_dir, _FP32_FILE
+    if quantize:
+        target_dir, file_name = model_dir / "int8", _INT8_FILE
+        if not (target_dir / _INT8_FILE).exists():
+            _quantize(fp32_dir, target_dir)
+
+    model = ORTModelForSequenceClassification.from_pretrained(
+        target_dir, file_name=file_name
+    )
+    tokenizer = AutoTokenizer.from_pretrained(target_dir)
+    logger.info(f"Loaded ONNX sentiment model: {model_name} ({file_name})")
+    return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+
+
+def check_label_agreement(
+    texts: Sequence[str],
+    reference: Callable[[List[str]], List[Dict]],
+    candidate: Callable[[List[str]], List[Dict]],
+) -> Dict:
+    """Compare labels of two batch analyzers over the same corpus"""
+    texts = list(texts)
+    expected = reference(texts)
+    actual = candidate(texts)
+
+    mismatches = [
+        {
+            "text": text,
+            "expected": want["sentiment"],
+            "actual": got["sentiment"],
+            "confidence_delta": abs(want["confidence"] - got["confidence"]),
+        }
+        for text, want, got in zip(texts, expected, actual)
+        if want["sentiment"] != got["sentiment"]
+    ]
+    deltas = [abs(w["confidence"] - g["confidence"]) for w, g in zip(expected, actual)]
+
+    return {
+        "total": len(texts),
+        "agreement": 1 - len(mismatches) / len(texts) if texts else 1.0,
+        "max_confidence_delta": max(deltas) if deltas else 0.0,
+        "mismatches": mismatches,
+    }
+
+
+def _export(model_name: str, output_dir: Path):
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from transformers import AutoTokenizer
+
+    logger.info(f"Exporting {model_name} to ONNX in {output_dir}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+    model.save_pretrained(output_dir)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(output_dir)
+
+
+def _quantize(fp32_dir: Path, output_dir: Path):
+    from optimum.onnxruntime import ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+
+    logger.info(f"Quantizing {fp32_dir} to int8 in {output_dir}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    quantizer = ORTQuantizer.from_pretrained(fp32_dir, file_name=_FP32_FILE)
+    config = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=output_dir, quantization_config=config)
+    AutoTokenizer.from_pretrained(fp32_dir).save_pretrained(output_dir)
+
+
+def _slug(model_name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "--", model_name)
+
+
+__all__ = ["ONNX_BACKENDS", "load_onnx_pipeline", "check_label_agreement"]
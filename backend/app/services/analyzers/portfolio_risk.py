@@ -0,0 +1,319 @@
+# brandguard/backend/app/services/analyzers/portfolio_risk.py
+"""
+Batch risk scoring for the whole portfolio of active companies.
+
+Usage:
+    cd backend && python -m app.services.analyzers.portfolio_risk --workers 4
+"""
+import argparse
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, func, literal, or_, select, union_all, update
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.models.company import Company
+from app.models.sentiment import Article, Review
+from app.services.analyzers.risk_scorer import (
+    ARTICLE_IMPACT,
+    ARTICLE_NEGATIVE_GAP,
+    FACTOR_NAMES,
+    SCORE_SOURCES,
+    TREND_WINDOW,
+    RiskScoringEngine,
+    window_start,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _window(model, companies, start_date: datetime, end_date: Optional[datetime]):
+    conditions = [model.company_id.in_(companies), model.created_at >= start_date]
+    if end_date is not None:
+        conditions.append(model.created_at < end_date)
+    return conditions
+
+
+def load_aggregates(
+    db: Session,
+    companies,
+    start_date: datetime,
+    end_date: Optional[datetime] = None,
+) -> Dict:
+    """
+    Grouped factor inputs for many companies in three queries
+    - companies: list of ids or a SELECT of ids
+    - end_date: exclusive upper bound, for historical snapshots
+    """
+    article_day = func.date(Article.created_at)
+    article_days = db.execute(
+        select(
+            Article.company_id,
+            article_day,
+            func.count(Article.id),
+            func.max(ARTICLE_NEGATIVE_GAP),
+            func.sum(ARTICLE_IMPACT),
+        )
+        .where(*_window(Article, companies, start_date, end_date))
+        .group_by(Article.company_id, article_day)
+    ).all()
+
+    review_day = func.date(Review.created_at)
+    review_days = db.execute(
+        select(
+            Review.company_id,
+            review_day,
+            func.count(Review.id),
+            func.sum(Review.rating),
+        )
+        .where(*_window(Review, companies, start_date, end_date))
+        .group_by(Review.company_id, review_day)
+    ).all()
+
+    # First and last TREND_WINDOW scores per company and source
+    parts = []
+    for rank, (model, score) in enumerate(SCORE_SOURCES):
+        position = {
+            name: func.row_number().over(
+                partition_by=model.company_id,
+                order_by=[getattr(c, name)() for c in (model.created_at, model.id)],
+            )
+            for name in ("asc", "desc")
+        }
+        ranked = (
+            select(
+                model.company_id.label("company_id"),
+                model.created_at.label("created_at"),
+                literal(rank).label("rank"),
+                model.id.label("id"),
+                score.label("score"),
+                position["asc"].label("first"),
+                position["desc"].label("last"),
+            )
+            .where(*_window(model, companies, start_date, end_date))
+            .subquery()
+        )
+        parts.append(
+            select(
+                ranked.c.company_id,
+                ranked.c.created_at,
+                ranked.c.rank,
+                ranked.c.id,
+                ranked.c.score,
+            ).where(or_(ranked.c.first <= TREND_WINDOW, ranked.c.last <= TREND_WINDOW))
+        )
+    edges = db.execute(union_all(*parts)).all()
+
+    return {
+        "article_days": pd.DataFrame(
+            article_days,
+            columns=["company_id", "day", "articles", "negative_max", "impact"],
+        ),
+        "review_days": pd.DataFrame(
+            review_days, columns=["company_id", "day", "reviews", "rating_sum"]
+        ),
+        "edges": pd.DataFrame(
+            edges, columns=["company_id", "created_at", "rank", "id", "score"]
+        ),
+    }
+
+
+def compute_factor_frame(aggregates: Dict, company_ids: List[int]) -> pd.DataFrame:
+    """
+    Risk factors for every company as columns over the company axis
+
+    Mirrors the per-company RiskScoringEngine factors; has_data is False for
+    companies without articles or reviews in the window.
+    """
+    daily = aggregates["article_days"].merge(
+        aggregates["review_days"], on=["company_id", "day"], how="outer"
+    )
+    for column in ("articles", "reviews", "rating_sum", "impact"):
+        daily[column] = daily[column].fillna(0).astype(float)
+    daily["negative_max"] = daily["negative_max"].astype(float)
+    daily["day"] = pd.to_datetime(daily["day"])
+    daily["items"] = daily["articles"] + daily["reviews"]
+
+    by_company = daily.groupby("company_id")
+    frame = pd.DataFrame(
+        {
+            "articles": by_company["articles"].sum(),
+            "reviews": by_company["reviews"].sum(),
+            "days": by_company["day"].size(),
+            "negative_max": by_company["negative_max"].max(),
+            "impact": by_company["impact"].sum(),
+            "items_mean": by_company["items"].mean(),
+            "items_std": by_company["items"].std(ddof=0),
+        }
+    ).reindex(pd.Index(company_ids, name="company_id"))
+    frame[["articles", "reviews", "days", "impact"]] = frame[
+        ["articles", "reviews", "days", "impact"]
+    ].fillna(0)
+    total = frame["articles"] + frame["reviews"]
+
+    # Sentiment trend: first vs last full rolling window
+    edges = aggregates["edges"].drop_duplicates(["company_id", "rank", "id"])
+    edges = edges.sort_values(["company_id", "created_at", "rank", "id"])
+    by_edge = edges.groupby("company_id")
+    head = by_edge.head(TREND_WINDOW).groupby("company_id")["score"].mean()
+    tail = by_edge.tail(TREND_WINDOW).groupby("company_id")["score"].mean()
+    trend = (0.5 - (tail.reindex(frame.index) - head.reindex(frame.index))) * 2
+    frame["sentiment_trend"] = trend.where(total >= 5, 0.0)
+
+    volatility = np.minimum(1.0, frame["items_std"] / frame["items_mean"] / 3.0)
+    frame["volume_volatility"] = volatility.where(
+        (total >= 7) & (frame["days"] >= 3), 0.0
+    )
+
+    frame["negative_spikes"] = np.minimum(1.0, frame["negative_max"] * 1.5).fillna(0)
+
+    # Review decline: first vs last ISO week average
+    rated = daily[daily["reviews"] > 0].copy()
+    rated["week"] = rated["day"].dt.isocalendar().week
+    weekly = rated.groupby(["company_id", "week"])[["rating_sum", "reviews"]].sum()
+    averages = (weekly["rating_sum"] / weekly["reviews"]).groupby(level="company_id")
+    decline = ((averages.first() - averages.last()) / 5).clip(lower=0)
+    weeks = averages.size().reindex(frame.index).fillna(0)
+    frame["review_decline"] = (
+        decline.reindex(frame.index).where((frame["reviews"] >= 5) & (weeks >= 2), 0.0)
+    ).fillna(0)
+
+    impact = frame["impact"] / frame["articles"].where(frame["articles"] > 0)
+    frame["news_impact"] = impact.clip(lower=0).fillna(0)
+
+    frame["has_data"] = total > 0
+    return frame[FACTOR_NAMES + ["has_data"]]
+
+
+def _score_chunk(
+    database_url: str, company_ids: List[int], start_date: datetime
+) -> pd.DataFrame:
+    """Process pool entry point: aggregate one chunk of companies"""
+    engine = create_engine(database_url, poolclass=NullPool)
+    try:
+        with Session(engine) as db:
+            aggregates = load_aggregates(db, company_ids, start_date)
+        return compute_factor_frame(aggregates, company_ids)
+    finally:
+        engine.dispose()
+
+
+class PortfolioRiskScorer:
+    """
+    Risk scores for all active companies in one pass
+    - Grouped aggregates for every company at once, not two queries per company
+    - Factors computed with vectorized pandas/NumPy over the company axis
+    - Company.risk_score/risk_factors written with one bulk UPDATE
+    - Optional process pool over chunks of companies for large portfolios
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        workers: Optional[int] = None,
+        chunk_size: int = 2000,
+        database_url: Optional[str] = None,
+        window_days: int = 30,
+    ):
+        self.db = db
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.database_url = database_url
+        self.window_days = window_days
+        self.engine = RiskScoringEngine(db)
+
+    def factor_frame(self) -> pd.DataFrame:
+        """Factor values for every active company, indexed by company_id"""
+        start_date = window_start(datetime.utcnow(), self.window_days)
+        active = select(Company.id).where(Company.is_active.is_(True))
+        company_ids = [row[0] for row in self.db.execute(active.order_by(Company.id))]
+
+        if not self.workers or len(company_ids) <= self.chunk_size:
+            aggregates = load_aggregates(self.db, active, start_date)
+            return compute_factor_frame(aggregates, company_ids)
+
+        if not self.database_url:
+            raise ValueError("database_url is required to score with workers")
+        chunks = [
+            company_ids[i : i + self.chunk_size]
+            for i in range(0, len(company_ids), self.chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            frames = pool.map(
+                _score_chunk,
+                [self.database_url] * len(chunks),
+                chunks,
+                [start_date] * len(chunks),
+            )
+            return pd.concat(list(frames))
+
+    def score(self) -> Dict[int, Dict]:
+        """Risk result per active company, as calculate_risk_score returns it"""
+        frame = self.factor_frame()
+        scored = frame[frame["has_data"]]
+        factors = scored[FACTOR_NAMES].to_dict("index")
+        scores = self.engine.weighted_scores(scored) if len(scored) else []
+        # One predict call for the whole portfolio
+        forecasts = self.engine.forecast_scores(scored) if len(scored) else None
+        if forecasts is None:
+            forecasts = [None] * len(scores)
+        results = {
+            int(company_id): self.engine.build_result(
+                factors[company_id], score, forecast
+            )
+            for company_id, score, forecast in zip(scored.index, scores, forecasts)
+        }
+        for company_id in frame.index[~frame["has_data"]]:
+            results[int(company_id)] = self.engine.build_result(None)
+        return results
+
+    def run(self) -> int:
+        """Score the portfolio and store the results; returns companies updated"""
+        results = self.score()
+        rows = [
+            {
+                "id": company_id,
+                "risk_score": result["score"],
+                "risk_factors": result["factors"],
+            }
+            for company_id, result in results.items()
+        ]
+        if rows:
+            self.db.execute(update(Company), rows)
+            self.db.commit()
+        logger.info("Updated risk scores for %d companies", len(rows))
+        return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recompute risk scores for all active companies"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    from app.core.config import settings
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        scorer = PortfolioRiskScorer(
+            db,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            database_url=settings.DATABASE_URL,
+        )
+        print(scorer.run())
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
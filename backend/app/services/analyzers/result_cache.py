@@ -0,0 +1,238 @@
+# brandguard/backend/app/services/analyzers/result_cache.py
+import json
+import logging
+import random
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """
+    Trend and risk results cached per company, window and data version
+    - Each company has a data version in Redis: a random token created on
+      first use and deleted by invalidate() after new data is committed, so
+      the next reader starts a new version
+    - An entry records the version it was computed from and is served only
+      while that is still the company's version; versions are read before
+      computing, so a result racing with ingestion is never served
+    - A lookup is one MGET of the version and entry keys, for any number of
+      companies
+    - Entries expire after ttl_seconds as a backstop
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        ttl_seconds: int = 86400,
+        key_prefix: str = "results:v1",
+        clock: Callable[[], float] = time.time,
+    ):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "errors": 0}
+        self._hit_age_sum = 0.0
+        self._hit_age_max = 0.0
+
+    @classmethod
+    def from_settings(cls) -> "ResultCache":
+        """Build the cache from settings, sharing the app's Redis client"""
+        from app.core.config import settings
+
+        redis_client = None
+        try:
+            from app.db.session import redis_client
+        except Exception as e:
+            logger.warning(f"Redis unavailable for result cache: {e}")
+
+        return cls(redis_client, ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS)
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    def version_key(self, company_id: int) -> str:
+        return f"{self.key_prefix}:version:{company_id}"
+
+    def entry_key(self, kind: str, company_id: int, params: str) -> str:
+        return f"{self.key_prefix}:{kind}:{company_id}:{params}"
+
+    def invalidate(self, company_ids: Iterable[int]):
+        """Start a new data version; call after committing new data"""
+        keys = [self.version_key(company_id) for company_id in set(company_ids)]
+        if not keys or self.redis is None:
+            return
+        try:
+            self.redis.delete(*keys)
+        except Exception as e:
+            logger.error(f"Result cache invalidation failed for {keys}: {e}")
+
+    def get_or_compute(
+        self,
+        kind: str,
+        company_id: int,
+        params: str,
+        compute: Callable[[], Dict],
+    ) -> Dict:
+        """Cached result for one company, computed and stored on a miss"""
+        return self.get_or_compute_many(
+            kind, [company_id], params, lambda missing: {company_id: compute()}
+        )[company_id]
+
+    def get_or_compute_many(
+        self,
+        kind: str,
+        company_ids: List[int],
+        params: str,
+        compute: Callable[[List[int]], Dict[int, Dict]],
+    ) -> Dict[int, Dict]:
+        """
+        Results for many companies; compute is called once for all misses
+
+        With Redis configured, each result gets a "cache" entry with hit and
+        age_seconds. Results with an "error" key are returned but not stored.
+        """
+        company_ids = list(dict.fromkeys(company_ids))
+        if self.redis is None:
+            return compute(company_ids)
+
+        version_keys = [self.version_key(company_id) for company_id in company_ids]
+        entry_keys = [
+            self.entry_key(kind, company_id, params) for company_id in company_ids
+        ]
+        try:
+            values = self.redis.mget(version_keys + entry_keys)
+        except Exception as e:
+            logger.warning(f"Result cache read failed: {e}")
+            self._count("errors")
+            return compute(company_ids)
+
+        now = self.clock()
+        results, versions = {}, {}
+        for i, company_id in enumerate(company_ids):
+            version, raw = values[i], values[len(company_ids) + i]
+            versions[company_id] = version
+            entry = self._decode(raw)
+            if (
+                entry is not None
+                and version is not None
+                and entry["version"] == version
+            ):
+                age = max(now - entry["computed_at"], 0.0)
+                results[company_id] = {
+                    **entry["value"],
+                    "cache": {"hit": True, "age_seconds": age},
+                }
+                self._record_hit(age)
+            elif entry is not None:
+                self._count("stale")
+
+        missing = [
+            company_id for company_id in company_ids if company_id not in results
+        ]
+        self._count("misses", len(missing))
+        if not missing:
+            return results
+
+        versions.update(self._ensure_versions(missing, versions))
+        computed = compute(missing)
+        self._store(kind, params, computed, versions, now)
+        for company_id in missing:
+            results[company_id] = {
+                **computed[company_id],
+                "cache": {"hit": False, "age_seconds": None},
+            }
+        return {company_id: results[company_id] for company_id in company_ids}
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and the age of entries served from the cache"""
+        with self._lock:
+            stats = dict(self._stats)
+            age_sum, age_max = self._hit_age_sum, self._hit_age_max
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        stats["mean_hit_age_seconds"] = (
+            age_sum / stats["hits"] if stats["hits"] else 0.0
+        )
+        stats["max_hit_age_seconds"] = age_max
+        return stats
+
+    def _ensure_versions(
+        self, company_ids: List[int], versions: Dict[int, Optional[str]]
+    ) -> Dict[int, Optional[str]]:
+        """Create missing versions (SET NX) and return the ones now current"""
+        absent = [
+            company_id for company_id in company_ids if versions[company_id] is None
+        ]
+        if not absent:
+            return {}
+        keys = [self.version_key(company_id) for company_id in absent]
+        try:
+            pipe = self.redis.pipeline()
+            for key in keys:
+                pipe.set(key, str(random.getrandbits(63)), nx=True)
+            pipe.mget(keys)
+            current = pipe.execute()[-1]
+        except Exception as e:
+            logger.warning(f"Result cache version write failed: {e}")
+            return {}
+        return dict(zip(absent, current))
+
+    def _store(self, kind, params, computed, versions, now):
+        try:
+            pipe = self.redis.pipeline()
+            for company_id, value in computed.items():
+                if versions.get(company_id) is None or "error" in value:
+                    continue
+                entry = {
+                    "version": versions[company_id],
+                    "computed_at": now,
+                    "value": value,
+                }
+                pipe.setex(
+                    self.entry_key(kind, company_id, params),
+                    self.ttl_seconds,
+                    json.dumps(entry),
+                )
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Result cache write failed: {e}")
+            self._count("errors")
+
+    @staticmethod
+    def _decode(raw) -> Optional[Dict]:
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except (TypeError, ValueError):
+            return None
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._stats[name] += amount
+
+    def _record_hit(self, age: float):
+        with self._lock:
+            self._stats["hits"] += 1
+            self._hit_age_sum += age
+            self._hit_age_max = max(self._hit_age_max, age)
+
+
+_shared_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """Process-wide result cache, so its statistics cover every request"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ResultCache.from_settings()
+    return _shared_cache
+
+
+__all__ = ["ResultCache", "get_result_cache"]
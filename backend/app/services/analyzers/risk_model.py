@@ -0,0 +1,263 @@
+# brandguard/backend/app/services/analyzers/risk_model.py
+"""
+Trained risk model: offline training, versioned artifacts and batch prediction.
+
+The model forecasts the weighted risk score a company will have
+horizon_days later from its current factor vector, using factor snapshots
+taken every step_days over the history. It does not replace the current
+score: the engine reports its prediction as a separate forecast.
+
+Usage:
+    cd backend && python -m app.services.analyzers.risk_model --history-days 180
+"""
+import argparse
+import glob
+import logging
+import os
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from app.services.analyzers.model_registry import model_registry
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_PREFIX = "risk_model-"
+ARTIFACT_SUFFIX = ".joblib"
+
+
+class RiskModel:
+    """
+    Fitted scaler and regressor loaded from a versioned artifact
+    - Forecasts the weighted score horizon_days ahead
+    - Unpickling copies the trees into each process; preload_models loads
+      the model in the gunicorn master so workers share it copy-on-write
+    - predict() scores many companies in a single call
+    """
+
+    def __init__(
+        self,
+        version: str,
+        features: List[str],
+        scaler,
+        model,
+        horizon_days: int = 7,
+    ):
+        self.version = version
+        self.features = list(features)
+        self.scaler = scaler
+        self.model = model
+        self.horizon_days = horizon_days
+
+    @classmethod
+    def load(cls, path: str) -> "RiskModel":
+        artifact = joblib.load(path)
+        return cls(
+            artifact["version"],
+            artifact["features"],
+            artifact["scaler"],
+            artifact["model"],
+            artifact.get("horizon_days", 7),
+        )
+
+    def predict(self, factors: pd.DataFrame) -> np.ndarray:
+        """0-100 forecast scores for a frame with one row per company"""
+        values = factors[self.features].to_numpy(dtype=float)
+        return np.clip(self.model.predict(self.scaler.transform(values)), 0, 100)
+
+
+def latest_artifact(model_dir: str) -> Optional[str]:
+    """Path of the newest artifact; versions are sortable UTC timestamps"""
+    paths = sorted(glob.glob(os.path.join(model_dir, ARTIFACT_PREFIX + "*")))
+    return paths[-1] if paths else None
+
+
+def _load_latest(model_dir: str) -> Optional[RiskModel]:
+    path = latest_artifact(model_dir)
+    if path is None:
+        logger.info("No risk model artifact found; using weighted factor sum")
+        return None
+    try:
+        model = RiskModel.load(path)
+    except Exception as e:
+        logger.error(f"Error loading risk model {path}: {e}")
+        return None
+    logger.info(f"Loaded risk model {model.version}")
+    return model
+
+
+def load_risk_model(model_dir: Optional[str] = None) -> Optional[RiskModel]:
+    """
+    The process-wide risk model, or None when no artifact exists.
+
+    Loaded once per process; workers pick up a newly trained artifact on
+    restart.
+    """
+    if model_dir is None:
+        from app.core.config import settings
+
+        model_dir = settings.RISK_MODEL_DIR
+    key = ("risk", os.path.abspath(model_dir))
+    return model_registry.get(key, partial(_load_latest, model_dir))
+
+
+def build_training_set(
+    db,
+    history_days: int = 180,
+    step_days: int = 7,
+    horizon_days: int = 7,
+    now: Optional[datetime] = None,
+) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Factor snapshots for all active companies and their future weighted score
+
+    Returns X with one row per (company, snapshot) and an as_of column, and y
+    with the weighted score horizon_days after each snapshot.
+    """
+    from sqlalchemy import select
+
+    from app.models.company import Company
+    from app.services.analyzers.portfolio_risk import (
+        compute_factor_frame,
+        load_aggregates,
+    )
+    from app.services.analyzers.risk_scorer import (
+        FACTOR_NAMES,
+        RiskScoringEngine,
+        window_start,
+    )
+
+    now = now or datetime.utcnow()
+    engine = RiskScoringEngine(db)
+    active = select(Company.id).where(Company.is_active.is_(True))
+    company_ids = [row[0] for row in db.execute(active.order_by(Company.id))]
+
+    frames: Dict[datetime, pd.DataFrame] = {}
+
+    def frame_at(as_of: datetime) -> pd.DataFrame:
+        if as_of not in frames:
+            aggregates = load_aggregates(
+                db, active, window_start(as_of), end_date=as_of
+            )
+            frames[as_of] = compute_factor_frame(aggregates, company_ids)
+        return frames[as_of]
+
+    features, targets = [], []
+    as_of = now - timedelta(days=history_days)
+    while as_of + timedelta(days=horizon_days) <= now:
+        current = frame_at(as_of)
+        future = frame_at(as_of + timedelta(days=horizon_days))
+        rows = current["has_data"] & future["has_data"]
+        if rows.any():
+            features.append(current.loc[rows, FACTOR_NAMES].assign(as_of=as_of))
+            targets.append(
+                pd.Series(
+                    engine.weighted_scores(future.loc[rows]), index=rows.index[rows]
+                )
+            )
+        as_of += timedelta(days=step_days)
+
+    if not features:
+        return pd.DataFrame(columns=FACTOR_NAMES + ["as_of"]), pd.Series(dtype=float)
+    return pd.concat(features), pd.concat(targets)
+
+
+def train(
+    X: pd.DataFrame,
+    y: pd.Series,
+    validation_fraction: float = 0.2,
+    horizon_days: int = 7,
+) -> Dict:
+    """
+    Fit the scaler and regressor; returns the artifact to save
+
+    The latest validation_fraction of snapshots is held out to report the
+    validation MAE, then the model is refit on all rows.
+    """
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.metrics import mean_absolute_error
+    from sklearn.preprocessing import StandardScaler
+
+    from app.services.analyzers.risk_scorer import FACTOR_NAMES
+
+    def fit(features: pd.DataFrame, target: pd.Series):
+        scaler = StandardScaler().fit(features[FACTOR_NAMES].to_numpy(dtype=float))
+        model = RandomForestRegressor(n_estimators=100, random_state=42)
+        model.fit(
+            scaler.transform(features[FACTOR_NAMES].to_numpy(dtype=float)), target
+        )
+        return scaler, model
+
+    metrics = {}
+    snapshots = sorted(X["as_of"].unique())
+    held_out = snapshots[int(len(snapshots) * (1 - validation_fraction)) :]
+    validation = X["as_of"].isin(held_out).to_numpy()
+    if 0 < validation.sum() < len(X):
+        scaler, model = fit(X[~validation], y[~validation])
+        candidate = RiskModel("validation", FACTOR_NAMES, scaler, model)
+        metrics["validation_rows"] = int(validation.sum())
+        metrics["mae"] = float(
+            mean_absolute_error(y[validation], candidate.predict(X[validation]))
+        )
+
+    scaler, model = fit(X, y)
+    version = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+    return {
+        "version": version,
+        "features": FACTOR_NAMES,
+        "scaler": scaler,
+        "model": model,
+        "horizon_days": horizon_days,
+        "trained_at": datetime.utcnow().isoformat(),
+        "training_rows": len(X),
+        "metrics": metrics,
+    }
+
+
+def save_artifact(artifact: Dict, model_dir: str) -> str:
+    """Write an artifact named by its version, so the newest sorts last"""
+    os.makedirs(model_dir, exist_ok=True)
+    path = os.path.join(
+        model_dir, f"{ARTIFACT_PREFIX}{artifact['version']}{ARTIFACT_SUFFIX}"
+    )
+    joblib.dump(artifact, path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the risk scoring model")
+    parser.add_argument("--history-days", type=int, default=180)
+    parser.add_argument("--step-days", type=int, default=7)
+    parser.add_argument("--horizon-days", type=int, default=7)
+    parser.add_argument("--min-rows", type=int, default=50)
+    parser.add_argument("--model-dir", default=None)
+    args = parser.parse_args()
+
+    from app.core.config import settings
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        X, y = build_training_set(
+            db,
+            history_days=args.history_days,
+            step_days=args.step_days,
+            horizon_days=args.horizon_days,
+        )
+    finally:
+        db.close()
+
+    if len(X) < args.min_rows:
+        raise SystemExit(f"Only {len(X)} training rows; need {args.min_rows}")
+    artifact = train(X, y, horizon_days=args.horizon_days)
+    path = save_artifact(artifact, args.model_dir or settings.RISK_MODEL_DIR)
+    print(f"Saved {path} ({len(X)} rows, metrics {artifact['metrics']})")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
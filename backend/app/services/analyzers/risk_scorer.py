@@ -1,13 +1,97 @@
 # brandguard/backend/app/services/analyzers/risk_scorer.py
+import logging
 import numpy as np
-from typing import Dict, List, Tuple
-from datetime import datetime, timedelta
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from sqlalchemy import Float, case, cast, func, literal, select, union_all
 from sqlalchemy.orm import Session
 from app.models.company import Company
 from app.models.sentiment import Article, Review
-import pandas as pd
-from sklearn.preprocessing import StandardScaler
-from sklearn.ensemble import RandomForestRegressor
+from app.services.analyzers.risk_model import RiskModel, load_risk_model
+
+logger = logging.getLogger(__name__)
+
+FACTOR_NAMES = [
+    "sentiment_trend",
+    "volume_volatility",
+    "negative_spikes",
+    "review_decline",
+    "news_impact",
+]
+
+# Number of points in the rolling window used by the sentiment trend factor
+TREND_WINDOW = 3
+
+# Days of history the risk factors are computed over
+RISK_WINDOW_DAYS = 30
+
+# Per-row SQL expressions the factor aggregates are built from
+ARTICLE_SCORE = case(
+    (Article.sentiment == "positive", 1.0),
+    (Article.sentiment == "negative", 0.0),
+    else_=0.5,
+)
+REVIEW_SCORE = cast(Review.rating, Float) / 5.0
+# Articles sort before reviews created at the same instant
+SCORE_SOURCES = [(Article, ARTICLE_SCORE), (Review, REVIEW_SCORE)]
+ARTICLE_NEGATIVE_GAP = case(
+    (Article.sentiment == "negative", 1 - Article.confidence_score)
+)
+ARTICLE_IMPACT = (
+    Article.confidence_score
+    * Article.relevance_score
+    * case(
+        (Article.sentiment == "negative", 1.0),
+        (Article.sentiment == "positive", -0.5),
+        else_=0.0,
+    )
+)
+
+
+@dataclass
+class RiskFactorInputs:
+    """
+    Aggregated inputs for the risk factors of one company
+    - daily: {day: (article_count, review_count, rating_sum)}
+    - negative_max: max(1 - confidence) over negative articles, None if none
+    - impact_sum: sum of confidence * relevance * sentiment weight over articles
+    - head/tail: first and last TREND_WINDOW sentiment scores in time order
+    """
+
+    daily: Dict[date, Tuple[int, int, float]] = field(default_factory=dict)
+    negative_max: Optional[float] = None
+    impact_sum: float = 0.0
+    head: List[float] = field(default_factory=list)
+    tail: List[float] = field(default_factory=list)
+
+    @property
+    def article_count(self) -> int:
+        return sum(articles for articles, _, _ in self.daily.values())
+
+    @property
+    def review_count(self) -> int:
+        return sum(reviews for _, reviews, _ in self.daily.values())
+
+
+def window_start(now: datetime, days: int = RISK_WINDOW_DAYS) -> datetime:
+    """
+    Start of the risk window ending at now: midnight, `days` days back
+
+    Day-aligned so that RiskStateStore's daily buckets, the SQL aggregates
+    and the portfolio scorer all cover the same rows.
+    """
+    return datetime.combine((now - timedelta(days=days)).date(), datetime.min.time())
+
+
+def as_date(value) -> date:
+    """A date, datetime or DATE() result as a date; SQLite returns ISO strings"""
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.date()
+    return value
 
 
 class RiskScoringEngine:
@@ -15,10 +99,20 @@ class RiskScoringEngine:
     Production-ready risk scoring system using ML techniques
     """
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        state_store=None,
+        risk_model: Optional[RiskModel] = None,
+        result_cache=None,
+    ):
         self.db = db
-        self.scaler = StandardScaler()
-        self.model = RandomForestRegressor(n_estimators=100, random_state=42)
+        # Optional RiskStateStore with incrementally maintained factor inputs
+        self.state_store = state_store
+        # Optional ResultCache; scores are reused until a company's data changes
+        self.result_cache = result_cache
+        # Trained forecast model loaded once per process; None means no forecast
+        self.risk_model = risk_model or load_risk_model()
         self.risk_factors = {
             "sentiment_trend": {"weight": 0.25, "threshold": 0.3},
             "volume_volatility": {"weight": 0.20, "threshold": 1.5},
@@ -31,49 +125,94 @@ class RiskScoringEngine:
         """
         Calculate comprehensive 0-100 risk score with explanations
         """
+        if self.result_cache is not None:
+            # The trailing edge of the window moves once a day
+            start_day = window_start(datetime.utcnow()).date()
+            version = self.risk_model.version if self.risk_model else "weighted"
+            return self.result_cache.get_or_compute(
+                "risk",
+                company_id,
+                f"{start_day.isoformat()}:{version}",
+                lambda: self._calculate_risk_score(company_id),
+            )
+        return self._calculate_risk_score(company_id)
+
+    def _calculate_risk_score(self, company_id: int) -> Dict:
         company = self.db.query(Company).filter(Company.id == company_id).first()
         if not company:
             return {"error": "Company not found"}
 
-        # Get historical data
+        # Read the running state, or aggregate historical data in the database
         end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=30)
-
-        articles = (
-            self.db.query(Article)
-            .filter(Article.company_id == company_id, Article.created_at >= start_date)
-            .all()
-        )
-
-        reviews = (
-            self.db.query(Review)
-            .filter(Review.company_id == company_id, Review.created_at >= start_date)
-            .all()
-        )
+        start_date = window_start(end_date)
+        inputs = None
+        if self.state_store is not None:
+            inputs = self.state_store.inputs(self.db, company_id, end_date)
+        if inputs is None:
+            inputs = self._load_factor_inputs(company_id, start_date)
 
-        if not articles and not reviews:
-            return {"score": 25, "risk": "low", "factors": ["Insufficient data"]}
+        if not inputs.article_count and not inputs.review_count:
+            return self.build_result(None)
 
         # Calculate individual factors
         factors = {
-            "sentiment_trend": self._calculate_sentiment_trend(articles, reviews),
-            "volume_volatility": self._calculate_volume_volatility(articles, reviews),
-            "negative_spikes": self._calculate_negative_spikes(articles),
-            "review_decline": self._calculate_review_decline(reviews),
-            "news_impact": self._calculate_news_impact(articles),
+            "sentiment_trend": self._calculate_sentiment_trend(inputs),
+            "volume_volatility": self._calculate_volume_volatility(inputs),
+            "negative_spikes": self._calculate_negative_spikes(inputs),
+            "review_decline": self._calculate_review_decline(inputs),
+            "news_impact": self._calculate_news_impact(inputs),
         }
+        return self.build_result(factors)
 
-        # Weighted score
-        total_score = sum(
-            factor * self.risk_factors[name]["weight"]
-            for name, factor in factors.items()
+    def weighted_scores(self, factors: pd.DataFrame) -> np.ndarray:
+        """0-100 weighted factor sum for a frame with one row per company"""
+        weights = np.array([self.risk_factors[name]["weight"] for name in FACTOR_NAMES])
+        return np.clip(
+            factors[FACTOR_NAMES].to_numpy(dtype=float) @ weights * 100, 0, 100
         )
 
-        score = min(100, max(0, total_score * 100))
+    def forecast_scores(self, factors: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        Scores horizon_days ahead for many companies in one call
+
+        None without a trained model, or when its prediction fails.
+        """
+        if self.risk_model is None:
+            return None
+        try:
+            return self.risk_model.predict(factors)
+        except Exception as e:
+            logger.error(f"Risk model prediction failed: {e}")
+            return None
+
+    def build_result(
+        self,
+        factors: Optional[Dict[str, float]],
+        score: Optional[float] = None,
+        forecast: Optional[float] = None,
+    ) -> Dict:
+        """Current score, level and explanations for computed factor values"""
+        if factors is None:
+            return {"score": 25, "risk": "low", "factors": ["Insufficient data"]}
+
+        if score is None:
+            frame = pd.DataFrame([factors])
+            score = float(self.weighted_scores(frame)[0])
+            forecasts = self.forecast_scores(frame)
+            forecast = None if forecasts is None else float(forecasts[0])
 
         return {
             "score": score,
             "risk": self._get_risk_level(score),
+            "forecast": (
+                None
+                if forecast is None
+                else {
+                    "score": float(forecast),
+                    "horizon_days": self.risk_model.horizon_days,
+                    "model_version": self.risk_model.version,
+                }
+            ),
             "factors": [
                 {
                     "name": name,
@@ -92,98 +231,128 @@ class RiskScoringEngine:
             "last_updated": datetime.utcnow().isoformat(),
         }
 
-    def _calculate_sentiment_trend(
-        self, articles: List[Article], reviews: List[Review]
-    ) -> float:
-        """Calculate sentiment trend direction and magnitude"""
-        if not articles and not reviews:
-            return 0.0
-
-        # Combine sentiment data
-        sentiments = []
-        for article in articles:
-            score_map = {"positive": 1.0, "neutral": 0.5, "negative": 0.0}
-            sentiments.append(
-                (article.created_at, score_map.get(article.sentiment, 0.5))
+    def _load_factor_inputs(
+        self, company_id: int, start_date: datetime
+    ) -> RiskFactorInputs:
+        """Compute the factor inputs with grouped queries instead of loading rows"""
+        inputs = RiskFactorInputs()
+
+        article_day = func.date(Article.created_at)
+        article_days = (
+            self.db.query(
+                article_day,
+                func.count(Article.id),
+                func.max(ARTICLE_NEGATIVE_GAP),
+                func.sum(ARTICLE_IMPACT),
             )
+            .filter(Article.company_id == company_id, Article.created_at >= start_date)
+            .group_by(article_day)
+            .all()
+        )
 
-        for review in reviews:
-            sentiments.append((review.created_at, review.rating / 5.0))
-
-        if len(sentiments) < 5:
-            return 0.0
+        review_day = func.date(Review.created_at)
+        review_days = (
+            self.db.query(review_day, func.count(Review.id), func.sum(Review.rating))
+            .filter(Review.company_id == company_id, Review.created_at >= start_date)
+            .group_by(review_day)
+            .all()
+        )
 
-        # Sort by date
-        sentiments.sort(key=lambda x: x[0])
-        dates, scores = zip(*sentiments)
+        negative_gaps = []
+        for day, count, day_negative_max, day_impact in article_days:
+            inputs.daily[as_date(day)] = (count, 0, 0.0)
+            if day_negative_max is not None:
+                negative_gaps.append(day_negative_max)
+            inputs.impact_sum += day_impact or 0.0
+        for day, count, rating_sum in review_days:
+            articles, _, _ = inputs.daily.get(as_date(day), (0, 0, 0.0))
+            inputs.daily[as_date(day)] = (articles, count, float(rating_sum))
+        inputs.negative_max = max(negative_gaps) if negative_gaps else None
+
+        if inputs.daily:
+            inputs.head, inputs.tail = self._load_edge_scores(company_id, start_date)
+        return inputs
+
+    def _load_edge_scores(
+        self, company_id: int, start_date: datetime
+    ) -> Tuple[List[float], List[float]]:
+        """First and last TREND_WINDOW sentiment scores across articles and reviews"""
+        parts = []
+        for rank, (model, score) in enumerate(SCORE_SOURCES):
+            for ascending in (True, False):
+                order = [model.created_at, model.id]
+                edge = (
+                    select(
+                        model.created_at.label("created_at"),
+                        literal(rank).label("rank"),
+                        model.id.label("id"),
+                        score.label("score"),
+                    )
+                    .where(
+                        model.company_id == company_id, model.created_at >= start_date
+                    )
+                    .order_by(*(c.asc() if ascending else c.desc() for c in order))
+                    .limit(TREND_WINDOW)
+                    .subquery()
+                )
+                parts.append(select(edge))
 
-        # Calculate rolling average and trend
-        df = pd.DataFrame({"date": dates, "score": scores})
-        df["rolling_avg"] = df["score"].rolling(window=3).mean()
+        rows = {
+            (row.created_at, row.rank, row.id): row.score
+            for row in self.db.execute(union_all(*parts))
+        }
+        scores = [rows[key] for key in sorted(rows)]
+        return scores[:TREND_WINDOW], scores[-TREND_WINDOW:]
 
-        # Trend calculation
-        if len(df) >= 2:
-            recent_trend = df["rolling_avg"].iloc[-1] - df["rolling_avg"].iloc[0]
-            return (0.5 - recent_trend) * 2  # Scale to 0-1
+    def _calculate_sentiment_trend(self, inputs: RiskFactorInputs) -> float:
+        """Calculate sentiment trend direction and magnitude"""
+        if inputs.article_count + inputs.review_count < 5:
+            return 0.0
 
-        return 0.0
+        # Change between the first and last full rolling windows
+        recent_trend = np.mean(inputs.tail) - np.mean(inputs.head)
+        return (0.5 - recent_trend) * 2  # Scale to 0-1
 
-    def _calculate_volume_volatility(
-        self, articles: List[Article], reviews: List[Review]
-    ) -> float:
+    def _calculate_volume_volatility(self, inputs: RiskFactorInputs) -> float:
         """Calculate volatility in mention volume"""
-        all_items = articles + reviews
-
-        if len(all_items) < 7:
+        if inputs.article_count + inputs.review_count < 7:
             return 0.0
 
-        # Group by day
-        daily_counts = {}
-        for item in all_items:
-            date = item.created_at.date()
-            daily_counts[date] = daily_counts.get(date, 0) + 1
-
-        if len(daily_counts) < 3:
+        if len(inputs.daily) < 3:
             return 0.0
 
-        counts = list(daily_counts.values())
+        counts = [articles + reviews for articles, reviews, _ in inputs.daily.values()]
         volatility = np.std(counts) / np.mean(counts)
 
         return min(1.0, volatility / 3.0)  # Normalize
 
-    def _calculate_negative_spikes(self, articles: List[Article]) -> float:
+    def _calculate_negative_spikes(self, inputs: RiskFactorInputs) -> float:
         """Detect negative sentiment spikes"""
-        negative_scores = [
-            1 - article.confidence_score  # For negative articles
-            for article in articles
-            if article.sentiment == "negative"
-        ]
-
-        if not negative_scores:
+        if inputs.negative_max is None:
             return 0.0
 
-        max_negative = max(negative_scores) if negative_scores else 0
-        avg_negative = np.mean(negative_scores)
-
         # Higher more negative = higher risk
-        return min(1.0, max_negative * 1.5)
+        return min(1.0, inputs.negative_max * 1.5)
 
-    def _calculate_review_decline(self, reviews: List[Review]) -> float:
+    def _calculate_review_decline(self, inputs: RiskFactorInputs) -> float:
         """Detect declining review ratings"""
-        if len(reviews) < 5:
+        if inputs.review_count < 5:
             return 0.0
 
-        # Group by week
+        # Group by ISO week number
         weekly_ratings = {}
-        for review in reviews:
-            week = review.created_at.isocalendar()[1]
-            if week not in weekly_ratings:
-                weekly_ratings[week] = []
-            weekly_ratings[week].append(review.rating)
+        for day, (_, reviews, rating_sum) in inputs.daily.items():
+            if not reviews:
+                continue
+            week = day.isocalendar()[1]
+            total, count = weekly_ratings.get(week, (0.0, 0))
+            weekly_ratings[week] = (total + rating_sum, count + reviews)
 
         # Calculate decline
         weeks = sorted(weekly_ratings.keys())
-        weekly_averages = [np.mean(weekly_ratings[week]) for week in weeks]
+        weekly_averages = [
+            weekly_ratings[week][0] / weekly_ratings[week][1] for week in weeks
+        ]
 
         if len(weekly_averages) >= 2:
             first_avg = weekly_averages[0]
@@ -193,24 +362,13 @@ class RiskScoringEngine:
 
         return 0.0
 
-    def _calculate_news_impact(self, articles: List[Article]) -> float:
+    def _calculate_news_impact(self, inputs: RiskFactorInputs) -> float:
         """Calculate impact of articles on reputation"""
-        if not articles:
+        if not inputs.article_count:
             return 0.0
 
-        # Weight articles by confidence/relevance
-        weighted_sentiment = sum(
-            (
-                article.confidence_score
-                * article.relevance_score
-                * (
-                    1
-                    if article.sentiment == "negative"
-                    else -0.5 if article.sentiment == "positive" else 0
-                )
-            )
-            for article in articles
-        ) / len(articles)
+        # Articles weighted by confidence/relevance
+        weighted_sentiment = inputs.impact_sum / inputs.article_count
 
         return max(0, weighted_sentiment)
 
@@ -0,0 +1,426 @@
+# brandguard/backend/app/services/analyzers/risk_state.py
+"""
+Incrementally maintained risk factor inputs per company.
+
+Usage (consistency check, optionally repairing drifted states):
+    cd backend && python -m app.services.analyzers.risk_state --repair
+"""
+import argparse
+import json
+import logging
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.company import Company
+from app.models.sentiment import Article, Review
+from app.services.analyzers.risk_scorer import (
+    RISK_WINDOW_DAYS,
+    TREND_WINDOW,
+    RiskFactorInputs,
+    RiskScoringEngine,
+    window_start,
+)
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_SCORES = {"positive": 1.0, "negative": 0.0}
+IMPACT_WEIGHTS = {"negative": 1.0, "positive": -0.5}
+
+# Sort rank of each source; articles sort before reviews at the same instant
+ARTICLE_RANK = 0
+REVIEW_RANK = 1
+
+
+def _edge_key(entry: List) -> tuple:
+    created_at, rank, item_id, _ = entry
+    return (created_at, rank, item_id)
+
+
+def _keep_edges(edges: List[List], entry: List, last: bool) -> None:
+    """Insert entry into a sorted list of at most TREND_WINDOW edge points"""
+    edges.append(entry)
+    edges.sort(key=_edge_key)
+    if len(edges) > TREND_WINDOW:
+        del edges[0 if last else -1]
+
+
+class RiskFactorState:
+    """
+    Running risk factor inputs for one company
+    - One bucket per day: article/review counts, rating sum, impact sum,
+      max(1 - confidence) of negative articles, and the day's first and
+      last TREND_WINDOW sentiment points
+    - add_article/add_review are O(1); buckets older than the window are
+      dropped as it slides
+    - The window is day-aligned like the engine's: it starts at midnight
+      window_days ago
+    - watermarks hold the highest article/review id a rebuild read; rows at
+      or below them are already counted
+    """
+
+    def __init__(
+        self,
+        window_days: int = RISK_WINDOW_DAYS,
+        days: Optional[Dict] = None,
+        watermarks: Optional[Dict[str, int]] = None,
+    ):
+        self.window_days = window_days
+        self.days: Dict[str, Dict] = days or {}
+        self.watermarks: Dict[str, int] = watermarks or {"articles": 0, "reviews": 0}
+
+    def window_start(self, now: datetime) -> datetime:
+        return window_start(now, self.window_days)
+
+    def _bucket(self, created_at: datetime) -> Dict:
+        day = created_at.date().isoformat()
+        bucket = self.days.get(day)
+        if bucket is None:
+            bucket = self.days[day] = {
+                "articles": 0,
+                "reviews": 0,
+                "rating_sum": 0.0,
+                "impact_sum": 0.0,
+                "negative_max": None,
+                "first": [],
+                "last": [],
+            }
+        return bucket
+
+    def _add_point(self, bucket: Dict, entry: List) -> None:
+        _keep_edges(bucket["first"], entry, last=False)
+        _keep_edges(bucket["last"], entry, last=True)
+
+    def add_article(
+        self,
+        created_at: datetime,
+        article_id: int,
+        sentiment: Optional[str],
+        confidence: Optional[float],
+        relevance: Optional[float],
+    ) -> None:
+        bucket = self._bucket(created_at)
+        bucket["articles"] += 1
+        if confidence is not None and relevance is not None:
+            bucket["impact_sum"] += (
+                confidence * relevance * IMPACT_WEIGHTS.get(sentiment, 0.0)
+            )
+        if sentiment == "negative" and confidence is not None:
+            gap = 1 - confidence
+            if bucket["negative_max"] is None or gap > bucket["negative_max"]:
+                bucket["negative_max"] = gap
+        score = ARTICLE_SCORES.get(sentiment, 0.5)
+        entry = [created_at.isoformat(), ARTICLE_RANK, article_id, score]
+        self._add_point(bucket, entry)
+
+    def add_review(self, created_at: datetime, review_id: int, rating: int) -> None:
+        bucket = self._bucket(created_at)
+        bucket["reviews"] += 1
+        bucket["rating_sum"] += rating
+        entry = [created_at.isoformat(), REVIEW_RANK, review_id, rating / 5.0]
+        self._add_point(bucket, entry)
+
+    def expire(self, now: datetime) -> None:
+        """Drop buckets that slid out of the window"""
+        oldest = self.window_start(now).date().isoformat()
+        for day in [day for day in self.days if day < oldest]:
+            del self.days[day]
+
+    def to_inputs(self, now: datetime) -> RiskFactorInputs:
+        """Factor inputs for the window ending at now"""
+        self.expire(now)
+        inputs = RiskFactorInputs()
+        negative_gaps = []
+        for day in sorted(self.days):
+            bucket = self.days[day]
+            inputs.daily[date.fromisoformat(day)] = (
+                bucket["articles"],
+                bucket["reviews"],
+                bucket["rating_sum"],
+            )
+            inputs.impact_sum += bucket["impact_sum"]
+            if bucket["negative_max"] is not None:
+                negative_gaps.append(bucket["negative_max"])
+        inputs.negative_max = max(negative_gaps) if negative_gaps else None
+
+        days = sorted(self.days)
+        head, tail = [], []
+        for day in days:
+            head.extend(self.days[day]["first"])
+            if len(head) >= TREND_WINDOW:
+                break
+        for day in reversed(days):
+            tail[:0] = self.days[day]["last"]
+            if len(tail) >= TREND_WINDOW:
+                break
+        inputs.head = [entry[3] for entry in head[:TREND_WINDOW]]
+        inputs.tail = [entry[3] for entry in tail[-TREND_WINDOW:]]
+        return inputs
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "window_days": self.window_days,
+                "days": self.days,
+                "watermarks": self.watermarks,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "RiskFactorState":
+        data = json.loads(raw)
+        return cls(
+            window_days=data["window_days"],
+            days=data["days"],
+            watermarks=data.get("watermarks"),
+        )
+
+
+class RiskStateStore:
+    """
+    Redis-persisted RiskFactorState per company
+    - record_articles/record_reviews update existing states after ingest
+      (optimistic WATCH/MULTI, so concurrent collectors don't lose updates)
+    - Missing states are rebuilt from raw rows on first read, so changes to
+      stored rows (sentiment backfill) invalidate() the company's state
+    - Rows a rebuild already read (committed before it, recorded after it)
+      are skipped by id watermark instead of being counted twice
+    - check() compares a state with the full SQL recompute
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        window_days: int = RISK_WINDOW_DAYS,
+        key_prefix: str = "risk_state:v1",
+    ):
+        self.redis = redis_client
+        self.window_days = window_days
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_settings(cls) -> "RiskStateStore":
+        """Build the store on the app's Redis client"""
+        redis_client = None
+        try:
+            from app.db.session import redis_client
+        except Exception as e:
+            logger.warning(f"Redis unavailable for risk state: {e}")
+        return cls(redis_client=redis_client)
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    def _key(self, company_id: int) -> str:
+        return f"{self.key_prefix}:{company_id}"
+
+    def load(self, company_id: int) -> Optional[RiskFactorState]:
+        if not self.enabled:
+            return None
+        try:
+            raw = self.redis.get(self._key(company_id))
+        except Exception as e:
+            logger.warning(f"Risk state read failed: {e}")
+            return None
+        return RiskFactorState.from_json(raw) if raw else None
+
+    def save(self, company_id: int, state: RiskFactorState) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.redis.set(self._key(company_id), state.to_json())
+        except Exception as e:
+            logger.warning(f"Risk state write failed: {e}")
+
+    def invalidate(self, company_ids: Iterable[int]) -> None:
+        """Drop states whose rows changed; they are rebuilt on the next read"""
+        keys = [self._key(company_id) for company_id in set(company_ids)]
+        if not keys or not self.enabled:
+            return
+        try:
+            self.redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Risk state invalidation failed for {keys}: {e}")
+
+    def _update(self, company_id: int, apply) -> None:
+        """Apply a change to an existing state; missing states are left missing"""
+        if not self.enabled:
+            return
+        from redis.exceptions import WatchError
+
+        key = self._key(company_id)
+        try:
+            with self.redis.pipeline() as pipe:
+                while True:
+                    try:
+                        pipe.watch(key)
+                        raw = pipe.get(key)
+                        if not raw:
+                            pipe.reset()
+                            return
+                        state = RiskFactorState.from_json(raw)
+                        apply(state)
+                        state.expire(datetime.utcnow())
+                        pipe.multi()
+                        pipe.set(key, state.to_json())
+                        pipe.execute()
+                        return
+                    except WatchError:
+                        continue
+        except Exception as e:
+            logger.warning(f"Risk state update failed: {e}")
+
+    def record_articles(self, company_id: int, articles: Iterable[Article]) -> None:
+        """Add newly stored articles to the company's state"""
+
+        def apply(state: RiskFactorState) -> None:
+            for article in articles:
+                if article.id <= state.watermarks["articles"]:
+                    continue
+                state.add_article(
+                    article.created_at,
+                    article.id,
+                    article.sentiment,
+                    article.confidence_score,
+                    article.relevance_score,
+                )
+
+        self._update(company_id, apply)
+
+    def record_reviews(self, company_id: int, reviews: Iterable[Review]) -> None:
+        """Add newly stored reviews to the company's state"""
+
+        def apply(state: RiskFactorState) -> None:
+            for review in reviews:
+                if review.id <= state.watermarks["reviews"]:
+                    continue
+                state.add_review(review.created_at, review.id, review.rating)
+
+        self._update(company_id, apply)
+
+    def rebuild(
+        self, db: Session, company_id: int, now: Optional[datetime] = None
+    ) -> RiskFactorState:
+        """Recreate a company's state from raw rows and persist it"""
+        now = now or datetime.utcnow()
+        state = RiskFactorState(window_days=self.window_days)
+        start = state.window_start(now)
+
+        articles = db.execute(
+            select(
+                Article.created_at,
+                Article.id,
+                Article.sentiment,
+                Article.confidence_score,
+                Article.relevance_score,
+            ).where(Article.company_id == company_id, Article.created_at >= start)
+        )
+        for row in articles:
+            state.add_article(*row)
+            state.watermarks["articles"] = max(state.watermarks["articles"], row.id)
+        reviews = db.execute(
+            select(Review.created_at, Review.id, Review.rating).where(
+                Review.company_id == company_id, Review.created_at >= start
+            )
+        )
+        for row in reviews:
+            state.add_review(*row)
+            state.watermarks["reviews"] = max(state.watermarks["reviews"], row.id)
+
+        self.save(company_id, state)
+        return state
+
+    def inputs(
+        self, db: Session, company_id: int, now: Optional[datetime] = None
+    ) -> Optional[RiskFactorInputs]:
+        """Factor inputs from the stored state, rebuilding it when missing"""
+        if not self.enabled:
+            return None
+        now = now or datetime.utcnow()
+        state = self.load(company_id) or self.rebuild(db, company_id, now)
+        return state.to_inputs(now)
+
+    def check(
+        self, db: Session, company_id: int, now: Optional[datetime] = None
+    ) -> List[str]:
+        """Fields where the stored state differs from a full recompute"""
+        now = now or datetime.utcnow()
+        state = self.load(company_id)
+        if state is None:
+            return ["missing"]
+        stored = state.to_inputs(now)
+        expected = RiskScoringEngine(db)._load_factor_inputs(
+            company_id, state.window_start(now)
+        )
+
+        def close(a, b) -> bool:
+            if a is None or b is None:
+                return a is b
+            return abs(a - b) <= 1e-9 * max(1.0, abs(a), abs(b))
+
+        mismatches = []
+        if stored.daily.keys() != expected.daily.keys() or not all(
+            stored.daily[day][:2] == expected.daily[day][:2]
+            and close(stored.daily[day][2], expected.daily[day][2])
+            for day in stored.daily
+        ):
+            mismatches.append("daily")
+        if not close(stored.negative_max, expected.negative_max):
+            mismatches.append("negative_max")
+        if not close(stored.impact_sum, expected.impact_sum):
+            mismatches.append("impact_sum")
+        for name in ("head", "tail"):
+            ours, theirs = getattr(stored, name), getattr(expected, name)
+            if len(ours) != len(theirs) or not all(map(close, ours, theirs)):
+                mismatches.append(name)
+        return mismatches
+
+
+_shared_store: Optional[RiskStateStore] = None
+
+
+def get_risk_state_store() -> RiskStateStore:
+    """Process-wide risk state store on the app's Redis client"""
+    global _shared_store
+    if _shared_store is None:
+        _shared_store = RiskStateStore.from_settings()
+    return _shared_store
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check incremental risk state against a full recompute"
+    )
+    parser.add_argument("--company-id", type=int, action="append")
+    parser.add_argument("--repair", action="store_true", help="rebuild on mismatch")
+    args = parser.parse_args()
+
+    from app.db.session import SessionLocal
+
+    store = RiskStateStore.from_settings()
+    db = SessionLocal()
+    try:
+        company_ids = args.company_id or [
+            row[0]
+            for row in db.execute(select(Company.id).where(Company.is_active.is_(True)))
+        ]
+        drifted = 0
+        for company_id in company_ids:
+            mismatches = store.check(db, company_id)
+            if not mismatches:
+                continue
+            drifted += 1
+            logger.warning(f"Risk state for company {company_id}: {mismatches}")
+            if args.repair:
+                store.rebuild(db, company_id)
+        print(f"{drifted}/{len(company_ids)} states differ from recompute")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
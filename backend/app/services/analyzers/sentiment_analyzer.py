@@ -6,6 +6,15 @@ Sentiment Analyzer Module
 from typing import Dict, List, Optional
 import logging
 
+from app.services.analyzers.lexicon import DEFAULT_LEXICON
+from app.services.analyzers.long_document import (
+    combine_window_scores,
+    split_windows,
+)
+from app.services.analyzers.micro_batcher import MicroBatcher
+from app.services.analyzers.model_registry import get_sentiment_model
+from app.services.analyzers.sentiment_cache import SentimentCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,26 +25,62 @@ class SentimentAnalyzer:
     """
 
     def __init__(
-        self, model_name: str = "distilbert-base-uncased-finetuned-sst-2-english"
+        self,
+        model_name: str = "distilbert-base-uncased-finetuned-sst-2-english",
+        batch_size: int = 32,
+        cache: Optional[SentimentCache] = None,
+        max_wait_ms: float = 5.0,
+        long_document: bool = False,
+        window_tokens: int = 510,
+        window_overlap: int = 64,
+        backend: str = "pytorch",
     ):
-        """تهيئة محلل المشاعر."""
+        """
+        تهيئة محلل المشاعر.
+
+        في وضع المستندات الطويلة (long_document) يُقسَّم النص إلى نوافذ
+        متداخلة بطول window_tokens رمزاً بدلاً من اقتطاعه عند 512 حرفاً.
+
+        backend: "pytorch" أو "onnx" أو "onnx-int8" (ONNX Runtime على المعالج).
+        """
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.cache = cache
+        self.max_wait_ms = max_wait_ms
+        self.long_document = long_document
+        self.window_tokens = window_tokens
+        self.window_overlap = window_overlap
+        self.backend = backend
+        self._batcher: Optional[MicroBatcher] = None
         self.pipeline = None
         self._load_model()
 
     def _load_model(self):
-        """تحميل نموذج تحليل المشاعر."""
-        try:
-            from transformers import pipeline
+        """
+        الحصول على نموذج تحليل المشاعر من السجل المشترك.
 
-            self.pipeline = pipeline("sentiment-analysis", model=self.model_name)
-            logger.info(f"Loaded sentiment analysis model: {self.model_name}")
-        except ImportError as e:
-            logger.warning(f"Transformers not available: {e}. Using simple analyzer.")
-            self.pipeline = None
-        except Exception as e:
-            logger.error(f"Error loading model: {e}")
-            self.pipeline = None
+        يُحمَّل كل نموذج مرة واحدة لكل عملية عند أول استخدام، وتتشارك
+        جميع نسخ المحلل نفس الكائن. يُحدَّث backend بما حُمِّل فعلاً، إذ يعود
+        السجل إلى PyTorch عند تعذّر تحميل ONNX.
+        """
+        self.pipeline, self.backend = get_sentiment_model(self.model_name, self.backend)
+
+    @property
+    def model_version(self) -> str:
+        """معرّف النموذج وإصداره، يُستخدم في مفاتيح التخزين المؤقت."""
+        if not self.pipeline:
+            return "simple"
+
+        config = getattr(getattr(self.pipeline, "model", None), "config", None)
+        revision = getattr(config, "_commit_hash", None) or getattr(
+            config, "transformers_version", None
+        )
+        version = f"{self.model_name}@{revision or 'unknown'}"
+        if self.backend != "pytorch":
+            version += f"+{self.backend}"
+        if self.long_document:
+            version += f"#window={self.window_tokens}/{self.window_overlap}"
+        return version
 
     def analyze(self, text: str) -> Dict[str, any]:
         """
@@ -58,6 +103,49 @@ class SentimentAnalyzer:
         if not text:
             return self._fallback_result("empty")
 
+        if self.cache is None:
+            return self._analyze_text(text)
+
+        # البحث في التخزين المؤقت قبل استدعاء النموذج
+        key = self.cache.make_key(text, self.model_version)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._analyze_text(text)
+        if self._is_cacheable(result):
+            self.cache.set(key, result)
+        return result
+
+    async def analyze_async(self, text: str) -> Dict[str, any]:
+        """
+        تحليل نص من داخل حلقة asyncio دون حجبها.
+
+        تُجمَّع الطلبات المتزامنة التي تصل خلال max_wait_ms في دفعة واحدة
+        تُنفَّذ على خيط عامل مخصص، ثم تُعاد كل نتيجة إلى صاحبها.
+        """
+        return await self._get_batcher().submit(text)
+
+    async def analyze_many_async(self, texts: List[str]) -> List[Dict[str, any]]:
+        """نسخة غير متزامنة من batch_analyze تمر عبر نفس مُجمِّع الدفعات."""
+        return await self._get_batcher().submit_many(texts)
+
+    def _get_batcher(self) -> MicroBatcher:
+        if self._batcher is None:
+            self._batcher = MicroBatcher(
+                self.batch_analyze,
+                max_batch_size=self.batch_size,
+                max_wait_ms=self.max_wait_ms,
+            )
+        return self._batcher
+
+    def _analyze_text(self, text: str) -> Dict[str, any]:
+        """تحليل نص غير فارغ دون المرور بالتخزين المؤقت."""
+        if self.pipeline and self.long_document:
+            results = [None]
+            self._analyze_long_pending([(0, text)], results, self.batch_size)
+            return results[0]
+
         # محاولة استخدام transformers
         if self.pipeline:
             try:
@@ -66,119 +154,53 @@ class SentimentAnalyzer:
                 result = self.pipeline(truncated_text)
 
                 if result and len(result) > 0:
-                    sentiment = result[0]["label"].upper()
-                    confidence = float(result[0]["score"])
-
-                    return {
-                        "sentiment": sentiment,
-                        "confidence": confidence,
-                        "method": "transformers",
-                    }
+                    return self._format_pipeline_output(result[0])
             except Exception as e:
                 logger.warning(f"Transformers analysis failed: {e}")
 
         # استخدام تحليل بسيط
         return self._simple_analyze(text)
 
-    def _simple_analyze(self, text: str) -> Dict[str, any]:
-        """تحليل مشاعر بسيط باستخدام قوائم الكلمات."""
-        text_lower = text.lower()
-
-        # قوائم الكلمات (يمكن توسيعها)
-        positive_words = {
-            "good",
-            "great",
-            "excellent",
-            "awesome",
-            "fantastic",
-            "amazing",
-            "wonderful",
-            "perfect",
-            "best",
-            "love",
-            "like",
-            "happy",
-            "positive",
-            "success",
-            "successful",
-            "win",
-            "winner",
-            "profit",
-            "growth",
-            "improve",
-            "improvement",
-            "better",
-            "strong",
-            "stable",
-        }
-
-        negative_words = {
-            "bad",
-            "terrible",
-            "awful",
-            "horrible",
-            "worst",
-            "hate",
-            "dislike",
-            "sad",
-            "negative",
-            "failure",
-            "fail",
-            "problem",
-            "issue",
-            "error",
-            "crash",
-            "loss",
-            "decline",
-            "drop",
-            "weak",
-            "poor",
-            "terrible",
-            "disappoint",
-            "disappointment",
-        }
+    def _is_cacheable(self, result: Dict[str, any]) -> bool:
+        """تُخزَّن فقط النتائج الصادرة عن الطريقة النشطة حالياً."""
+        expected_method = "transformers" if self.pipeline else "simple"
+        return result.get("method") == expected_method
 
-        neutral_words = {
-            "company",
-            "release",
-            "announce",
-            "report",
-            "today",
-            "yesterday",
-            "week",
-            "month",
-            "year",
-            "quarter",
-            "results",
+    def _format_pipeline_output(self, output: Dict) -> Dict[str, any]:
+        """تحويل مخرجات pipeline إلى شكل النتيجة الموحد."""
+        return {
+            "sentiment": output["label"].upper(),
+            "confidence": float(output["score"]),
+            "method": "transformers",
         }
 
-        # حساب التكرارات
-        words = text_lower.split()
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
-        neutral_count = sum(1 for word in words if word in neutral_words)
-
-        # تحديد المشاعر
-        total = positive_count + negative_count + neutral_count
-
-        if total == 0:
+    def _simple_analyze(self, text: str) -> Dict[str, any]:
+        """تحليل مشاعر بسيط باستخدام قوائم الكلمات المُجمَّعة مسبقاً."""
+        verdict = DEFAULT_LEXICON.classify(DEFAULT_LEXICON.count(text))
+        if verdict is None:
             return self._fallback_result("no_keywords")
 
-        positive_score = positive_count / total
-        negative_score = negative_count / total
-
-        if positive_score > negative_score and positive_score > 0.3:
-            sentiment = "POSITIVE"
-            confidence = min(positive_score, 0.9)
-        elif negative_score > positive_score and negative_score > 0.3:
-            sentiment = "NEGATIVE"
-            confidence = min(negative_score, 0.9)
-        else:
-            sentiment = "NEUTRAL"
-            confidence = 0.5
-
+        sentiment, confidence = verdict
         return {"sentiment": sentiment, "confidence": confidence, "method": "simple"}
 
+    def _simple_analyze_batch(self, texts: List[str]) -> List[Dict[str, any]]:
+        """التحليل البسيط لمجموعة نصوص دفعة واحدة عبر مصفوفات NumPy."""
+        labels, confidences, has_keywords = DEFAULT_LEXICON.classify_batch(
+            DEFAULT_LEXICON.count_batch(texts)
+        )
+        return [
+            (
+                {
+                    "sentiment": str(label),
+                    "confidence": float(confidence),
+                    "method": "simple",
+                }
+                if found
+                else self._fallback_result("no_keywords")
+            )
+            for label, confidence, found in zip(labels, confidences, has_keywords)
+        ]
+
     def _fallback_result(self, reason: str = "unknown") -> Dict[str, any]:
         """نتيجة افتراضية عند الفشل."""
         return {
@@ -187,10 +209,266 @@ class SentimentAnalyzer:
             "method": f"fallback ({reason})",
         }
 
-    def batch_analyze(self, texts: List[str]) -> List[Dict[str, any]]:
-        """تحليل مجموعة من النصوص."""
-        return [self.analyze(text) for text in texts]
+    def batch_analyze(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> List[Dict[str, any]]:
+        """
+        تحليل مجموعة من النصوص على دفعات.
+
+        تُرتَّب النصوص حسب طولها قبل تقسيمها إلى دفعات حتى يبقى الحشو
+        (padding) داخل كل دفعة صغيراً، ثم تُعاد النتائج بترتيب الإدخال
+        وبنفس شكل نتيجة analyze.
+
+        Args:
+            texts: قائمة النصوص
+            batch_size: حجم الدفعة (الافتراضي self.batch_size)
+        """
+        batch_size = batch_size or self.batch_size
+        results: List[Optional[Dict[str, any]]] = [None] * len(texts)
+
+        pending = []
+        for index, text in enumerate(texts):
+            if not text or not isinstance(text, str) or not text.strip():
+                results[index] = self._fallback_result("empty")
+            else:
+                pending.append((index, text.strip()))
+
+        if self.cache is not None:
+            self._analyze_pending_cached(pending, results, batch_size)
+        else:
+            self._analyze_pending(pending, results, batch_size)
+        return results
+
+    def _analyze_pending_cached(
+        self,
+        pending: List[tuple],
+        results: List[Optional[Dict[str, any]]],
+        batch_size: int,
+    ):
+        """
+        ملء النتائج المخزنة مؤقتاً وتحليل النصوص الفريدة المتبقية مرة واحدة.
+
+        النسخ المتكررة من نفس المحتوى داخل الدفعة تُحلَّل مرة واحدة فقط.
+        """
+        model_version = self.model_version
+        keys = [self.cache.make_key(text, model_version) for _, text in pending]
+        cached = self.cache.get_many(dict.fromkeys(keys))
+
+        # أول ظهور لكل مفتاح مفقود يُرسل إلى النموذج
+        unique_misses = {}
+        for (index, text), key in zip(pending, keys):
+            if key not in cached and key not in unique_misses:
+                unique_misses[key] = (len(unique_misses), text)
+
+        fresh: List[Optional[Dict[str, any]]] = [None] * len(unique_misses)
+        self._analyze_pending(list(unique_misses.values()), fresh, batch_size)
+
+        to_store = []
+        for key, (position, _) in unique_misses.items():
+            cached[key] = fresh[position]
+            if self._is_cacheable(fresh[position]):
+                to_store.append((key, fresh[position]))
+        self.cache.set_many(to_store)
+
+        for (index, _), key in zip(pending, keys):
+            results[index] = dict(cached[key])
+
+    def _analyze_pending(
+        self,
+        pending: List[tuple],
+        results: List[Optional[Dict[str, any]]],
+        batch_size: int,
+    ):
+        """تحليل أزواج (الموضع، النص) وكتابة النتائج في مواضعها."""
+        if not pending:
+            return
+
+        if not self.pipeline:
+            simple_results = self._simple_analyze_batch([text for _, text in pending])
+            for (index, _), result in zip(pending, simple_results):
+                results[index] = result
+            return
+
+        if self.long_document:
+            self._analyze_long_pending(pending, results, batch_size)
+            return
+
+        # تجميع النصوص المتقاربة في الطول معاً
+        pending.sort(key=lambda item: len(item[1]))
+
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start : start + batch_size]
+            chunk_results = self._analyze_chunk([text for _, text in chunk])
+            for (index, _), result in zip(chunk, chunk_results):
+                results[index] = result
+
+    def _analyze_long_pending(
+        self,
+        pending: List[tuple],
+        results: List[Optional[Dict[str, any]]],
+        batch_size: int,
+    ):
+        """
+        تحليل المستندات الطويلة عبر نوافذ متداخلة.
+
+        تمر نوافذ جميع المستندات عبر النموذج كدفعة واحدة مرتبة حسب الطول،
+        ثم تُدمج درجات نوافذ كل مستند بترجيح طول النافذة. تنمو الكلفة خطياً
+        مع طول المستند دون استدعاءات إضافية للنموذج لكل مستند.
+        """
+        tokenizer = getattr(self.pipeline, "tokenizer", None)
+        try:
+            doc_windows = split_windows(
+                [text for _, text in pending],
+                tokenizer=tokenizer,
+                window_tokens=self.window_tokens,
+                overlap_tokens=self.window_overlap,
+            )
+        except Exception as e:
+            logger.warning(f"Window splitting failed: {e}")
+            for index, text in pending:
+                results[index] = self._simple_analyze(text)
+            return
+
+        # (موضع المستند، نص النافذة، الوزن) لكل نافذة
+        windows = [
+            (doc, window_text, weight)
+            for doc, doc_windows_list in enumerate(doc_windows)
+            for window_text, weight in doc_windows_list
+        ]
+        order = sorted(range(len(windows)), key=lambda w: len(windows[w][1]))
+        outputs: List[Optional[Dict]] = [None] * len(windows)
+
+        for start in range(0, len(order), batch_size):
+            chunk = order[start : start + batch_size]
+            chunk_outputs = self._run_windows([windows[w][1] for w in chunk])
+            for w, output in zip(chunk, chunk_outputs):
+                outputs[w] = output
+
+        per_doc: List[List[tuple]] = [[] for _ in pending]
+        for (doc, _, weight), output in zip(windows, outputs):
+            per_doc[doc].append((output, weight))
+
+        for (index, text), doc_outputs in zip(pending, per_doc):
+            if any(output is None for output, _ in doc_outputs):
+                results[index] = self._simple_analyze(text)
+                continue
+            sentiment, confidence = combine_window_scores(
+                [output for output, _ in doc_outputs],
+                [weight for _, weight in doc_outputs],
+            )
+            results[index] = {
+                "sentiment": sentiment,
+                "confidence": confidence,
+                "method": "transformers",
+            }
+
+    def _run_windows(self, window_texts: List[str]) -> List[Optional[Dict]]:
+        """تمرير دفعة نوافذ عبر النموذج؛ تُعاد None للنوافذ التي فشل تحليلها."""
+        try:
+            outputs = self.pipeline(
+                window_texts, batch_size=len(window_texts), truncation=True
+            )
+            if outputs and len(outputs) == len(window_texts):
+                return list(outputs)
+        except Exception as e:
+            logger.warning(f"Batched window analysis failed: {e}")
+
+        outputs = []
+        for window_text in window_texts:
+            try:
+                outputs.append(self.pipeline(window_text, truncation=True)[0])
+            except Exception as e:
+                logger.warning(f"Window analysis failed: {e}")
+                outputs.append(None)
+        return outputs
+
+    def _analyze_chunk(self, texts: List[str]) -> List[Dict[str, any]]:
+        """تمرير دفعة واحدة عبر النموذج مع الرجوع إلى التحليل الفردي عند الفشل."""
+        truncated_texts = [text[:512] for text in texts]
+
+        try:
+            outputs = self.pipeline(truncated_texts, batch_size=len(truncated_texts))
+        except Exception as e:
+            logger.warning(f"Batched transformers analysis failed: {e}")
+            return [self._analyze_text(text) for text in texts]
+
+        if not outputs or len(outputs) != len(texts):
+            logger.warning("Batched transformers analysis returned incomplete output")
+            return [self._analyze_text(text) for text in texts]
+
+        results = []
+        for text, output in zip(texts, outputs):
+            try:
+                results.append(self._format_pipeline_output(output))
+            except Exception as e:
+                logger.warning(f"Transformers analysis failed: {e}")
+                results.append(self._simple_analyze(text))
+
+        return results
+
+
+_shared_analyzer: Optional[SentimentAnalyzer] = None
+
+
+def get_sentiment_analyzer() -> SentimentAnalyzer:
+    """إرجاع محلل مشترك على مستوى العملية مع التخزين المؤقت المفعّل."""
+    global _shared_analyzer
+    if _shared_analyzer is None:
+        from app.core.config import settings
+
+        _shared_analyzer = SentimentAnalyzer(
+            model_name=settings.SENTIMENT_MODEL_NAME,
+            batch_size=settings.SENTIMENT_MAX_BATCH_SIZE,
+            cache=SentimentCache.from_settings(),
+            max_wait_ms=settings.SENTIMENT_MAX_WAIT_MS,
+            long_document=settings.SENTIMENT_LONG_DOCUMENT,
+            backend=settings.SENTIMENT_BACKEND,
+        )
+    return _shared_analyzer
+
+
+def analyze_sentiment(text: str) -> Dict[str, any]:
+    """
+    تحليل نص باستخدام المحلل المشترك.
+
+    يُعاد التصنيف بأحرف صغيرة كما يُخزَّن في جدول articles، مع معرّف
+    النموذج الذي أنتج النتيجة في الحقل "model"؛ وإذا لم يصدر عن النموذج
+    يكون الحقل هو الطريقة المستخدمة فعلاً ("simple" أو "fallback ...").
+    """
+    analyzer = get_sentiment_analyzer()
+    return _stored_result(analyzer, analyzer.analyze(text))
+
+
+def analyze_sentiments(texts: List[str]) -> List[Dict[str, any]]:
+    """
+    نسخة analyze_sentiment لمجموعة نصوص باستدعاء batch_analyze واحد.
+
+    تمر النصوص كلها بالدفعات المرتبة حسب الطول وبمسار المستندات الطويلة،
+    وتُعاد النتائج بترتيب الإدخال وبنفس شكل analyze_sentiment.
+    """
+    if not texts:
+        return []
+    analyzer = get_sentiment_analyzer()
+    return [
+        _stored_result(analyzer, result) for result in analyzer.batch_analyze(texts)
+    ]
+
+
+def _stored_result(analyzer: SentimentAnalyzer, result: Dict) -> Dict[str, any]:
+    """التصنيف بأحرف صغيرة ومعرّف ما أنتج النتيجة فعلاً في الحقل "model"."""
+    result = dict(result)
+    result["sentiment"] = result["sentiment"].lower()
+    if result.get("method") == "transformers":
+        result["model"] = analyzer.model_version
+    else:
+        result["model"] = result.get("method")
+    return result
 
 
 # تصدير الفئة للاستيراد
-__all__ = ["SentimentAnalyzer"]
+__all__ = [
+    "SentimentAnalyzer",
+    "analyze_sentiment",
+    "analyze_sentiments",
+    "get_sentiment_analyzer",
+]
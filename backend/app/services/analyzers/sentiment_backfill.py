@@ -0,0 +1,252 @@
+# brandguard/backend/app/services/analyzers/sentiment_backfill.py
+import argparse
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.sentiment import Article
+from app.services.analyzers.sentiment_rollups import (
+    Increments,
+    apply_increments,
+    article_increment,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BackfillCheckpoint:
+    """
+    Last processed article id for a backfill run
+    - Stored in Redis when a client is given, in memory otherwise
+    """
+
+    def __init__(self, key: str, redis_client=None):
+        self.key = key
+        self.redis = redis_client
+        self._value = 0
+
+    def load(self) -> int:
+        if self.redis is not None:
+            raw = self.redis.get(self.key)
+            self._value = int(raw) if raw else 0
+        return self._value
+
+    def save(self, last_id: int):
+        self._value = last_id
+        if self.redis is not None:
+            self.redis.set(self.key, last_id)
+
+    def reset(self):
+        self.save(0)
+
+
+class SentimentBackfillJob:
+    """
+    Resumable re-scoring of articles analyzed by another model version
+    - Streams stale rows by keyset over id (no OFFSET scans)
+    - Scores each batch with batch_analyze and writes it back in one bulk UPDATE
+    - Only results from the model are written; rows that fell back to the
+      lexicon stay stale, and the run is refused when the model isn't loaded
+    - Rows without text are stamped with their neutral result, since no
+      model version would score them differently
+    - Moves the rescored articles between sentiments in the daily rollups
+    - Checkpoints the last processed id after every committed batch, and
+      starts over after a complete pass so skipped rows are retried
+    - max_rows_per_second throttles the job so live ingestion keeps priority
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        analyzer,
+        batch_size: int = 256,
+        max_rows_per_second: Optional[float] = None,
+        checkpoint: Optional[BackfillCheckpoint] = None,
+        result_cache=None,
+        risk_state=None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.db = db
+        self.analyzer = analyzer
+        self.model_version = analyzer.model_version
+        self.batch_size = batch_size
+        self.max_rows_per_second = max_rows_per_second
+        self.checkpoint = checkpoint or BackfillCheckpoint(
+            f"backfill:sentiment:{self.model_version}"
+        )
+        # Optional ResultCache and RiskStateStore, invalidated for companies
+        # whose scores changed
+        self.result_cache = result_cache
+        self.risk_state = risk_state
+        self.clock = clock
+        self.sleep = sleep
+
+    def run(self, max_batches: Optional[int] = None) -> Dict:
+        """Process stale rows after the checkpoint; returns run statistics"""
+        if getattr(self.analyzer, "pipeline", None) is None:
+            raise RuntimeError(
+                f"Sentiment model not loaded ({self.model_version}); "
+                "refusing to rescore articles with the lexicon"
+            )
+
+        last_id = self.checkpoint.load()
+        processed = 0
+        skipped = 0
+        batches = 0
+        completed = False
+        started = self.clock()
+
+        while max_batches is None or batches < max_batches:
+            rows = self._fetch_batch(last_id)
+            if not rows:
+                completed = True
+                self.checkpoint.reset()
+                break
+
+            results = self.analyzer.batch_analyze([row.content for row in rows])
+            skipped += self._write_batch(rows, results)
+
+            last_id = rows[-1].id
+            self.checkpoint.save(last_id)
+            processed += len(rows)
+            batches += 1
+            logger.info(f"Rescored {processed} articles (last id {last_id})")
+
+            self._throttle(processed, started)
+
+        return {
+            "model": self.model_version,
+            "processed": processed,
+            "skipped": skipped,
+            "batches": batches,
+            "last_id": last_id,
+            "completed": completed,
+            "elapsed_seconds": self.clock() - started,
+        }
+
+    def _fetch_batch(self, last_id: int) -> List:
+        query = (
+            select(
+                Article.id,
+                Article.content,
+                Article.company_id,
+                Article.created_at,
+                Article.sentiment,
+                Article.confidence_score,
+            )
+            .where(
+                Article.id > last_id,
+                or_(
+                    Article.sentiment_model.is_(None),
+                    Article.sentiment_model != self.model_version,
+                ),
+            )
+            .order_by(Article.id)
+            .limit(self.batch_size)
+        )
+        return self.db.execute(query).all()
+
+    def _write_batch(self, rows: List, results: List[Dict]) -> int:
+        """Write the model's results; returns how many rows were left stale"""
+        scored = [
+            (row, result)
+            for row, result in zip(rows, results)
+            if result.get("method") == "transformers" or not _has_text(row.content)
+        ]
+        increments: Increments = {}
+        for row, result in scored:
+            article_increment(
+                increments,
+                row.company_id,
+                row.created_at,
+                row.sentiment,
+                row.confidence_score,
+                sign=-1,
+            )
+            article_increment(
+                increments,
+                row.company_id,
+                row.created_at,
+                result["sentiment"].lower(),
+                result["confidence"],
+            )
+        if scored:
+            apply_increments(self.db, increments)
+            self.db.execute(
+                update(Article),
+                [
+                    {
+                        "id": row.id,
+                        "sentiment": result["sentiment"].lower(),
+                        "confidence_score": result["confidence"],
+                        "sentiment_model": self.model_version,
+                    }
+                    for row, result in scored
+                ],
+            )
+            self.db.commit()
+        company_ids = {row.company_id for row, _ in scored}
+        if company_ids and self.risk_state is not None:
+            self.risk_state.invalidate(company_ids)
+        if company_ids and self.result_cache is not None:
+            self.result_cache.invalidate(company_ids)
+        return len(rows) - len(scored)
+
+    def _throttle(self, processed: int, started: float):
+        if not self.max_rows_per_second:
+            return
+        target_elapsed = processed / self.max_rows_per_second
+        delay = target_elapsed - (self.clock() - started)
+        if delay > 0:
+            self.sleep(delay)
+
+
+def _has_text(content: Optional[str]) -> bool:
+    return bool(content and content.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rescore articles whose sentiment came from another model"
+    )
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--rate", type=float, default=None, help="max rows/second")
+    parser.add_argument("--max-batches", type=int, default=None)
+    parser.add_argument("--restart", action="store_true", help="ignore checkpoint")
+    args = parser.parse_args()
+
+    from app.db.session import SessionLocal, redis_client
+    from app.services.analyzers.result_cache import get_result_cache
+    from app.services.analyzers.risk_state import get_risk_state_store
+    from app.services.analyzers.sentiment_analyzer import get_sentiment_analyzer
+
+    analyzer = get_sentiment_analyzer()
+    checkpoint = BackfillCheckpoint(
+        f"backfill:sentiment:{analyzer.model_version}", redis_client
+    )
+    if args.restart:
+        checkpoint.reset()
+
+    db = SessionLocal()
+    try:
+        job = SentimentBackfillJob(
+            db,
+            analyzer,
+            batch_size=args.batch_size,
+            max_rows_per_second=args.rate,
+            checkpoint=checkpoint,
+            result_cache=get_result_cache(),
+            risk_state=get_risk_state_store(),
+        )
+        print(job.run(max_batches=args.max_batches))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
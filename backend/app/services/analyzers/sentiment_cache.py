@@ -0,0 +1,181 @@
+# brandguard/backend/app/services/analyzers/sentiment_cache.py
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class SentimentCache:
+    """
+    Content-addressed cache for sentiment results
+    - Bounded in-process LRU tier with TTL expiry
+    - Optional shared Redis tier (SETEX with the same TTL)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: int = 86400,
+        redis_client=None,
+        key_prefix: str = "sentiment:v1",
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    @classmethod
+    def from_settings(cls) -> "SentimentCache":
+        """Build the cache from settings, sharing the app's Redis client"""
+        from app.core.config import settings
+
+        redis_client = None
+        try:
+            from app.db.session import redis_client
+        except Exception as e:
+            logger.warning(f"Redis unavailable for sentiment cache: {e}")
+
+        return cls(
+            max_entries=settings.SENTIMENT_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.SENTIMENT_CACHE_TTL_SECONDS,
+            redis_client=redis_client,
+        )
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize text so trivially different copies share a key"""
+        text = unicodedata.normalize("NFKC", text)
+        return _WHITESPACE.sub(" ", text).strip()
+
+    def make_key(self, text: str, model_id: str) -> str:
+        """Hash normalized text together with the model identifier"""
+        digest = hashlib.sha256()
+        digest.update(model_id.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(self.normalize(text).encode("utf-8"))
+        return f"{self.key_prefix}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Look up a single result, local tier first"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        """Look up many results; Redis is queried once for all local misses"""
+        found = {}
+        missing = []
+        now = time.monotonic()
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    missing.append(key)
+                    continue
+                expires_at, value = entry
+                if expires_at <= now:
+                    del self._entries[key]
+                    self._stats["expirations"] += 1
+                    missing.append(key)
+                    continue
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                found[key] = dict(value)
+
+        if missing and self.redis is not None:
+            remote = self._redis_get_many(missing)
+            for key, value in remote.items():
+                found[key] = dict(value)
+            self._store_local(remote.items())
+            with self._lock:
+                self._stats["redis_hits"] += len(remote)
+            missing = [key for key in missing if key not in remote]
+
+        with self._lock:
+            self._stats["misses"] += len(missing)
+
+        return found
+
+    def set(self, key: str, value: Dict):
+        """Store a single result in both tiers"""
+        self.set_many([(key, value)])
+
+    def set_many(self, items: Iterable[Tuple[str, Dict]]):
+        """Store many results in both tiers"""
+        items = [(key, dict(value)) for key, value in items]
+        if not items:
+            return
+
+        self._store_local(items)
+
+        if self.redis is not None:
+            try:
+                pipe = self.redis.pipeline()
+                for key, value in items:
+                    pipe.setex(key, self.ttl_seconds, json.dumps(value))
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Sentiment cache Redis write failed: {e}")
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["redis_hits"] + stats["misses"]
+        stats["hit_ratio"] = (
+            (stats["hits"] + stats["redis_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    def clear(self):
+        """Drop the local tier (Redis entries expire on their own)"""
+        with self._lock:
+            self._entries.clear()
+
+    def _store_local(self, items: Iterable[Tuple[str, Dict]]):
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            for key, value in items:
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _redis_get_many(self, keys: List[str]) -> Dict[str, Dict]:
+        try:
+            values = self.redis.mget(keys)
+        except Exception as e:
+            logger.warning(f"Sentiment cache Redis read failed: {e}")
+            return {}
+
+        found = {}
+        for key, raw in zip(keys, values):
+            if raw is None:
+                continue
+            try:
+                found[key] = json.loads(raw)
+            except (TypeError, ValueError):
+                continue
+        return found
+
+
+__all__ = ["SentimentCache"]
@@ -0,0 +1,382 @@
+# brandguard/backend/app/services/analyzers/sentiment_rollups.py
+"""
+Daily sentiment rollups per company and source type.
+
+Ingestion adds every stored article or review to its day's row in the same
+transaction, so trend analysis reads one row per day instead of every
+mention.
+
+Usage (reconciliation against raw data, optionally repairing drift):
+    cd backend && python -m app.services.analyzers.sentiment_rollups --repair
+Full rebuild, e.g. after creating the table:
+    cd backend && python -m app.services.analyzers.sentiment_rollups --rebuild
+"""
+import argparse
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import Float, delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.models.company import Company
+from app.models.sentiment import Article, Review, SentimentRollup
+from app.services.analyzers.risk_scorer import ARTICLE_SCORE, REVIEW_SCORE, as_date
+from app.services.analyzers.risk_state import ARTICLE_SCORES
+
+logger = logging.getLogger(__name__)
+
+SOURCE_TYPES = ("article", "review")
+# Articles have no rating; reviews get a fixed confidence
+REVIEW_CONFIDENCE = 0.8
+SUM_COLUMNS = ("count", "score_sum", "score_sq_sum", "confidence_sum")
+
+# (company_id, day, source_type) -> [count, score_sum, score_sq_sum, confidence_sum]
+Increments = Dict[Tuple[int, date, str], List[float]]
+
+
+@dataclass(frozen=True)
+class SentimentRollups:
+    """
+    Daily sentiment sums, in day order
+    - day: datetime64[D] day of each row
+    - count, score_sum, score_sq_sum, confidence_sum: sums over the day
+    """
+
+    day: np.ndarray
+    count: np.ndarray
+    score_sum: np.ndarray
+    score_sq_sum: np.ndarray
+    confidence_sum: np.ndarray
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self.score_sum / self.count
+
+
+@dataclass(frozen=True)
+class CompanyRollups:
+    """
+    Daily rollups of several companies in one set of arrays
+    - company_ids: the requested companies, in request order
+    - group: position in company_ids of each daily row; rows are sorted by
+      group, then day
+    """
+
+    company_ids: List[int]
+    group: np.ndarray
+    daily: SentimentRollups
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Number of days with data per company"""
+        return np.bincount(self.group, minlength=len(self.company_ids))
+
+    @property
+    def starts(self) -> np.ndarray:
+        """Index of each company's first row"""
+        return np.concatenate([[0], np.cumsum(self.sizes)[:-1]]).astype(np.int64)
+
+    def totals(self, column: str = "count") -> np.ndarray:
+        """Per-company sum of a rollup column"""
+        return np.bincount(
+            self.group,
+            weights=getattr(self.daily, column),
+            minlength=len(self.company_ids),
+        )
+
+    def company(self, index: int) -> SentimentRollups:
+        rows = slice(self.starts[index], self.starts[index] + self.sizes[index])
+        return SentimentRollups(
+            self.daily.day[rows],
+            *(getattr(self.daily, column)[rows] for column in SUM_COLUMNS),
+        )
+
+
+def load_company_rollups(
+    db: Session,
+    company_ids: List[int],
+    start_date: datetime,
+    end_date: Optional[datetime] = None,
+    source_type: Optional[str] = None,
+) -> CompanyRollups:
+    """
+    Daily rollups of many companies from start_date's day in one query,
+    summed over source types unless source_type is given
+    """
+    company_ids = list(dict.fromkeys(company_ids))
+    query = select(
+        SentimentRollup.company_id,
+        SentimentRollup.day,
+        *(func.sum(getattr(SentimentRollup, column)) for column in SUM_COLUMNS),
+    ).where(
+        SentimentRollup.company_id.in_(company_ids),
+        SentimentRollup.day >= as_date(start_date),
+    )
+    if end_date is not None:
+        query = query.where(SentimentRollup.day < as_date(end_date))
+    if source_type is not None:
+        query = query.where(SentimentRollup.source_type == source_type)
+    query = query.group_by(SentimentRollup.company_id, SentimentRollup.day).having(
+        func.sum(SentimentRollup.count) > 0
+    )
+    # Core execution: plain tuples, no ORM result processing
+    rows = db.connection().execute(query).fetchall()
+    columns = list(zip(*rows)) or [()] * 6
+
+    ids = np.array(company_ids, dtype=np.int64)
+    by_id = np.argsort(ids)
+    rows_id = np.array(columns[0], dtype=np.int64)
+    group = by_id[np.searchsorted(ids, rows_id, sorter=by_id)]
+    # ISO strings (SQLite) and dates (PostgreSQL) both convert directly
+    day = np.array(columns[1], dtype="datetime64[D]")
+    order = np.lexsort((day, group))
+    return CompanyRollups(
+        company_ids,
+        group[order],
+        SentimentRollups(
+            day[order],
+            np.array(columns[2], dtype=np.int64)[order],
+            *(np.array(columns[i], dtype=float)[order] for i in (3, 4, 5)),
+        ),
+    )
+
+
+def article_increment(
+    increments: Increments,
+    company_id: int,
+    created_at: Optional[datetime],
+    sentiment: Optional[str],
+    confidence: Optional[float],
+    sign: int = 1,
+) -> None:
+    """Add (sign=1) or remove (sign=-1) one article from its day's sums"""
+    score = ARTICLE_SCORES.get(sentiment, 0.5)
+    _add(increments, company_id, created_at, "article", score, confidence, sign)
+
+
+def review_increment(
+    increments: Increments,
+    company_id: int,
+    created_at: Optional[datetime],
+    rating: int,
+    sign: int = 1,
+) -> None:
+    score = rating / 5.0
+    _add(increments, company_id, created_at, "review", score, REVIEW_CONFIDENCE, sign)
+
+
+def _add(increments, company_id, created_at, source_type, score, confidence, sign):
+    day = (created_at or datetime.utcnow()).date()
+    sums = increments.setdefault((company_id, day, source_type), [0, 0.0, 0.0, 0.0])
+    sums[0] += sign
+    sums[1] += sign * score
+    sums[2] += sign * score * score
+    sums[3] += sign * (confidence or 0.0)
+
+
+def record_articles(db: Session, articles: Iterable[Article]) -> None:
+    """Add newly stored articles, in the transaction that stores them"""
+    increments: Increments = {}
+    for article in articles:
+        article_increment(
+            increments,
+            article.company_id,
+            article.created_at,
+            article.sentiment,
+            article.confidence_score,
+        )
+    apply_increments(db, increments)
+
+
+def record_reviews(db: Session, reviews: Iterable[Review]) -> None:
+    """Add newly stored reviews, in the transaction that stores them"""
+    increments: Increments = {}
+    for review in reviews:
+        review_increment(
+            increments, review.company_id, review.created_at, review.rating
+        )
+    apply_increments(db, increments)
+
+
+def apply_increments(db: Session, increments: Increments) -> None:
+    """
+    Add the sums to their rollup rows, creating missing rows
+
+    One INSERT ... ON CONFLICT DO UPDATE, so concurrent ingestion of the same
+    company and day adds up instead of racing.
+    """
+    if not increments:
+        return
+    rows = [
+        {
+            "company_id": company_id,
+            "day": day,
+            "source_type": source_type,
+            **dict(zip(SUM_COLUMNS, sums)),
+        }
+        for (company_id, day, source_type), sums in increments.items()
+    ]
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as upsert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as upsert
+    else:
+        for row in rows:
+            key = (row["company_id"], row["day"], row["source_type"])
+            rollup = db.get(SentimentRollup, key)
+            if rollup is None:
+                db.add(SentimentRollup(**row))
+                continue
+            for column in SUM_COLUMNS:
+                setattr(rollup, column, getattr(rollup, column) + row[column])
+        return
+
+    table = SentimentRollup.__table__
+    statement = upsert(table).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.company_id, table.c.day, table.c.source_type],
+        set_={
+            column: table.c[column] + statement.excluded[column]
+            for column in SUM_COLUMNS
+        },
+    )
+    db.execute(statement)
+
+
+def aggregate_raw(
+    db: Session, start_date: date, company_id: Optional[int] = None
+) -> Increments:
+    """Rollup sums recomputed from articles and reviews created since start_date"""
+    since = datetime.combine(start_date, datetime.min.time())
+    sources = [
+        (Article, "article", ARTICLE_SCORE, func.coalesce(Article.confidence_score, 0)),
+        (Review, "review", REVIEW_SCORE, literal(REVIEW_CONFIDENCE, Float)),
+    ]
+    sums: Increments = {}
+    for model, source_type, score, confidence in sources:
+        day = func.date(model.created_at)
+        query = select(
+            model.company_id,
+            day,
+            func.count(),
+            func.sum(score),
+            func.sum(score * score),
+            func.sum(confidence),
+        ).where(model.created_at >= since)
+        if company_id is not None:
+            query = query.where(model.company_id == company_id)
+        for row in db.execute(query.group_by(model.company_id, day)):
+            sums[(row[0], as_date(row[1]), source_type)] = [
+                row[2],
+                *(float(value or 0.0) for value in row[3:]),
+            ]
+    return sums
+
+
+def _stored(db: Session, start_date: date, company_id: Optional[int]) -> Increments:
+    query = select(
+        SentimentRollup.company_id,
+        SentimentRollup.day,
+        SentimentRollup.source_type,
+        *(getattr(SentimentRollup, column) for column in SUM_COLUMNS),
+    ).where(SentimentRollup.day >= start_date)
+    if company_id is not None:
+        query = query.where(SentimentRollup.company_id == company_id)
+    return {
+        (row[0], as_date(row[1]), row[2]): list(row[3:]) for row in db.execute(query)
+    }
+
+
+def rebuild(db: Session, start_date: date, company_id: Optional[int] = None) -> int:
+    """
+    Replace the rollups from start_date on with sums recomputed from raw data
+
+    Returns the number of rows written; the caller commits.
+    """
+    statement = delete(SentimentRollup).where(SentimentRollup.day >= start_date)
+    if company_id is not None:
+        statement = statement.where(SentimentRollup.company_id == company_id)
+    db.execute(statement)
+
+    sums = aggregate_raw(db, start_date, company_id)
+    if sums:
+        db.execute(
+            insert(SentimentRollup),
+            [
+                {
+                    "company_id": key[0],
+                    "day": key[1],
+                    "source_type": key[2],
+                    **dict(zip(SUM_COLUMNS, values)),
+                }
+                for key, values in sums.items()
+            ],
+        )
+    return len(sums)
+
+
+def check(
+    db: Session, start_date: date, company_id: Optional[int] = None
+) -> List[Tuple[int, date, str]]:
+    """Keys whose stored sums differ from the raw data, in sorted order"""
+    stored = _stored(db, start_date, company_id)
+    raw = aggregate_raw(db, start_date, company_id)
+    return sorted(
+        key
+        for key in stored.keys() | raw.keys()
+        if key not in stored or key not in raw or not np.allclose(stored[key], raw[key])
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Reconcile daily sentiment rollups with raw articles and reviews"
+    )
+    parser.add_argument("--company-id", type=int, action="append")
+    parser.add_argument("--days", type=int, default=365, help="days to cover")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="rebuild without checking"
+    )
+    parser.add_argument("--repair", action="store_true", help="rebuild on mismatch")
+    args = parser.parse_args()
+
+    from app.db.session import SessionLocal
+    from app.services.analyzers.result_cache import get_result_cache
+
+    start_date = (datetime.utcnow() - timedelta(days=args.days)).date()
+    db = SessionLocal()
+    try:
+        company_ids = args.company_id or [
+            row[0]
+            for row in db.execute(select(Company.id).where(Company.is_active.is_(True)))
+        ]
+        drifted = 0
+        for company_id in company_ids:
+            if not args.rebuild:
+                mismatches = check(db, start_date, company_id)
+                if not mismatches:
+                    continue
+                drifted += 1
+                logger.warning(
+                    f"Rollups for company {company_id} differ on "
+                    f"{len(mismatches)} days, first {mismatches[0]}"
+                )
+                if not args.repair:
+                    continue
+            rebuild(db, start_date, company_id)
+            db.commit()
+            get_result_cache().invalidate([company_id])
+        if not args.rebuild:
+            print(f"{drifted}/{len(company_ids)} companies differ from raw data")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
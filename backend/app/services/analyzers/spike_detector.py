@@ -0,0 +1,412 @@
+# brandguard/backend/app/services/analyzers/spike_detector.py
+"""
+Online spike and change-point detection on each company's mention stream.
+
+Every ingested mention updates the company's state in constant time; no
+history is rescanned. Two series are watched:
+- volume: mentions per bucket (an hour by default), EWMA mean/variance and
+  an upper CUSUM over closed buckets; a spike fires as soon as the open
+  bucket's count crosses the threshold
+- negative_share: whether each mention is negative, against a slow EWMA
+  baseline, with an upper CUSUM per mention
+
+Only increases are reported, and mentions published before the open bucket
+(late backlogs) are ignored. Events are appended to a Redis stream in the
+same transaction that checkpoints the state.
+"""
+import json
+import logging
+import math
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.models.sentiment import Article, Review
+
+logger = logging.getLogger(__name__)
+
+# Empty buckets replayed at most when a company was quiet for a long time;
+# after a week of zeros the EWMA has converged anyway
+MAX_GAP_BUCKETS = 24 * 7
+
+
+@dataclass
+class SpikeEvent:
+    """A detected spike or change point"""
+
+    company_id: int
+    kind: str  # spike, change_point
+    metric: str  # volume, negative_share
+    timestamp: str  # ISO time of the mention that triggered it
+    value: float
+    baseline: float
+    score: float  # z-score for spikes, CUSUM statistic for change points
+
+
+class EwmaCusum:
+    """
+    EWMA mean/variance with an upper CUSUM on standardized deviations
+    - z_score() scores an observation against the current baseline
+    - update() folds it into the baseline: O(1), no history kept
+    - Nothing is reported until `warmup` observations were seen
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.1,
+        z_threshold: float = 4.0,
+        allowance: float = 0.5,
+        decision: float = 5.0,
+        warmup: int = 24,
+        min_std: float = 1.0,
+        mean: float = 0.0,
+        var: float = 0.0,
+        cusum: float = 0.0,
+        count: int = 0,
+    ):
+        self.alpha = alpha
+        self.z_threshold = z_threshold
+        self.allowance = allowance
+        self.decision = decision
+        self.warmup = warmup
+        self.min_std = min_std
+        self.mean = mean
+        self.var = var
+        self.cusum = cusum
+        self.count = count
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.warmup
+
+    @property
+    def std(self) -> float:
+        return max(math.sqrt(self.var), self.min_std)
+
+    def z_score(self, value: float) -> float:
+        return (value - self.mean) / self.std
+
+    def update(self, value: float) -> Optional[float]:
+        """Fold in an observation; returns the CUSUM when it signals a change"""
+        signal = None
+        if self.ready:
+            self.cusum = max(0.0, self.cusum + self.z_score(value) - self.allowance)
+            if self.cusum > self.decision:
+                signal, self.cusum = self.cusum, 0.0
+
+        if self.count == 0:
+            self.mean = value
+        else:
+            diff = value - self.mean
+            increment = self.alpha * diff
+            self.mean += increment
+            self.var = (1 - self.alpha) * (self.var + diff * increment)
+        self.count += 1
+        return signal
+
+    def to_dict(self) -> Dict:
+        return {
+            "mean": self.mean,
+            "var": self.var,
+            "cusum": self.cusum,
+            "count": self.count,
+        }
+
+
+class BernoulliCusum:
+    """
+    Log-likelihood CUSUM for a rise in the rate of a yes/no event
+    - The baseline rate is a slow EWMA of the events themselves
+    - Each event is tested against baseline + shift, so a change is
+      reported once the rate has risen by about `shift`
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.01,
+        shift: float = 0.15,
+        decision: float = 7.0,
+        warmup: int = 50,
+        mean: float = 0.0,
+        cusum: float = 0.0,
+        count: int = 0,
+    ):
+        self.alpha = alpha
+        self.shift = shift
+        self.decision = decision
+        self.warmup = warmup
+        self.mean = mean
+        self.cusum = cusum
+        self.count = count
+
+    def update(self, event: bool) -> Optional[float]:
+        """Fold in an observation; returns the CUSUM when it signals a change"""
+        signal = None
+        if self.count >= self.warmup:
+            p0 = min(max(self.mean, 0.01), 0.98)
+            p1 = min(p0 + self.shift, 0.99)
+            llr = math.log(p1 / p0) if event else math.log((1 - p1) / (1 - p0))
+            self.cusum = max(0.0, self.cusum + llr)
+            if self.cusum > self.decision:
+                signal, self.cusum = self.cusum, 0.0
+
+        value = 1.0 if event else 0.0
+        if self.count < self.warmup:
+            # Plain average until warm, so the baseline isn't the first value
+            self.mean += (value - self.mean) / (self.count + 1)
+        else:
+            self.mean += self.alpha * (value - self.mean)
+        self.count += 1
+        return signal
+
+    def to_dict(self) -> Dict:
+        return {"mean": self.mean, "cusum": self.cusum, "count": self.count}
+
+
+class CompanySpikeState:
+    """
+    Detector state of one company
+    - bucket_start: epoch seconds of the open volume bucket
+    - bucket_count: mentions in it; spiked: a spike was already reported
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int = 3600,
+        bucket_start: Optional[int] = None,
+        bucket_count: int = 0,
+        spiked: bool = False,
+        volume: Optional[Dict] = None,
+        negative: Optional[Dict] = None,
+    ):
+        self.bucket_seconds = bucket_seconds
+        self.bucket_start = bucket_start
+        self.bucket_count = bucket_count
+        self.spiked = spiked
+        self.volume = EwmaCusum(**(volume or {}))
+        self.negative = BernoulliCusum(**(negative or {}))
+
+    def observe(
+        self, company_id: int, timestamp: datetime, negative: bool
+    ) -> List[SpikeEvent]:
+        """
+        Add one mention; mentions older than the open bucket are dropped,
+        since their buckets were closed and counting them in the open one
+        would turn a backlog into a spike
+        """
+        events = []
+        epoch = int(timestamp.timestamp())
+        bucket = epoch - epoch % self.bucket_seconds
+        if self.bucket_start is not None and bucket < self.bucket_start:
+            return events
+        if self.bucket_start is None:
+            self.bucket_start = bucket
+        elif bucket > self.bucket_start:
+            events.extend(self._close_buckets(company_id, timestamp, bucket))
+
+        self.bucket_count += 1
+        volume = self.volume
+        if volume.ready and not self.spiked:
+            z = volume.z_score(self.bucket_count)
+            if z > volume.z_threshold:
+                self.spiked = True
+                events.append(self._event(company_id, "spike", "volume", timestamp, z))
+
+        share = self.negative
+        baseline = share.mean
+        signal = share.update(negative)
+        if signal is not None:
+            events.append(
+                SpikeEvent(
+                    company_id,
+                    "change_point",
+                    "negative_share",
+                    timestamp.isoformat(),
+                    share.mean,
+                    baseline,
+                    signal,
+                )
+            )
+        return events
+
+    def _close_buckets(
+        self, company_id: int, timestamp: datetime, bucket: int
+    ) -> List[SpikeEvent]:
+        """Fold the finished bucket and the empty ones after it into the EWMA"""
+        events = []
+        baseline = self.volume.mean
+        signal = self.volume.update(self.bucket_count)
+        if signal is not None:
+            events.append(
+                SpikeEvent(
+                    company_id,
+                    "change_point",
+                    "volume",
+                    timestamp.isoformat(),
+                    float(self.bucket_count),
+                    baseline,
+                    signal,
+                )
+            )
+        empty = (bucket - self.bucket_start) // self.bucket_seconds - 1
+        for _ in range(min(empty, MAX_GAP_BUCKETS)):
+            self.volume.update(0)
+        self.bucket_start = bucket
+        self.bucket_count = 0
+        self.spiked = False
+        return events
+
+    def _event(self, company_id, kind, metric, timestamp, score) -> SpikeEvent:
+        return SpikeEvent(
+            company_id,
+            kind,
+            metric,
+            timestamp.isoformat(),
+            float(self.bucket_count),
+            self.volume.mean,
+            score,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "bucket_seconds": self.bucket_seconds,
+                "bucket_start": self.bucket_start,
+                "bucket_count": self.bucket_count,
+                "spiked": self.spiked,
+                "volume": self.volume.to_dict(),
+                "negative": self.negative.to_dict(),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CompanySpikeState":
+        return cls(**json.loads(raw))
+
+
+def _mentions(
+    articles: Iterable[Article] = (), reviews: Iterable[Review] = ()
+) -> List[Tuple[datetime, bool]]:
+    """(time, is negative) per mention in time order; publication time first"""
+    mentions = [
+        (article.published_date or article.created_at, article.sentiment == "negative")
+        for article in articles
+    ]
+    mentions.extend(
+        (review.review_date or review.created_at, review.rating <= 2)
+        for review in reviews
+    )
+    return sorted(
+        (timestamp or datetime.utcnow(), negative) for timestamp, negative in mentions
+    )
+
+
+class SpikeDetectorStore:
+    """
+    Redis-checkpointed CompanySpikeState per company
+    - record_articles/record_reviews update the state after ingest
+      (optimistic WATCH/MULTI, so concurrent collectors don't lose updates)
+    - New events are XADDed to events_key in the same transaction
+    - States start empty on a company's first mention; nothing is rebuilt
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        bucket_seconds: int = 3600,
+        key_prefix: str = "spike_state:v1",
+        events_key: str = "spike_events:v1",
+        max_events: int = 10000,
+    ):
+        self.redis = redis_client
+        self.bucket_seconds = bucket_seconds
+        self.key_prefix = key_prefix
+        self.events_key = events_key
+        self.max_events = max_events
+
+    @classmethod
+    def from_settings(cls) -> "SpikeDetectorStore":
+        """Build the store on the app's Redis client"""
+        redis_client = None
+        try:
+            from app.db.session import redis_client
+        except Exception as e:
+            logger.warning(f"Redis unavailable for spike detection: {e}")
+        return cls(redis_client=redis_client)
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    def _key(self, company_id: int) -> str:
+        return f"{self.key_prefix}:{company_id}"
+
+    def load(self, company_id: int) -> Optional[CompanySpikeState]:
+        if not self.enabled:
+            return None
+        try:
+            raw = self.redis.get(self._key(company_id))
+        except Exception as e:
+            logger.warning(f"Spike state read failed: {e}")
+            return None
+        return CompanySpikeState.from_json(raw) if raw else None
+
+    def record_articles(
+        self, company_id: int, articles: Iterable[Article]
+    ) -> List[SpikeEvent]:
+        """Feed newly stored articles; returns the events they triggered"""
+        return self.observe(company_id, _mentions(articles=articles))
+
+    def record_reviews(
+        self, company_id: int, reviews: Iterable[Review]
+    ) -> List[SpikeEvent]:
+        """Feed newly stored reviews; returns the events they triggered"""
+        return self.observe(company_id, _mentions(reviews=reviews))
+
+    def observe(
+        self, company_id: int, mentions: List[Tuple[datetime, bool]]
+    ) -> List[SpikeEvent]:
+        if not self.enabled or not mentions:
+            return []
+        from redis.exceptions import WatchError
+
+        key = self._key(company_id)
+        try:
+            with self.redis.pipeline() as pipe:
+                while True:
+                    try:
+                        pipe.watch(key)
+                        raw = pipe.get(key)
+                        state = (
+                            CompanySpikeState.from_json(raw)
+                            if raw
+                            else CompanySpikeState(self.bucket_seconds)
+                        )
+                        events = []
+                        for timestamp, negative in mentions:
+                            events.extend(
+                                state.observe(company_id, timestamp, negative)
+                            )
+                        pipe.multi()
+                        pipe.set(key, state.to_json())
+                        for event in events:
+                            pipe.xadd(
+                                self.events_key,
+                                {k: str(v) for k, v in asdict(event).items()},
+                                maxlen=self.max_events,
+                                approximate=True,
+                            )
+                        pipe.execute()
+                        break
+                    except WatchError:
+                        continue
+        except Exception as e:
+            logger.warning(f"Spike state update failed: {e}")
+            return []
+
+        for event in events:
+            logger.info(
+                f"{event.metric} {event.kind} for company {company_id} "
+                f"at {event.timestamp}: {event.value:.2f} vs {event.baseline:.2f}"
+            )
+        return events
@@ -1,256 +1,298 @@
 # brandguard/backend/app/services/analyzers/trend_analyzer.py
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from app.models.sentiment import Article, Review
-import pandas as pd
-from sklearn.linear_model import LinearRegression
+from app.services.analyzers.sentiment_rollups import (
+    CompanyRollups,
+    load_company_rollups,
+)
+from app.services.analyzers.result_cache import ResultCache
+from app.services.analyzers.forecasting import (
+    Forecast,
+    forecast,
+    grouped_linear_forecast,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTHS = [
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+]
+
 
 class TrendAnalyzer:
     """
     Analyze trends in company reputation data
+    - Works on daily rollups of any number of companies at once; every
+      helper is a grouped NumPy operation over all companies' rows
     """
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        forecast_model: str = "linear",
+        result_cache: Optional[ResultCache] = None,
+    ):
         self.db = db
+        # "linear" (least squares) or "holt" (exponential smoothing)
+        self.forecast_model = forecast_model
+        # Optional ResultCache; results are reused until a company's data changes
+        self.result_cache = result_cache
 
     def analyze_company_trends(self, company_id: int, days: int = 90) -> Dict:
         """
         Analyze trends for a specific company
         """
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=days)
+        return self.analyze_companies([company_id], days)[company_id]
 
-        # Get articles and reviews
-        articles = (
-            self.db.query(Article)
-            .filter(Article.company_id == company_id, Article.created_at >= start_date)
-            .all()
-        )
-
-        reviews = (
-            self.db.query(Review)
-            .filter(Review.company_id == company_id, Review.created_at >= start_date)
-            .all()
-        )
-
-        # Combine data
-        data_points = []
+    def analyze_companies(self, company_ids: List[int], days: int = 90) -> Dict:
+        """
+        Analyze trends for several companies from one rollup query
 
-        for article in articles:
-            data_points.append(
-                {
-                    "date": article.created_at.date(),
-                    "sentiment_score": self._sentiment_to_score(article.sentiment),
-                    "confidence": article.confidence_score,
-                    "type": "article",
-                }
-            )
+        Returns {company_id: trends} in the order of company_ids.
+        """
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=days)
 
-        for review in reviews:
-            data_points.append(
-                {
-                    "date": review.created_at.date(),
-                    "sentiment_score": review.rating / 5.0,  # Normalize to 0-1
-                    "confidence": 0.8,
-                    "type": "review",
-                }
+        if self.result_cache is not None:
+            # Windows are day-aligned, so the start day identifies the window
+            params = f"{days}:{start_date.date().isoformat()}:{self.forecast_model}"
+            return self.result_cache.get_or_compute_many(
+                "trends",
+                company_ids,
+                params,
+                lambda missing: self._analyze(missing, start_date),
             )
+        return self._analyze(company_ids, start_date)
 
-        if not data_points:
-            return {
-                "trend": "stable",
-                "momentum": 0.0,
-                "predictions": [],
-                "seasonal_patterns": [],
-                "volatility": 0.0,
-            }
+    def _analyze(self, company_ids: List[int], start_date: datetime) -> Dict:
+        # One row per company and day, shared by every helper below
+        rollups = load_company_rollups(self.db, company_ids, start_date)
+        totals = rollups.totals().astype(np.int64)
 
         # Analyze trends
-        trend_analysis = self._calculate_trend(data_points)
-        seasonal_analysis = self._detect_seasonal_patterns(data_points)
-        predictions = self._predict_future(data_points, days=30)
-        volatility = self._calculate_volatility(data_points)
-
-        return {
-            "trend": trend_analysis["trend"],
-            "momentum": trend_analysis["momentum"],
-            "predictions": predictions,
-            "seasonal_patterns": seasonal_analysis,
-            "volatility": volatility,
-            "data_points": len(data_points),
-        }
-
-    def _sentiment_to_score(self, sentiment: str) -> float:
-        """
-        Convert sentiment string to numeric score
-        """
-        mapping = {"positive": 1.0, "negative": 0.0, "neutral": 0.5}
-        return mapping.get(sentiment, 0.5)
+        trend_analysis = self._calculate_trend(rollups, totals)
+        seasonal_analysis = self._detect_seasonal_patterns(rollups, totals)
+        predictions = self._predict_future(rollups, totals)
+        volatility = self._calculate_volatility(rollups, totals)
+
+        results = {}
+        for i, company_id in enumerate(rollups.company_ids):
+            if not totals[i]:
+                results[company_id] = {
+                    "trend": "stable",
+                    "momentum": 0.0,
+                    "predictions": [],
+                    "seasonal_patterns": [],
+                    "volatility": 0.0,
+                }
+                continue
+            results[company_id] = {
+                "trend": trend_analysis[i]["trend"],
+                "momentum": trend_analysis[i]["momentum"],
+                "predictions": predictions[i],
+                "seasonal_patterns": seasonal_analysis[i],
+                "volatility": volatility[i],
+                "data_points": int(totals[i]),
+            }
+        return results
 
-    def _calculate_trend(self, data_points: List[Dict]) -> Dict:
+    def _calculate_trend(
+        self, rollups: CompanyRollups, totals: np.ndarray
+    ) -> List[Dict]:
         """
         Calculate overall trend direction and momentum
         """
-        if len(data_points) < 7:
-            return {"trend": "stable", "momentum": 0.0}
-
-        # Convert to DataFrame
-        df = pd.DataFrame(data_points)
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.groupby("date")["sentiment_score"].mean().reset_index()
-
-        # Calculate moving averages
-        df["ma_7"] = df["sentiment_score"].rolling(window=7).mean()
-        df["ma_14"] = df["sentiment_score"].rolling(window=14).mean()
-        df["ma_30"] = df["sentiment_score"].rolling(window=30).mean()
-
-        # Determine trend
-        recent_ma = (
-            df["ma_7"].iloc[-1]
-            if not pd.isna(df["ma_7"].iloc[-1])
-            else df["sentiment_score"].iloc[-1]
-        )
-        older_ma = df["ma_7"].iloc[-8] if len(df) > 8 else df["sentiment_score"].iloc[0]
-
-        momentum = recent_ma - older_ma
-
-        if momentum > 0.1:
-            trend = "improving"
-        elif momentum < -0.1:
-            trend = "declining"
-        else:
-            trend = "stable"
+        daily = rollups.daily.mean
+        sizes, starts = rollups.sizes, rollups.starts
+        position = np.arange(len(daily)) - starts[rollups.group]
+
+        # 7-day moving average within each company, NaN for its first 6 days
+        cumulative = np.concatenate([[0.0], np.cumsum(daily)])
+        ma_7 = np.full(len(daily), np.nan)
+        full = position >= 6
+        index = np.flatnonzero(full)
+        ma_7[full] = (cumulative[index + 1] - cumulative[index - 6]) / 7
+
+        trends = []
+        for i, size in enumerate(sizes):
+            if totals[i] < 7:
+                trends.append({"trend": "stable", "momentum": 0.0})
+                continue
+            first, last = starts[i], starts[i] + size - 1
+
+            # Determine trend
+            recent_ma = ma_7[last] if not np.isnan(ma_7[last]) else daily[last]
+            older_ma = ma_7[last - 7] if size > 8 else daily[first]
+
+            momentum = float(recent_ma - older_ma)
+
+            if momentum > 0.1:
+                trend = "improving"
+            elif momentum < -0.1:
+                trend = "declining"
+            else:
+                trend = "stable"
 
-        return {
-            "trend": trend,
-            "momentum": momentum,
-            "recent_score": recent_ma,
-            "change_percentage": (momentum / older_ma) * 100 if older_ma > 0 else 0,
-        }
+            trends.append(
+                {
+                    "trend": trend,
+                    "momentum": momentum,
+                    "recent_score": float(recent_ma),
+                    "change_percentage": (
+                        (momentum / older_ma) * 100 if older_ma > 0 else 0
+                    ),
+                }
+            )
+        return trends
 
-    def _detect_seasonal_patterns(self, data_points: List[Dict]) -> List[Dict]:
+    def _detect_seasonal_patterns(
+        self, rollups: CompanyRollups, totals: np.ndarray
+    ) -> List[List[Dict]]:
         """
         Detect seasonal patterns in sentiment
         """
-        if len(data_points) < 90:
-            return []
+        daily = rollups.daily
 
-        df = pd.DataFrame(data_points)
-        df["date"] = pd.to_datetime(df["date"])
-        df["day_of_week"] = df["date"].dt.dayofweek
-        df["month"] = df["date"].dt.month
-
-        # Weekly patterns
-        weekly_pattern = df.groupby("day_of_week")["sentiment_score"].mean()
+        # Weekly patterns; 1970-01-01 was a Thursday, Monday is 0
+        day_of_week = (daily.day.astype(np.int64) + 3) % 7
+        weekly_pattern = self._group_mean(rollups, day_of_week, 7)
 
         # Monthly patterns
-        monthly_pattern = df.groupby("month")["sentiment_score"].mean()
+        month = daily.day.astype("datetime64[M]").astype(np.int64) % 12
+        monthly_pattern = self._group_mean(rollups, month, 12)
 
         patterns = []
-
-        days = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
-        for i, score in weekly_pattern.items():
-            if score > 0.6 or score < 0.4:
-                patterns.append(
-                    {
-                        "type": "weekly",
-                        "period": days[i],
-                        "score": score,
-                        "significance": "high" if abs(score - 0.5) > 0.2 else "medium",
-                    }
-                )
-
-        months = [
-            "Jan",
-            "Feb",
-            "Mar",
-            "Apr",
-            "May",
-            "Jun",
-            "Jul",
-            "Aug",
-            "Sep",
-            "Oct",
-            "Nov",
-            "Dec",
-        ]
-        for i, score in monthly_pattern.items():
-            if score > 0.6 or score < 0.4:
-                patterns.append(
-                    {
-                        "type": "monthly",
-                        "period": months[i - 1],
-                        "score": score,
-                        "significance": "high" if abs(score - 0.5) > 0.2 else "medium",
-                    }
-                )
+        for i in range(len(rollups.company_ids)):
+            company_patterns = []
+            if totals[i] < 90:
+                patterns.append(company_patterns)
+                continue
+
+            for period, score in zip(DAYS, weekly_pattern[i]):
+                if score > 0.6 or score < 0.4:
+                    company_patterns.append(
+                        {
+                            "type": "weekly",
+                            "period": period,
+                            "score": float(score),
+                            "significance": (
+                                "high" if abs(score - 0.5) > 0.2 else "medium"
+                            ),
+                        }
+                    )
+
+            for period, score in zip(MONTHS, monthly_pattern[i]):
+                if score > 0.6 or score < 0.4:
+                    company_patterns.append(
+                        {
+                            "type": "monthly",
+                            "period": period,
+                            "score": float(score),
+                            "significance": (
+                                "high" if abs(score - 0.5) > 0.2 else "medium"
+                            ),
+                        }
+                    )
+            patterns.append(company_patterns)
 
         return patterns
 
-    def _predict_future(self, data_points: List[Dict], days: int = 30) -> List[Dict]:
+    def _group_mean(
+        self, rollups: CompanyRollups, keys: np.ndarray, size: int
+    ) -> np.ndarray:
+        """
+        Mention-weighted mean score per company and key, shape (companies, size)
+
+        NaN where a company has no data for a key; NaN fails both pattern
+        thresholds, so those periods are skipped.
+        """
+        cells = rollups.group * size + keys
+        length = len(rollups.company_ids) * size
+        counts = np.bincount(cells, weights=rollups.daily.count, minlength=length)
+        sums = np.bincount(cells, weights=rollups.daily.score_sum, minlength=length)
+        with np.errstate(invalid="ignore"):
+            return (sums / counts).reshape(-1, size)
+
+    def _predict_future(
+        self, rollups: CompanyRollups, totals: np.ndarray, days: int = 7
+    ) -> List[List[Dict]]:
         """
         Predict future sentiment trends
         """
-        if len(data_points) < 14:
-            return []
+        companies = len(rollups.company_ids)
 
-        df = pd.DataFrame(data_points)
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.groupby("date")["sentiment_score"].mean().reset_index()
-
-        # Prepare data for linear regression
-        X = np.arange(len(df)).reshape(-1, 1)
-        y = df["sentiment_score"].values
-
-        # Fit model
-        model = LinearRegression()
-        model.fit(X, y)
+        # The whole horizon for every company in one closed-form step
+        if self.forecast_model == "linear":
+            result = grouped_linear_forecast(
+                rollups.daily.mean, rollups.group, companies, days
+            )
+        else:
+            forecasts = [
+                forecast(rollups.company(i).mean, days, model=self.forecast_model)
+                if totals[i] >= 14
+                else None
+                for i in range(companies)
+            ]
+            result = Forecast(
+                *(
+                    np.array(
+                        [getattr(f, field) if f else np.zeros(days) for f in forecasts]
+                    )
+                    for field in ("mean", "lower", "upper")
+                ),
+                np.array([f.r_squared if f else 0.0 for f in forecasts]),
+            )
+        result = result.clip(0, 1)
 
-        # Generate predictions
+        last_rows = rollups.starts + rollups.sizes - 1
         predictions = []
-        last_date = df["date"].max()
-
-        for i in range(1, days + 1):
-            future_date = last_date + timedelta(days=i)
-            X_future = np.array([[len(df) + i]])
-            predicted_score = model.predict(X_future)[0]
-
-            # Ensure score is between 0 and 1
-            predicted_score = max(0, min(1, predicted_score))
-
+        for i in range(companies):
+            if totals[i] < 14:
+                predictions.append([])
+                continue
+            future_dates = rollups.daily.day[last_rows[i]] + np.arange(1, days + 1)
             predictions.append(
-                {
-                    "date": future_date.strftime("%Y-%m-%d"),
-                    "predicted_score": float(predicted_score),
-                    "confidence": float(1 - abs(model.score(X, y))),
-                }
+                [
+                    {
+                        "date": str(date),
+                        "predicted_score": float(score),
+                        "lower": float(lower),
+                        "upper": float(upper),
+                        "confidence": float(1 - abs(result.r_squared[i])),
+                    }
+                    for date, score, lower, upper in zip(
+                        future_dates, result.mean[i], result.lower[i], result.upper[i]
+                    )
+                ]
             )
+        return predictions
 
-        return predictions[:7]  # Return only next 7 days
-
-    def _calculate_volatility(self, data_points: List[Dict]) -> float:
+    def _calculate_volatility(
+        self, rollups: CompanyRollups, totals: np.ndarray
+    ) -> List[float]:
         """
         Calculate sentiment volatility
         """
-        if len(data_points) < 7:
-            return 0.0
-
-        scores = [dp["sentiment_score"] for dp in data_points]
-        return float(np.std(scores))
+        counts = np.maximum(totals, 1)
+        mean = rollups.totals("score_sum") / counts
+        variance = rollups.totals("score_sq_sum") / counts - mean**2
+        volatility = np.sqrt(np.maximum(variance, 0.0))
+        return [float(v) if total >= 7 else 0.0 for v, total in zip(volatility, totals)]
 
     def generate_trend_summary(self, trends_data: Dict) -> str:
         """
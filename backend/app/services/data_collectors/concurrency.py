@@ -0,0 +1,62 @@
+# brandguard/backend/app/services/data_collectors/concurrency.py
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Awaitable, Dict, List, Sequence, Tuple, TypeVar
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HostLimiter:
+    """
+    Caps on in-flight requests, overall and per host
+    - slot(url) holds one global and one per-host permit around a request
+    - The host permit is taken first, so a busy host never holds global
+      permits that requests to idle hosts could use
+    - Semaphores bind to the running loop: create one per collector, not
+      at import time
+    """
+
+    def __init__(self, max_concurrency: int = 10, max_per_host: int = 2):
+        self.max_per_host = max_per_host
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    def _host(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.max_per_host)
+        return self._hosts[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        async with self._host(url):
+            async with self._global:
+                yield
+
+
+async def gather_isolated(
+    tasks: Sequence[Tuple[str, Awaitable[List[T]]]],
+) -> List[List[T]]:
+    """
+    Run labelled collection tasks concurrently, in order of the input
+
+    A task that raises is logged under its label and contributes an empty
+    list; the others are unaffected.
+    """
+    results = await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
+    collected = []
+    for (label, _), result in zip(tasks, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            logger.error(f"Failed to collect from {label}: {result}")
+            result = []
+        collected.append(result)
+    return collected
+
+
+__all__ = ["HostLimiter", "gather_isolated"]
@@ -0,0 +1,343 @@
+# brandguard/backend/app/services/data_collectors/feed_cache.py
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import feedparser
+
+from app.services.data_collectors.http_client import HttpClient, get_http_client
+
+logger = logging.getLogger(__name__)
+
+# Entry fields the collectors read; the rest of feedparser's output is dropped
+ENTRY_FIELDS = (
+    "title",
+    "summary",
+    "link",
+    "published",
+    "published_parsed",
+    "author",
+    "source",
+    "content",
+)
+
+
+def slim_entry(entry: feedparser.FeedParserDict) -> Dict:
+    """JSON-safe copy of the fields in ENTRY_FIELDS"""
+    slim = {}
+    for field in ENTRY_FIELDS:
+        try:
+            value = entry[field]
+        except KeyError:
+            continue
+        if field == "published_parsed":
+            value = list(value) if value else None
+        elif field == "source":
+            value = {"title": value.get("title")}
+        elif field == "content":
+            value = [{"value": item.get("value", "")} for item in value]
+        slim[field] = value
+    return slim
+
+
+def restore_entry(slim: Dict) -> feedparser.FeedParserDict:
+    """Inverse of slim_entry, with the attribute access feedparser gives"""
+    entry = feedparser.FeedParserDict(slim)
+    if slim.get("published_parsed"):
+        entry["published_parsed"] = time.struct_time(slim["published_parsed"])
+    if "source" in slim:
+        entry["source"] = feedparser.FeedParserDict(slim["source"])
+    if "content" in slim:
+        entry["content"] = [feedparser.FeedParserDict(c) for c in slim["content"]]
+    return entry
+
+
+def _entry_key(entry: feedparser.FeedParserDict) -> str:
+    return entry.get("link") or entry.get("title", "")
+
+
+@dataclass
+class FeedConsumer:
+    """
+    One consumer's pass over feeds (a company, or a portfolio run)
+    - FeedCache.entries() gives it only entries it hasn't processed yet
+    - The feed bodies it was given wait in `pending` until the caller has
+      stored the results and calls FeedCache.mark_delivered(); a pass that
+      fails before that gets the same entries again next time
+    """
+
+    name: str
+    # (feed key, body hash, keys of every entry in the body)
+    pending: List[Tuple[str, str, List[str]]] = field(default_factory=list)
+
+    def scope(self) -> "FeedConsumer":
+        """An empty view of the same consumer, merged back with join()"""
+        return FeedConsumer(self.name)
+
+    def join(self, scope: "FeedConsumer"):
+        self.pending.extend(scope.pending)
+
+
+class FeedCache:
+    """
+    Conditional GETs and memoized parsing for RSS feeds
+    - Per feed URL the ETag/Last-Modified validators and the hash of the
+      last body are kept and sent as If-None-Match/If-Modified-Since; a 304
+      is answered from the stored entries without parsing anything
+    - Parsed entries are memoized by body hash, so a 200 with an unchanged
+      body (feeds that ignore validators) isn't parsed again either
+    - Two tiers: an in-process LRU bounded by max_bytes of serialized
+      entries, and optionally Redis, shared by all workers, with a TTL
+    - A FeedConsumer is only given entries it hasn't processed, so an
+      unchanged feed costs it nothing past the fetch
+    - Redis calls run in a worker thread, off the event loop
+    - Returned entries are shared between callers and must not be mutated
+    """
+
+    def __init__(
+        self,
+        client: Optional[HttpClient] = None,
+        redis_client=None,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl_seconds: int = 86400,
+        key_prefix: str = "feed_cache:v1",
+    ):
+        self.client = client
+        self.redis = redis_client
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "not_modified": 0,
+            "memo_hits": 0,
+            "parses": 0,
+            "errors": 0,
+            "unchanged": 0,
+            "local_hits": 0,
+            "redis_hits": 0,
+            "evictions": 0,
+        }
+
+    @classmethod
+    def from_settings(cls) -> "FeedCache":
+        """Build the cache from settings, sharing the app's Redis client"""
+        from app.core.config import settings
+
+        redis_client = None
+        try:
+            from app.db.session import redis_client
+        except Exception as e:
+            logger.warning(f"Redis unavailable for feed cache: {e}")
+
+        return cls(
+            get_http_client(),
+            redis_client,
+            max_bytes=settings.FEED_CACHE_MAX_BYTES,
+            ttl_seconds=settings.FEED_CACHE_TTL_SECONDS,
+        )
+
+    async def entries(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        consumer: Optional[FeedConsumer] = None,
+    ) -> Optional[List[feedparser.FeedParserDict]]:
+        """
+        Current entries of a feed, None if it can't be fetched
+
+        With a consumer, only entries it hasn't processed are returned, and
+        nothing at all when the feed is unchanged since it last did.
+        """
+        feed_key = self._feed_key(url, params)
+        validators = await self._get(f"validators:{feed_key}")
+        cached = None
+        if validators:
+            cached = await self._get(f"entries:{validators['hash']}")
+
+        headers = {}
+        if cached is not None:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        client = self.client or get_http_client()
+        response = await client.get(url, params=params, headers=headers or None)
+        if response.status == 304 and cached is not None:
+            self._count("not_modified")
+            return await self._new_entries(
+                consumer, feed_key, validators["hash"], cached
+            )
+        if response.status != 200 or response.body is None:
+            logger.warning(f"Feed {url} returned {response.status}")
+            self._count("errors")
+            return None
+
+        body_hash = hashlib.blake2b(
+            response.body.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        if validators and validators["hash"] == body_hash and cached is not None:
+            entries = cached
+        else:
+            entries = await self._get(f"entries:{body_hash}")
+        if entries is None:
+            self._count("parses")
+            slim = [
+                slim_entry(entry) for entry in feedparser.parse(response.body).entries
+            ]
+            entries = [restore_entry(entry) for entry in slim]
+            await self._set(f"entries:{body_hash}", entries, json.dumps(slim))
+        else:
+            self._count("memo_hits")
+
+        validators = {
+            "hash": body_hash,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        await self._set(f"validators:{feed_key}", validators, json.dumps(validators))
+        return await self._new_entries(consumer, feed_key, body_hash, entries)
+
+    async def mark_delivered(self, consumer: FeedConsumer):
+        """Record the bodies the consumer was given as processed"""
+        for feed_key, body_hash, keys in consumer.pending:
+            delivered = {"hash": body_hash, "entries": keys}
+            await self._set(
+                self._delivered_key(consumer, feed_key),
+                delivered,
+                json.dumps(delivered),
+            )
+        consumer.pending.clear()
+
+    def stats(self) -> Dict:
+        """Fetch outcomes, tier hits and current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size_bytes"] = self._bytes
+            stats["items"] = len(self._entries)
+        return stats
+
+    def clear(self):
+        """Drop the local tier (Redis entries expire on their own)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    async def _new_entries(
+        self,
+        consumer: Optional[FeedConsumer],
+        feed_key: str,
+        body_hash: str,
+        entries: List[feedparser.FeedParserDict],
+    ) -> List[feedparser.FeedParserDict]:
+        """Entries not in the last body the consumer marked as processed"""
+        if consumer is None:
+            return entries
+        delivered = await self._get(self._delivered_key(consumer, feed_key))
+        if delivered is not None and delivered["hash"] == body_hash:
+            self._count("unchanged")
+            return []
+
+        seen = set(delivered["entries"]) if delivered is not None else set()
+        consumer.pending.append(
+            (feed_key, body_hash, [_entry_key(entry) for entry in entries])
+        )
+        return [entry for entry in entries if _entry_key(entry) not in seen]
+
+    @staticmethod
+    def _delivered_key(consumer: FeedConsumer, feed_key: str) -> str:
+        return f"delivered:{consumer.name}:{feed_key}"
+
+    @staticmethod
+    def _feed_key(url: str, params: Optional[Dict]) -> str:
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()))}"
+        return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def _get(self, key: str) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and item[1] > now:
+                self._entries.move_to_end(key)
+                self._stats["local_hits"] += 1
+                return item[2]
+
+        if self.redis is None:
+            return None
+        try:
+            raw = await asyncio.to_thread(self.redis.get, f"{self.key_prefix}:{key}")
+        except Exception as e:
+            logger.warning(f"Feed cache Redis read failed: {e}")
+            return None
+        if raw is None:
+            return None
+
+        value = json.loads(raw)
+        if key.startswith("entries:"):
+            value = [restore_entry(entry) for entry in value]
+        self._store_local(key, value, len(raw))
+        self._count("redis_hits")
+        return value
+
+    async def _set(self, key: str, value: Any, serialized: str):
+        self._store_local(key, value, len(serialized))
+        if self.redis is not None:
+            try:
+                await asyncio.to_thread(
+                    self.redis.setex,
+                    f"{self.key_prefix}:{key}",
+                    self.ttl_seconds,
+                    serialized,
+                )
+            except Exception as e:
+                logger.warning(f"Feed cache Redis write failed: {e}")
+
+    def _store_local(self, key: str, value: Any, size: int):
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[0]
+            self._entries[key] = (size, expires_at, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (evicted, _, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self._stats["evictions"] += 1
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+
+_shared_cache: Optional[FeedCache] = None
+
+
+def get_feed_cache() -> FeedCache:
+    """Process-wide feed cache, so every collector run shares validators"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = FeedCache.from_settings()
+    return _shared_cache
+
+
+__all__ = [
+    "FeedCache",
+    "FeedConsumer",
+    "get_feed_cache",
+    "restore_entry",
+    "slim_entry",
+]
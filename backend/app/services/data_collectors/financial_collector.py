@@ -1,12 +1,15 @@
 # brandguard/backend/app/services/data_collectors/financial_collector.py
-import aiohttp
+import logging
 from datetime import datetime
 from typing import Dict, List, Optional
 import os
 from sqlalchemy.orm import Session
 from app.models.sentiment import Article
+from app.services.data_collectors.http_client import get_http_client
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
 
 class FinancialDataCollector:
     """
@@ -14,8 +17,11 @@ class FinancialDataCollector:
     Free tier: 5 calls per minute, 500 per day
     """
 
+    API_URL = "https://www.alphavantage.co/query"
+
     def __init__(self):
         self.api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
+        self.http = get_http_client()
         if not self.api_key:
             logger.warning("Alpha Vantage API key not configured")
 
@@ -37,7 +43,6 @@ class FinancialDataCollector:
 
     async def _get_financial_news(self, ticker: str) -> List[Dict]:
         """Get financial news from Alpha Vantage"""
-        url = f"https://www.alphavantage.co/query"
         params = {
             "function": "NEWS_SENTIMENT",
             "tickers": ticker,
@@ -45,11 +50,9 @@ class FinancialDataCollector:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._parse_financial_news(data, ticker)
+            data = await self.http.get_json(self.API_URL, params=params)
+            if data is not None:
+                return self._parse_financial_news(data, ticker)
         except Exception as e:
             logger.error(f"Alpha Vantage API error: {str(e)}")
 
@@ -0,0 +1,245 @@
+# brandguard/backend/app/services/data_collectors/http_client.py
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class HttpResponse:
+    """Outcome of a GET; body is only read for a 200"""
+
+    status: int
+    headers: Mapping[str, str]  # case-insensitive
+    body: Any = None
+
+
+class HttpClient:
+    """
+    One pooled aiohttp session shared by all collectors
+    - The connector keeps connections alive and caches DNS, so repeated
+      requests to a feed host skip the TCP/TLS handshake and lookup
+    - Responses are decompressed transparently: gzip and deflate always,
+      brotli when the Brotli package is installed
+    - GETs are retried on connection errors, timeouts and 429/5xx with
+      exponential backoff
+    - The session belongs to the running event loop; it is created on
+      first use and closed by close() (app shutdown). A session left by an
+      earlier loop is closed on that loop before it is replaced
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_per_host: int = 10,
+        keepalive_seconds: float = 30,
+        dns_cache_seconds: int = 300,
+        timeout_seconds: float = 30,
+        connect_timeout_seconds: float = 10,
+        retries: int = 2,
+        backoff_seconds: float = 0.5,
+    ):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.keepalive_seconds = keepalive_seconds
+        self.dns_cache_seconds = dns_cache_seconds
+        self.timeout = aiohttp.ClientTimeout(
+            total=timeout_seconds, sock_connect=connect_timeout_seconds
+        )
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop = None
+        self._lock = threading.Lock()
+        self._connections = {"created": 0, "reused": 0}
+        self._hosts = defaultdict(
+            lambda: {
+                "requests": 0,
+                "errors": 0,
+                "retries": 0,
+                "seconds": 0.0,
+                "max": 0.0,
+            }
+        )
+
+    @classmethod
+    def from_settings(cls) -> "HttpClient":
+        from app.core.config import settings
+
+        return cls(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+            timeout_seconds=settings.HTTP_TIMEOUT_SECONDS,
+            retries=settings.HTTP_RETRIES,
+        )
+
+    async def _current_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            stale, stale_loop = self._session, self._loop
+            self._session, self._loop = None, loop
+            await _close_session(stale, stale_loop)
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_per_host,
+            keepalive_timeout=self.keepalive_seconds,
+            ttl_dns_cache=self.dns_cache_seconds,
+        )
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(self._on_connection_created)
+        trace.on_connection_reuseconn.append(self._on_connection_reused)
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers={"User-Agent": "BrandGuard/1.0 (+RSS collector)"},
+            trace_configs=[trace],
+        )
+
+    async def close(self):
+        session, self._session = self._session, None
+        await _close_session(session, self._loop)
+
+    async def get_text(self, url: str, params: Optional[Dict] = None) -> Optional[str]:
+        """Body of a GET, None unless it ends in a 200"""
+        response = await self.get(url, params)
+        if response.status != 200:
+            logger.warning(f"GET {url} returned {response.status}")
+        return response.body
+
+    async def get_json(self, url: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """Decoded JSON of a GET, None unless it ends in a 200"""
+        response = await self._get(url, params, None, lambda r: r.json())
+        if response.status != 200:
+            logger.warning(f"GET {url} returned {response.status}")
+        return response.body
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+    ) -> HttpResponse:
+        """Status, headers and text body of a GET (e.g. a conditional one)"""
+        return await self._get(url, params, headers, lambda r: r.text())
+
+    async def _get(self, url, params, headers, read) -> HttpResponse:
+        host = urlparse(url).netloc.lower()
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._record(host, retries=1)
+                await asyncio.sleep(self.backoff_seconds * 2 ** (attempt - 1))
+            started = time.perf_counter()
+            try:
+                session = await self._current_session()
+                async with session.get(url, params=params, headers=headers) as response:
+                    if response.status in RETRY_STATUSES and attempt < self.retries:
+                        await response.read()
+                        self._record(host, time.perf_counter() - started, errors=1)
+                        continue
+                    result = HttpResponse(response.status, response.headers.copy())
+                    if response.status == 200:
+                        result.body = await read(response)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                self._record(host, time.perf_counter() - started, errors=1)
+                if attempt < self.retries:
+                    continue
+                raise
+            self._record(host, time.perf_counter() - started)
+            return result
+
+    def _record(self, host, seconds=None, errors=0, retries=0):
+        with self._lock:
+            stats = self._hosts[host]
+            stats["errors"] += errors
+            stats["retries"] += retries
+            if seconds is not None:
+                stats["requests"] += 1
+                stats["seconds"] += seconds
+                stats["max"] = max(stats["max"], seconds)
+
+    async def _on_connection_created(self, session, context, params):
+        with self._lock:
+            self._connections["created"] += 1
+
+    async def _on_connection_reused(self, session, context, params):
+        with self._lock:
+            self._connections["reused"] += 1
+
+    def stats(self) -> Dict:
+        """Connection reuse and per-host latency of every request so far"""
+        with self._lock:
+            connections = dict(self._connections)
+            hosts = {host: dict(stats) for host, stats in self._hosts.items()}
+        acquired = connections["created"] + connections["reused"]
+        return {
+            "connections_created": connections["created"],
+            "connections_reused": connections["reused"],
+            "connection_reuse_ratio": (
+                connections["reused"] / acquired if acquired else 0.0
+            ),
+            "hosts": {
+                host: {
+                    "requests": stats["requests"],
+                    "errors": stats["errors"],
+                    "retries": stats["retries"],
+                    "mean_latency_ms": (
+                        stats["seconds"] / stats["requests"] * 1000
+                        if stats["requests"]
+                        else 0.0
+                    ),
+                    "max_latency_ms": stats["max"] * 1000,
+                }
+                for host, stats in hosts.items()
+            },
+        }
+
+
+async def _close_session(session: Optional[aiohttp.ClientSession], loop):
+    """Close a session on the loop that owns its connections"""
+    if session is None or session.closed:
+        return
+    if loop is None or loop.is_closed() or loop is asyncio.get_running_loop():
+        # A closed loop's sockets can't be shut cleanly; this drops the pool
+        await session.close()
+    elif loop.is_running():
+        # Still serving another thread: close it there
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        )
+    else:
+        # Stopped, not closed: run it once more, off this thread
+        await asyncio.to_thread(loop.run_until_complete, session.close())
+
+
+_shared_client: Optional[HttpClient] = None
+
+
+def get_http_client() -> HttpClient:
+    """Process-wide HTTP client, so every collector shares its connections"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = HttpClient.from_settings()
+    return _shared_client
+
+
+async def close_http_client():
+    if _shared_client is not None:
+        await _shared_client.close()
+
+
+__all__ = ["HttpClient", "HttpResponse", "close_http_client", "get_http_client"]
@@ -0,0 +1,86 @@
+# brandguard/backend/app/services/data_collectors/keyword_matcher.py
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, Set
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex matching any of the words, factored as a trie
+
+    Shared prefixes are matched once ("acme(?: corp)?" rather than
+    "acme|acme corp"), and optional suffixes are greedy, so the longest word
+    starting at a position wins.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Matches text against the keywords of many companies in one pass
+    - Same semantics as checking every keyword as a case-insensitive
+      substring, company by company
+    - One compiled trie regex over all keywords, tried at every position
+      through a lookahead so overlapping keywords are all seen
+    - The longest keyword at a position stands for every keyword it
+      contains, so shorter aliases of other companies aren't lost
+    """
+
+    def __init__(self, keywords: Dict[int, Iterable[str]]):
+        owners = defaultdict(set)
+        for company_id, aliases in keywords.items():
+            for alias in aliases:
+                alias = alias.lower()
+                if alias:
+                    owners[alias].add(company_id)
+
+        self._pattern = re.compile(f"(?=({trie_pattern(owners)}))") if owners else None
+
+        # Keywords that are prefixes of an alias start where it starts
+        prefixed = {
+            alias: frozenset().union(
+                *(owners.get(alias[:end], ()) for end in range(1, len(alias) + 1))
+            )
+            for alias in owners
+        }
+        # Every keyword inside an alias is a prefix of one found in it
+        self._companies = {
+            alias: frozenset().union(
+                *(prefixed[found] for found in self._pattern.findall(alias))
+            )
+            for alias in owners
+        }
+
+    def match(self, text: str) -> Set[int]:
+        """Ids of the companies with a keyword in the text"""
+        if self._pattern is None:
+            return set()
+        return set().union(
+            *(
+                self._companies[found]
+                for found in set(self._pattern.findall(text.lower()))
+            )
+        )
+
+
+__all__ = ["KeywordMatcher", "trie_pattern"]
@@ -0,0 +1,329 @@
+# brandguard/backend/app/services/data_collectors/near_duplicates.py
+import base64
+import hashlib
+import io
+import json
+import logging
+import re
+import time
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Smallest prime above 2**32: a * h + b stays below 2**64 for 32-bit inputs
+_PRIME = np.uint64(4294967311)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_WORD = re.compile(r"\w+")
+
+
+class MinHasher:
+    """
+    MinHash signatures over word shingles
+    - Shingles are overlapping word k-grams hashed to 32 bits
+    - Each of num_perm universal hash functions keeps its minimum value
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, 2**32, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, 2**32, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> np.ndarray:
+        words = _WORD.findall(text.lower())
+        k = min(self.shingle_size, len(words)) or 1
+        grams = {" ".join(words[i : i + k]) for i in range(max(1, len(words) - k + 1))}
+        return np.fromiter(
+            (zlib.crc32(gram.encode("utf-8")) for gram in grams if gram),
+            dtype=np.uint64,
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = self.shingles(text)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        permuted = (np.outer(self.a, hashes) + self.b[:, None]) % _PRIME
+        return (permuted.min(axis=1) & _MAX_HASH).astype(np.uint32)
+
+
+class LSHIndex:
+    """
+    Banded LSH index over MinHash signatures
+    - Signatures are split into bands; sharing any band makes a candidate
+    - Candidates are confirmed by the estimated Jaccard similarity
+    - Entries older than the rolling window are dropped by expire()
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.signatures: Dict[int, np.ndarray] = {}
+        self.timestamps: Dict[int, float] = {}
+        self._buckets: List[Dict[bytes, Set[int]]] = [
+            defaultdict(set) for _ in range(bands)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def insert(self, key: int, signature: np.ndarray, timestamp: float = None):
+        if key in self.signatures:
+            self.remove(key)
+        self.signatures[key] = signature
+        self.timestamps[key] = time.time() if timestamp is None else timestamp
+        for band, bucket in zip(self._band_keys(signature), self._buckets):
+            bucket[band].add(key)
+
+    def remove(self, key: int):
+        signature = self.signatures.pop(key, None)
+        self.timestamps.pop(key, None)
+        if signature is None:
+            return
+        for band, bucket in zip(self._band_keys(signature), self._buckets):
+            members = bucket.get(band)
+            if members:
+                members.discard(key)
+                if not members:
+                    del bucket[band]
+
+    def query(self, signature: np.ndarray, threshold: float = 0.8) -> Optional[int]:
+        """Most similar indexed key with estimated Jaccard >= threshold"""
+        candidates = set()
+        for band, bucket in zip(self._band_keys(signature), self._buckets):
+            candidates.update(bucket.get(band, ()))
+
+        best_key, best_similarity = None, threshold
+        for key in candidates:
+            similarity = float(np.mean(self.signatures[key] == signature))
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+        return best_key
+
+    def expire(self, older_than: float):
+        for key in [k for k, ts in self.timestamps.items() if ts < older_than]:
+            self.remove(key)
+
+    def to_bytes(self) -> bytes:
+        """Compact form: keys, timestamps and the signature matrix only"""
+        keys = np.fromiter(self.signatures.keys(), dtype=np.int64)
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            params=np.array([self.num_perm, self.bands], dtype=np.int64),
+            keys=keys,
+            timestamps=np.array([self.timestamps[k] for k in keys], dtype=np.float64),
+            signatures=(
+                np.stack([self.signatures[k] for k in keys])
+                if len(keys)
+                else np.zeros((0, self.num_perm), dtype=np.uint32)
+            ),
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LSHIndex":
+        """Rebuild the index (buckets included) from to_bytes() output"""
+        arrays = np.load(io.BytesIO(data))
+        num_perm, bands = (int(v) for v in arrays["params"])
+        index = cls(num_perm=num_perm, bands=bands)
+        for key, timestamp, signature in zip(
+            arrays["keys"], arrays["timestamps"], arrays["signatures"]
+        ):
+            index.insert(int(key), signature, float(timestamp))
+        return index
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+
+class NearDuplicateDetector:
+    """
+    Per-company near-duplicate detection over a rolling window
+    - One LSH index per company, persisted to Redis between runs
+    - The URLs already ingested for a company are remembered for the same
+      window, so re-polled items aren't taken for syndicated copies
+    - save() merges this detector's changes into the stored index under
+      WATCH/MULTI, so concurrent collectors don't overwrite each other
+    - Without Redis the indexes live for the lifetime of the detector
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        window_days: int = 7,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 16,
+        key_prefix: str = "dedup:lsh:v1",
+    ):
+        self.redis = redis_client
+        self.window_seconds = window_days * 86400
+        self.threshold = threshold
+        self.bands = bands
+        self.key_prefix = key_prefix
+        self.hasher = MinHasher(num_perm=num_perm)
+        self._indexes: Dict[int, LSHIndex] = {}
+        self._urls: Dict[int, Dict[str, float]] = {}
+        # Changes not yet saved, per company: key -> signature, or None
+        # for a removal, and URL digest -> time seen
+        self._changes: Dict[int, Dict[int, Optional[np.ndarray]]] = defaultdict(dict)
+        self._new_urls: Dict[int, Dict[str, float]] = defaultdict(dict)
+
+    @classmethod
+    def from_settings(cls) -> "NearDuplicateDetector":
+        """Build the detector from settings, sharing the app's Redis client"""
+        from app.core.config import settings
+
+        redis_client = None
+        try:
+            from app.db.session import redis_client
+        except Exception as e:
+            logger.warning(f"Redis unavailable for duplicate detection: {e}")
+
+        return cls(
+            redis_client=redis_client,
+            window_days=settings.DEDUP_WINDOW_DAYS,
+            threshold=settings.DEDUP_THRESHOLD,
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        return self.hasher.signature(text)
+
+    def new_index(self) -> LSHIndex:
+        """An empty index with this detector's parameters, e.g. for one batch"""
+        return LSHIndex(num_perm=self.hasher.num_perm, bands=self.bands)
+
+    def find_duplicate(self, company_id: int, signature: np.ndarray) -> Optional[int]:
+        """Id of an earlier article this signature nearly duplicates"""
+        return self._index(company_id).query(signature, self.threshold)
+
+    def add(self, company_id: int, article_id: int, signature: np.ndarray):
+        self._index(company_id).insert(article_id, signature)
+        self._changes[company_id][article_id] = signature
+
+    def remove(self, company_id: int, article_id: int):
+        self._index(company_id).remove(article_id)
+        self._changes[company_id][article_id] = None
+
+    def seen_url(self, company_id: int, url: str) -> bool:
+        """Whether the URL was already ingested (stored or folded) in the window"""
+        return _url_digest(url) in self._seen_urls(company_id)
+
+    def add_url(self, company_id: int, url: str):
+        digest, now = _url_digest(url), time.time()
+        self._seen_urls(company_id)[digest] = now
+        self._new_urls[company_id][digest] = now
+
+    def save(self, company_id: int):
+        """Expire old entries and persist the company's index and URLs"""
+        cutoff = time.time() - self.window_seconds
+        changes = self._changes.pop(company_id, {})
+        new_urls = self._new_urls.pop(company_id, {})
+        if self.redis is not None:
+            from redis.exceptions import WatchError
+
+            key, urls_key = self._key(company_id), self._urls_key(company_id)
+            try:
+                with self.redis.pipeline() as pipe:
+                    while True:
+                        try:
+                            pipe.watch(key, urls_key)
+                            index = _decode_index(pipe.get(key)) or self.new_index()
+                            urls = json.loads(pipe.get(urls_key) or "{}")
+                            _apply_changes(index, changes)
+                            urls.update(new_urls)
+                            _expire(index, urls, cutoff)
+                            pipe.multi()
+                            pipe.setex(
+                                key,
+                                self.window_seconds,
+                                base64.b64encode(index.to_bytes()).decode("ascii"),
+                            )
+                            pipe.setex(urls_key, self.window_seconds, json.dumps(urls))
+                            pipe.execute()
+                            break
+                        except WatchError:
+                            continue
+                # Pick up what other collectors stored meanwhile
+                self._indexes[company_id] = index
+                self._urls[company_id] = urls
+                return
+            except Exception as e:
+                logger.warning(f"Failed to persist duplicate index: {e}")
+        _expire(self._index(company_id), self._seen_urls(company_id), cutoff)
+
+    def _index(self, company_id: int) -> LSHIndex:
+        index = self._indexes.get(company_id)
+        if index is None:
+            index = self._load(company_id) or self.new_index()
+            index.expire(time.time() - self.window_seconds)
+            self._indexes[company_id] = index
+        return index
+
+    def _load(self, company_id: int) -> Optional[LSHIndex]:
+        if self.redis is None:
+            return None
+        try:
+            return _decode_index(self.redis.get(self._key(company_id)))
+        except Exception as e:
+            logger.warning(f"Failed to load duplicate index: {e}")
+            return None
+
+    def _seen_urls(self, company_id: int) -> Dict[str, float]:
+        urls = self._urls.get(company_id)
+        if urls is None:
+            urls = self._load_urls(company_id)
+            self._urls[company_id] = urls
+        return urls
+
+    def _load_urls(self, company_id: int) -> Dict[str, float]:
+        if self.redis is None:
+            return {}
+        try:
+            raw = self.redis.get(self._urls_key(company_id))
+            return json.loads(raw) if raw else {}
+        except Exception as e:
+            logger.warning(f"Failed to load seen URLs: {e}")
+            return {}
+
+    def _key(self, company_id: int) -> str:
+        return f"{self.key_prefix}:{company_id}"
+
+    def _urls_key(self, company_id: int) -> str:
+        return f"{self.key_prefix}:urls:{company_id}"
+
+
+def _decode_index(raw) -> Optional[LSHIndex]:
+    return LSHIndex.from_bytes(base64.b64decode(raw)) if raw else None
+
+
+def _apply_changes(index: LSHIndex, changes: Dict[int, Optional[np.ndarray]]):
+    for key, signature in changes.items():
+        if signature is None:
+            index.remove(key)
+        else:
+            index.insert(key, signature)
+
+
+def _expire(index: LSHIndex, urls: Dict[str, float], cutoff: float):
+    index.expire(cutoff)
+    for digest in [d for d, ts in urls.items() if ts < cutoff]:
+        del urls[digest]
+
+
+def _url_digest(url: str) -> str:
+    return hashlib.blake2b(url.strip().encode("utf-8"), digest_size=8).hexdigest()
+
+
+__all__ = ["MinHasher", "LSHIndex", "NearDuplicateDetector"]
@@ -1,15 +1,27 @@
 # brandguard/backend/app/services/data_collectors/news_collector.py
-import asyncio
-import aiohttp
 import feedparser
+import hashlib
+import defusedxml
 import defusedxml.ElementTree as ET
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import partial
+from typing import Awaitable, Callable, List, Dict, Optional, Tuple
 import xml
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.models.company import Company, DataSource
 from app.models.sentiment import Article
-from app.services.analyzers.sentiment_analyzer import analyze_sentiment
+from app.services.analyzers.sentiment_analyzer import analyze_sentiments
+from app.services.analyzers.result_cache import get_result_cache
+from app.services.analyzers.risk_state import RiskStateStore
+from app.services.analyzers.sentiment_rollups import record_articles
+from app.services.analyzers.spike_detector import SpikeDetectorStore
+from app.services.data_collectors.concurrency import HostLimiter, gather_isolated
+from app.services.data_collectors.feed_cache import FeedConsumer, get_feed_cache
+from app.services.data_collectors.keyword_matcher import KeywordMatcher
+from app.services.data_collectors.rate_limiter import get_rate_limiter
+from app.services.data_collectors.near_duplicates import NearDuplicateDetector
 import logging
 import re
 from urllib.parse import urlparse
@@ -71,7 +83,15 @@ class LegalNewsCollector:
 
     def __init__(self, db: Session):
         self.db = db
-        self.rate_limiter = AsyncRateLimiter()
+        self.rate_limiter = get_rate_limiter()
+        self.feeds = get_feed_cache()
+        self.fetch_limiter = HostLimiter(
+            settings.COLLECTOR_MAX_CONCURRENCY, settings.COLLECTOR_MAX_PER_HOST
+        )
+        self.duplicates = NearDuplicateDetector.from_settings()
+        self.risk_state = RiskStateStore.from_settings()
+        self.result_cache = get_result_cache()
+        self.spikes = SpikeDetectorStore.from_settings()
         self.spacy_nlp = None
         self._load_nlp()
 
@@ -88,8 +108,129 @@ class LegalNewsCollector:
         """Collect news for specific company"""
         articles = []
         keywords = self._generate_keywords(company_name)
+        sources = self._news_sources()
+        consumer = self._company_consumer(company_id, days_back)
+
+        # Sources are fetched concurrently; a failing one yields no articles
+        results = await gather_isolated(
+            [
+                (
+                    source.name,
+                    self._scoped(
+                        consumer,
+                        partial(
+                            self._collect_rate_limited, source, keywords, days_back
+                        ),
+                    ),
+                )
+                for source in sources
+            ]
+        )
+        for source, new_articles in zip(sources, results):
+            articles.extend((source, article) for article in new_articles)
+
+        stored = self._store_articles(company_id, articles)
+        # Only now are the entries processed; a failure above retries them
+        await self.feeds.mark_delivered(consumer)
+        return stored
+
+    async def collect_for_portfolio(
+        self, companies: List[Company], days_back: int = 7
+    ) -> Dict[int, List[Dict]]:
+        """
+        Collect news for many companies in one cycle
+
+        Shared feeds are fetched once and each entry is matched against every
+        company's keywords in one pass; keyword searches (Google News) still
+        run per company. Returns the stored articles per company id.
+        """
+        keywords = {
+            company.id: self._generate_keywords(company.name) for company in companies
+        }
+        matcher = KeywordMatcher(keywords)
+        # Entries already matched for this same portfolio aren't matched again
+        portfolio = hashlib.blake2b(
+            ",".join(str(company_id) for company_id in sorted(keywords)).encode(),
+            digest_size=8,
+        ).hexdigest()
+        shared = FeedConsumer(f"portfolio:{portfolio}:{days_back}")
+        consumers = {
+            company.id: self._company_consumer(company.id, days_back)
+            for company in companies
+        }
+        sources = self._news_sources()
+        searches = [source for source in sources if "google.com" in source.url]
+        feeds = [source for source in sources if "google.com" not in source.url]
+
+        results = await gather_isolated(
+            [
+                (
+                    source.name,
+                    self._scoped(
+                        shared,
+                        partial(self._collect_shared_feed, source, matcher, days_back),
+                    ),
+                )
+                for source in feeds
+            ]
+            + [
+                (
+                    f"{source.name} for {company.name}",
+                    self._scoped(
+                        consumers[company.id],
+                        partial(
+                            self._collect_rate_limited,
+                            source,
+                            keywords[company.id],
+                            days_back,
+                        ),
+                    ),
+                )
+                for source in searches
+                for company in companies
+            ]
+        )
 
-        # Check for existing data source configurations
+        articles = defaultdict(list)
+        for source, matches in zip(feeds, results):
+            for company_id, article in matches:
+                articles[company_id].append((source, article))
+        searched = [(source, company) for source in searches for company in companies]
+        for (source, company), found in zip(searched, results[len(feeds) :]):
+            articles[company.id].extend((source, article) for article in found)
+
+        stored = {}
+        for company in companies:
+            stored[company.id] = self._store_articles(company.id, articles[company.id])
+            await self.feeds.mark_delivered(consumers[company.id])
+        await self.feeds.mark_delivered(shared)
+        return stored
+
+    def _company_consumer(self, company_id: int, days_back: int) -> FeedConsumer:
+        # Entries outside days_back are skipped, not processed: a run with a
+        # longer window is another consumer and gets them
+        return FeedConsumer(f"company:{company_id}:{days_back}")
+
+    async def _scoped(
+        self,
+        consumer: Optional[FeedConsumer],
+        collect: Callable[[Optional[FeedConsumer]], Awaitable],
+    ):
+        """
+        Run collect with its own view of consumer
+
+        The feeds it was given are kept for the consumer only if it returns,
+        so a source that fails midway hands out its entries again.
+        """
+        if consumer is None:
+            return await collect(None)
+        scope = consumer.scope()
+        result = await collect(scope)
+        consumer.join(scope)
+        return result
+
+    def _news_sources(self) -> List[DataSource]:
+        """Active news sources, created from LEGAL_SOURCES on first use"""
         sources = (
             self.db.query(DataSource)
             .filter(DataSource.source_type == "news", DataSource.is_active == True)
@@ -106,102 +247,230 @@ class LegalNewsCollector:
                 self.db.add(source)
             self.db.commit()
 
-        for source in sources:
-            try:
-                await self.rate_limiter.wait(source.rate_limit)
-                new_articles = await self._collect_from_source(
-                    source, keywords, days_back
-                )
-                articles.extend(new_articles)
-            except Exception as e:
-                logger.error(f"Failed to collect from {source.name}: {str(e)}")
+        return sources
+
+    def _store_articles(
+        self, company_id: int, articles: List[Tuple[DataSource, Dict]]
+    ) -> List[Dict]:
+        """
+        Store articles, folding near-duplicates into their canonical copy
+
+        Items already ingested for the company (re-polled, or returned again
+        by another keyword) are skipped; only distinct copies add a mention.
+        The articles left are scored in one batched sentiment call.
+        """
+        if not articles:
+            return []
+        # [source, article data, signature, mentions]; copies within this
+        # batch fold into its first one through a batch-local index
+        new_articles = []
+        batch = self.duplicates.new_index()
+        for source, article_data in articles:
+            url = article_data["url"][:1000]
+            if self.duplicates.seen_url(company_id, url):
+                continue
+            self.duplicates.add_url(company_id, url)
+
+            signature = self.duplicates.signature(
+                f"{article_data['title']} {article_data['content']}"
+            )
+            canonical_id = self.duplicates.find_duplicate(company_id, signature)
+            if canonical_id is not None and self._fold_duplicate(canonical_id, url):
                 continue
+            if canonical_id is not None:
+                self.duplicates.remove(company_id, canonical_id)
 
-        # Store articles
-        stored_articles = []
-        for article_data in articles:
-            article = self._store_article(company_id, source.id, article_data)
-            stored_articles.append(article)
+            earlier = batch.query(signature, self.duplicates.threshold)
+            if earlier is not None:
+                new_articles[earlier][3] += 1
+                continue
+            batch.insert(len(new_articles), signature)
+            new_articles.append([source, article_data, signature, 1])
+
+        sentiments = analyze_sentiments(
+            [article_data["content"] for _, article_data, _, _ in new_articles]
+        )
+        stored_articles = [
+            self._store_article(
+                company_id, source.id, article_data, sentiment, mentions
+            )
+            for (source, article_data, _, mentions), sentiment in zip(
+                new_articles, sentiments
+            )
+        ]
+        self.db.flush()
+        for article, (_, _, signature, _) in zip(stored_articles, new_articles):
+            self.duplicates.add(company_id, article.id, signature)
 
+        record_articles(self.db, stored_articles)
         self.db.commit()
+        self.duplicates.save(company_id)
+        self.risk_state.record_articles(company_id, stored_articles)
+        self.spikes.record_articles(company_id, stored_articles)
+        if stored_articles:
+            self.result_cache.invalidate([company_id])
         return [self._format_article_response(article) for article in stored_articles]
 
+    def _fold_duplicate(self, canonical_id: int, url: str) -> bool:
+        """
+        Count a copy at another URL as a mention of the canonical article
+
+        The canonical's own URL is the same item again and counts nothing.
+        False if the canonical article is gone.
+        """
+        canonical_url = (
+            self.db.query(Article.url).filter(Article.id == canonical_id).scalar()
+        )
+        if canonical_url is None:
+            return False
+        if canonical_url != url:
+            self.db.query(Article).filter(Article.id == canonical_id).update(
+                {Article.mention_count: Article.mention_count + 1},
+                synchronize_session=False,
+            )
+        return True
+
+    async def _collect_rate_limited(
+        self,
+        source: DataSource,
+        keywords: List[str],
+        days_back: int,
+        consumer: Optional[FeedConsumer] = None,
+    ) -> List[Dict]:
+        await self.rate_limiter.acquire(self._rate_limit_key(source), source.rate_limit)
+        return await self._collect_from_source(source, keywords, days_back, consumer)
+
+    def _rate_limit_key(self, source: DataSource) -> str:
+        """Providers limit per host, so sources on one host share a bucket"""
+        return urlparse(source.url).netloc.lower() or source.name
+
+    async def _collect_shared_feed(
+        self,
+        source: DataSource,
+        matcher: KeywordMatcher,
+        days_back: int,
+        consumer: Optional[FeedConsumer] = None,
+    ) -> List[Tuple[int, Dict]]:
+        """(company id, article) for each company an entry of the feed mentions"""
+        await self.rate_limiter.acquire(self._rate_limit_key(source), source.rate_limit)
+        matches = []
+        for entry in await self._fetch_entries(source.url, consumer=consumer):
+            if not self._within_date_range(entry.published_parsed, days_back):
+                continue
+            company_ids = matcher.match(self._entry_text(entry))
+            if company_ids:
+                article = self._parse_rss_entry(entry, source.name)
+                matches.extend(
+                    (company_id, article) for company_id in sorted(company_ids)
+                )
+        return matches
+
     async def _collect_from_source(
-        self, source: DataSource, keywords: List[str], days_back: int
+        self,
+        source: DataSource,
+        keywords: List[str],
+        days_back: int,
+        consumer: Optional[FeedConsumer] = None,
     ) -> List[Dict]:
         """Collect from specific source"""
         articles = []
 
         if "google.com" in source.url:
-            articles = await self._collect_google_news(source, keywords, days_back)
+            articles = await self._collect_google_news(
+                source, keywords, days_back, consumer
+            )
         elif "reuters.com" in source.url:
-            articles = await self._collect_reuters(source, keywords, days_back)
+            articles = await self._collect_reuters(
+                source, keywords, days_back, consumer
+            )
         else:
-            articles = await self._collect_rss(source, keywords, days_back)
+            articles = await self._collect_rss(source, keywords, days_back, consumer)
 
         return articles
 
     async def _collect_google_news(
-        self, source: DataSource, keywords: List[str], days_back: int
+        self,
+        source: DataSource,
+        keywords: List[str],
+        days_back: int,
+        consumer: Optional[FeedConsumer] = None,
     ) -> List[Dict]:
-        """Collect from Google News RSS"""
-        articles = []
-        base_url = "https://news.google.com/rss/search"
-
-        for keyword in keywords:
-            params = {"q": keyword, "hl": "en-US", "gl": "US", "ceid": "US:en"}
-
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        base_url, params=params, timeout=30
-                    ) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            feed = feedparser.parse(content)
-
-                            for entry in feed.entries:
-                                if self._within_date_range(
-                                    entry.published_parsed, days_back
-                                ):
-                                    article = self._parse_google_news_entry(
-                                        entry, keyword
-                                    )
-                                    articles.append(article)
-
-            except Exception as e:
-                logger.error(f"Google News collection failed: {str(e)}")
-                continue
+        """Collect from Google News RSS, one concurrent query per keyword"""
+        results = await gather_isolated(
+            [
+                (
+                    f"Google News ({keyword})",
+                    self._scoped(
+                        consumer, partial(self._search_google_news, keyword, days_back)
+                    ),
+                )
+                for keyword in dict.fromkeys(keywords)
+            ]
+        )
+        return [article for articles in results for article in articles]
 
-        return articles
+    async def _search_google_news(
+        self, keyword: str, days_back: int, consumer: Optional[FeedConsumer] = None
+    ) -> List[Dict]:
+        base_url = "https://news.google.com/rss/search"
+        params = {"q": keyword, "hl": "en-US", "gl": "US", "ceid": "US:en"}
+        entries = await self._fetch_entries(base_url, params, consumer)
+        return [
+            self._parse_google_news_entry(entry, keyword)
+            for entry in entries
+            if self._within_date_range(entry.published_parsed, days_back)
+        ]
 
     async def _collect_reuters(
-        self, source: DataSource, keywords: List[str], days_back: int
+        self,
+        source: DataSource,
+        keywords: List[str],
+        days_back: int,
+        consumer: Optional[FeedConsumer] = None,
     ) -> List[Dict]:
-        """Collect from Reuters RSS"""
+        """Collect from Reuters RSS; failures propagate to the isolating caller"""
         articles = []
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(source.url, timeout=30) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        feed = feedparser.parse(content)
-
-                        for entry in feed.entries:
-                            if self._within_date_range(
-                                entry.published_parsed, days_back
-                            ):
-                                # Check relevance
-                                if self._is_article_relevant(entry, keywords):
-                                    article = self._parse_rss_entry(entry, source.name)
-                                    articles.append(article)
-
-        except Exception as e:
-            logger.error(f"Reuters collection failed: {str(e)}")
+        for entry in await self._fetch_entries(source.url, consumer=consumer):
+            if self._within_date_range(entry.published_parsed, days_back):
+                # Check relevance
+                if self._is_article_relevant(entry, keywords):
+                    article = self._parse_rss_entry(entry, source.name)
+                    articles.append(article)
 
         return articles
 
+    async def _collect_rss(
+        self,
+        source: DataSource,
+        keywords: List[str],
+        days_back: int,
+        consumer: Optional[FeedConsumer] = None,
+    ) -> List[Dict]:
+        """Collect from a plain RSS feed (BBC, CNN, WSJ, ...)"""
+        return [
+            self._parse_rss_entry(entry, source.name)
+            for entry in await self._fetch_entries(source.url, consumer=consumer)
+            if self._within_date_range(entry.published_parsed, days_back)
+            and self._is_article_relevant(entry, keywords)
+        ]
+
+    async def _fetch_entries(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        consumer: Optional[FeedConsumer] = None,
+    ) -> List[feedparser.FeedParserDict]:
+        """
+        Feed entries through the feed cache; unchanged feeds aren't parsed
+
+        With a consumer, only entries it hasn't processed are returned, so
+        an unchanged feed yields nothing to process.
+        """
+        async with self.fetch_limiter.slot(url):
+            entries = await self.feeds.entries(url, params, consumer)
+        return entries or []
+
     def _parse_google_news_entry(
         self, entry: feedparser.FeedParserDict, keyword: str
     ) -> Dict:
@@ -263,12 +532,16 @@ class LegalNewsCollector:
         self, entry: feedparser.FeedParserDict, keywords: List[str]
     ) -> bool:
         """Check if article mentions company"""
-        text = (entry.title + " " + entry.summary).lower()
+        text = self._entry_text(entry).lower()
         for keyword in keywords:
             if keyword.lower() in text:
                 return True
         return False
 
+    def _entry_text(self, entry: feedparser.FeedParserDict) -> str:
+        """Text searched for company keywords"""
+        return entry.title + " " + entry.summary
+
     def _within_date_range(self, published_parsed: tuple, days_back: int) -> bool:
         """Check if article is within date range"""
         if not published_parsed:
@@ -281,9 +554,10 @@ class LegalNewsCollector:
     def _parse_date(self, date_string: str) -> datetime:
         """Parse date string to datetime"""
         try:
-            return feedparser._parse_date(date_string)
+            parsed = feedparser.datetimes._parse_date(date_string)
         except (ValueError, TypeError):
-            return datetime.utcnow()
+            parsed = None
+        return datetime(*parsed[:6]) if parsed else datetime.utcnow()
 
     def _calculate_relevance(self, text: str, keyword: str) -> float:
         """Calculate relevance score based on keyword mentions"""
@@ -298,12 +572,14 @@ class LegalNewsCollector:
         return 0.0
 
     def _store_article(
-        self, company_id: int, source_id: int, article_data: Dict
+        self,
+        company_id: int,
+        source_id: int,
+        article_data: Dict,
+        sentiment_result: Dict,
+        mention_count: int = 1,
     ) -> Article:
-        """Store article in database"""
-        # Analyze sentiment
-        sentiment_result = analyze_sentiment(article_data["content"])
-
+        """Store article in database with its sentiment result"""
         article = Article(
             company_id=company_id,
             source_id=source_id,
@@ -314,9 +590,11 @@ class LegalNewsCollector:
             author=article_data["author"][:255],
             sentiment=sentiment_result["sentiment"],
             confidence_score=sentiment_result["confidence"],
+            sentiment_model=sentiment_result.get("model"),
             keywords=sentiment_result.get("keywords", []),
             entities=sentiment_result.get("entities", []),
             relevance_score=article_data["relevance_score"],
+            mention_count=mention_count,
             is_public=True,
             data_retention_until=datetime.utcnow() + timedelta(days=365),
         )
@@ -341,20 +619,3 @@ class LegalNewsCollector:
             "relevance_score": article.relevance_score,
             "source": article.source.name if article.source else "Unknown",
         }
-
-
-class AsyncRateLimiter:
-    """Simple rate limiter for API calls"""
-
-    def __init__(self):
-        self.last_request = {}
-
-    async def wait(self, rate_limit: int):
-        """Wait according to rate limit"""
-        now = datetime.utcnow()
-        if rate_limit in self.last_request:
-            elapsed = (now - self.last_request[rate_limit]).total_seconds()
-            wait_time = max(0, 60.0 / rate_limit - elapsed)
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-        self.last_request[rate_limit] = now
@@ -0,0 +1,167 @@
+# brandguard/backend/app/services/data_collectors/rate_limiter.py
+import asyncio
+import logging
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Same arithmetic as take_token, run atomically inside Redis.
+# Returns the wait as a string: Redis truncates Lua numbers to integers.
+TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+if now > updated then
+    tokens = math.min(capacity, tokens + (now - updated) * rate)
+    updated = now
+end
+tokens = tokens - 1
+local wait = 0
+if tokens < 0 then
+    wait = -tokens / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(updated))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity / rate + wait) * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+def take_token(state: List[float], rate: float, capacity: float, now: float) -> float:
+    """
+    Take one token from a bucket [tokens, updated]; returns the wait in seconds
+
+    Tokens go negative when the bucket is empty: each caller reserves the
+    next token, so concurrent callers get successive, exact start times.
+    A clock behind the bucket's (another process) adds no tokens.
+    """
+    tokens, updated = state
+    if now > updated:
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        updated = now
+    tokens -= 1
+    state[0], state[1] = tokens, updated
+    return -tokens / rate if tokens < 0 else 0.0
+
+
+class TokenBucketLimiter:
+    """
+    Token-bucket rate limits keyed by source or host
+    - A bucket refills at rate_per_minute and holds up to `burst` tokens,
+      so an idle source can fire a burst before being spaced out
+    - acquire() reserves a token and sleeps exactly until it is due; no
+      polling
+    - With Redis, buckets are shared by every process and updated by one
+      Lua script; without it (or when it fails) they live in this process
+    - acquire() runs the script in a worker thread and gives Redis at most
+      redis_timeout seconds, so a slow Redis can't stall the event loop
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        burst: int = 3,
+        key_prefix: str = "rate_limit:v1",
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable] = asyncio.sleep,
+        redis_timeout: float = 0.5,
+    ):
+        self.redis = redis_client
+        self.burst = burst
+        self.key_prefix = key_prefix
+        self.clock = clock
+        self.sleep = sleep
+        self.redis_timeout = redis_timeout
+        self._buckets: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._script = None
+        if redis_client is not None:
+            self._script = redis_client.register_script(TAKE_SCRIPT)
+
+    @classmethod
+    def from_settings(cls) -> "TokenBucketLimiter":
+        """Build the limiter from settings, sharing the app's Redis client"""
+        from app.core.config import settings
+
+        redis_client = None
+        try:
+            from app.db.session import redis_client
+        except Exception as e:
+            logger.warning(f"Redis unavailable for rate limits: {e}")
+
+        return cls(
+            redis_client,
+            burst=settings.RATE_LIMIT_BURST,
+            redis_timeout=settings.RATE_LIMIT_REDIS_TIMEOUT_SECONDS,
+        )
+
+    def reserve(
+        self, key: str, rate_per_minute: float, burst: Optional[int] = None
+    ) -> float:
+        """Take a token now; returns how long to wait before using it"""
+        rate, capacity = self._bucket(rate_per_minute, burst)
+        now = self.clock()
+
+        if self._script is not None:
+            try:
+                return self._reserve_redis(key, rate, capacity, now)
+            except Exception as e:
+                logger.warning(f"Redis rate limit failed for {key}, using local: {e}")
+        return self._reserve_local(key, rate, capacity, now)
+
+    async def acquire(
+        self, key: str, rate_per_minute: float, burst: Optional[int] = None
+    ) -> float:
+        """Wait for a token; returns the seconds waited"""
+        rate, capacity = self._bucket(rate_per_minute, burst)
+        now = self.clock()
+
+        wait = None
+        if self._script is not None:
+            try:
+                wait = await asyncio.wait_for(
+                    asyncio.to_thread(self._reserve_redis, key, rate, capacity, now),
+                    self.redis_timeout,
+                )
+            except Exception as e:
+                logger.warning(f"Redis rate limit failed for {key}, using local: {e!r}")
+        if wait is None:
+            wait = self._reserve_local(key, rate, capacity, now)
+        if wait > 0:
+            await self.sleep(wait)
+        return wait
+
+    def _bucket(self, rate_per_minute: float, burst: Optional[int]):
+        """Refill rate per second and capacity of a bucket"""
+        if not rate_per_minute or rate_per_minute <= 0:
+            raise ValueError(f"Rate limit must be positive, got {rate_per_minute}")
+        return rate_per_minute / 60.0, float(burst or self.burst)
+
+    def _reserve_redis(self, key: str, rate: float, capacity: float, now: float):
+        wait = self._script(
+            keys=[f"{self.key_prefix}:{key}"], args=[rate, capacity, now]
+        )
+        return float(wait)
+
+    def _reserve_local(self, key: str, rate: float, capacity: float, now: float):
+        with self._lock:
+            state = self._buckets.setdefault(key, [capacity, now])
+            return take_token(state, rate, capacity, now)
+
+
+_shared_limiter: Optional[TokenBucketLimiter] = None
+
+
+def get_rate_limiter() -> TokenBucketLimiter:
+    """Process-wide limiter, so every collector instance shares its buckets"""
+    global _shared_limiter
+    if _shared_limiter is None:
+        _shared_limiter = TokenBucketLimiter.from_settings()
+    return _shared_limiter
+
+
+__all__ = ["TAKE_SCRIPT", "TokenBucketLimiter", "get_rate_limiter", "take_token"]
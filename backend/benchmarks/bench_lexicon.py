@@ -0,0 +1,80 @@
+# brandguard/backend/benchmarks/bench_lexicon.py
+"""
+Throughput of the lexicon (simple) sentiment path.
+
+Compares the previous per-call implementation (sets rebuilt on every call,
+three passes over text.split()) with the compiled scorer, per text and in
+batch mode. Synthetic texts are keyword-dense, so these numbers understate
+the gain on real articles where most tokens miss the lexicon.
+
+Usage:
+    cd backend && python -m benchmarks.bench_lexicon --sizes 10000 1000000
+"""
+import argparse
+import time
+
+from app.services.analyzers.lexicon import (
+    DEFAULT_LEXICON,
+    NEGATIVE_WORDS,
+    NEUTRAL_WORDS,
+    POSITIVE_WORDS,
+)
+from benchmarks.bench_sentiment import make_texts
+
+
+def legacy_simple_analyze(text: str) -> dict:
+    positive_words = set(POSITIVE_WORDS)
+    negative_words = set(NEGATIVE_WORDS)
+    neutral_words = set(NEUTRAL_WORDS)
+
+    words = text.lower().split()
+    positive_count = sum(1 for word in words if word in positive_words)
+    negative_count = sum(1 for word in words if word in negative_words)
+    neutral_count = sum(1 for word in words if word in neutral_words)
+
+    total = positive_count + negative_count + neutral_count
+    if total == 0:
+        return {"sentiment": "NEUTRAL", "confidence": 0.0}
+
+    positive_score = positive_count / total
+    negative_score = negative_count / total
+    if positive_score > negative_score and positive_score > 0.3:
+        return {"sentiment": "POSITIVE", "confidence": min(positive_score, 0.9)}
+    if negative_score > positive_score and negative_score > 0.3:
+        return {"sentiment": "NEGATIVE", "confidence": min(negative_score, 0.9)}
+    return {"sentiment": "NEUTRAL", "confidence": 0.5}
+
+
+def rate(fn, texts) -> float:
+    start = time.perf_counter()
+    fn(texts)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    args = parser.parse_args()
+
+    pool = make_texts(10_000)
+    for size in args.sizes:
+        texts = (pool * (size // len(pool) + 1))[:size]
+
+        legacy = rate(lambda t: [legacy_simple_analyze(x) for x in t], texts)
+        single = rate(
+            lambda t: [DEFAULT_LEXICON.classify(DEFAULT_LEXICON.count(x)) for x in t],
+            texts,
+        )
+        batch = rate(
+            lambda t: DEFAULT_LEXICON.classify_batch(DEFAULT_LEXICON.count_batch(t)),
+            texts,
+        )
+
+        print(f"docs={size}")
+        print(f"  legacy per-text : {legacy:12.0f} texts/s")
+        print(f"  compiled single : {single:12.0f} texts/s")
+        print(f"  compiled batch  : {batch:12.0f} texts/s ({batch / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
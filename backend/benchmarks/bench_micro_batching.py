@@ -0,0 +1,105 @@
+# brandguard/backend/benchmarks/bench_micro_batching.py
+"""
+Latency vs throughput for micro-batched sentiment inference.
+
+Runs closed-loop clients at several concurrency levels against
+analyze_async() and reports throughput with p50/p99 request latency.
+--synthetic replaces the model with a cost model (fixed per-call overhead
+plus per-item work) so the batching behaviour can be seen without a model.
+
+Usage:
+    cd backend && python -m benchmarks.bench_micro_batching --seconds 5
+    cd backend && python -m benchmarks.bench_micro_batching --synthetic
+"""
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from app.services.analyzers.micro_batcher import MicroBatcher
+from app.services.analyzers.sentiment_analyzer import SentimentAnalyzer
+from benchmarks.bench_sentiment import make_texts
+
+
+def synthetic_batch_fn(overhead_ms: float, per_item_ms: float):
+    def run(items):
+        time.sleep((overhead_ms + per_item_ms * len(items)) / 1000.0)
+        return [{"sentiment": "NEUTRAL", "confidence": 0.5} for _ in items]
+
+    return run
+
+
+async def run_level(submit, texts, concurrency: int, seconds: float) -> dict:
+    latencies = []
+    stop_at = time.perf_counter() + seconds
+
+    async def client(offset: int):
+        i = offset
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            await submit(texts[i % len(texts)])
+            latencies.append(time.perf_counter() - start)
+            i += concurrency
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ms = np.array(latencies) * 1000
+    return {
+        "concurrency": concurrency,
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p99_ms": float(np.percentile(ms, 99)),
+    }
+
+
+async def main_async(args):
+    texts = make_texts(1000)
+
+    if args.synthetic:
+        batch_fn = synthetic_batch_fn(args.overhead_ms, args.per_item_ms)
+    else:
+        analyzer = SentimentAnalyzer(batch_size=args.max_batch_size)
+        batch_fn = analyzer.batch_analyze
+
+    batcher = MicroBatcher(
+        batch_fn, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms
+    )
+    loop = asyncio.get_running_loop()
+
+    async def unbatched(text):
+        return await loop.run_in_executor(None, batch_fn, [text])
+
+    modes = [("unbatched", unbatched), ("micro-batched", batcher.submit)]
+    print(
+        f"{'mode':14s} {'clients':>7s} {'texts/s':>10s} {'p50 ms':>8s} {'p99 ms':>8s}"
+    )
+    for concurrency in args.concurrency:
+        for name, submit in modes:
+            row = await run_level(submit, texts, concurrency, args.seconds)
+            print(
+                f"{name:14s} {row['concurrency']:7d} {row['throughput']:10.1f} "
+                f"{row['p50_ms']:8.2f} {row['p99_ms']:8.2f}"
+            )
+
+    await batcher.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 16, 64, 256]
+    )
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--overhead-ms", type=float, default=8.0)
+    parser.add_argument("--per-item-ms", type=float, default=0.5)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
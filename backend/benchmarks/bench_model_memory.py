@@ -0,0 +1,104 @@
+# brandguard/backend/benchmarks/bench_model_memory.py
+"""
+Per-worker memory with and without preloading the sentiment model before fork.
+
+Each forked worker runs one inference and reports its RSS, PSS and private
+memory from /proc/self/smaps_rollup (Linux only). PSS splits shared pages
+between the processes mapping them, so it is the number that drops when
+workers share the preloaded weights.
+
+Usage:
+    cd backend && python -m benchmarks.bench_model_memory --workers 4
+"""
+import argparse
+import json
+import os
+
+from app.services.analyzers.model_registry import (
+    get_sentiment_pipeline,
+    model_registry,
+    preload_models,
+)
+
+
+def read_memory_kb() -> dict:
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                fields[parts[0][:-1]] = int(parts[1])
+    return {
+        "rss_mb": fields.get("Rss", 0) / 1024,
+        "pss_mb": fields.get("Pss", 0) / 1024,
+        "private_mb": (fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0))
+        / 1024,
+    }
+
+
+def run_workers(model_name: str, workers: int, preload: bool) -> list:
+    model_registry.clear()
+    if preload:
+        preload_models([model_name])
+
+    workers_io = []
+    for _ in range(workers):
+        report_r, report_w = os.pipe()
+        go_r, go_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(report_r)
+            os.close(go_w)
+            pipeline = get_sentiment_pipeline(model_name)
+            if pipeline:
+                pipeline("Shares rallied after strong quarterly results")
+            os.write(report_w, b"r")
+            # Measure only once every sibling is alive so PSS reflects sharing
+            os.read(go_r, 1)
+            os.write(report_w, json.dumps(read_memory_kb()).encode())
+            os.close(report_w)
+            os._exit(0)
+        os.close(report_w)
+        os.close(go_r)
+        workers_io.append((pid, report_r, go_w))
+
+    for _, report_r, _ in workers_io:
+        os.read(report_r, 1)
+    for _, _, go_w in workers_io:
+        os.write(go_w, b"g")
+        os.close(go_w)
+
+    results = []
+    for pid, report_r, _ in workers_io:
+        with os.fdopen(report_r, "rb") as f:
+            results.append(json.loads(f.read()))
+        os.waitpid(pid, 0)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--model", default="distilbert-base-uncased-finetuned-sst-2-english"
+    )
+    args = parser.parse_args()
+
+    for preload in (False, True):
+        # Preloading happens in this process, so run each mode in a fresh child
+        pid = os.fork()
+        if pid == 0:
+            stats = run_workers(args.model, args.workers, preload)
+            label = "preloaded" if preload else "lazy"
+            for key in ("rss_mb", "pss_mb", "private_mb"):
+                values = [s[key] for s in stats]
+                print(
+                    f"{label:10s} {key:11s} per worker: "
+                    f"avg={sum(values) / len(values):8.1f}  max={max(values):8.1f}"
+                )
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+
+if __name__ == "__main__":
+    main()
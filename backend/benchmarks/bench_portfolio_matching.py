@@ -0,0 +1,113 @@
+# brandguard/backend/benchmarks/bench_portfolio_matching.py
+"""
+Matching one cycle of feed entries against N companies' keywords.
+
+"loop" is the per-company check collect_for_company applies to every entry
+(each keyword as a substring, company by company); "matcher" is the
+KeywordMatcher collect_for_portfolio builds once per cycle. Both must find
+the same companies. Latency is the best of --repeat runs; the matcher time
+includes building it.
+
+Usage:
+    cd backend && python -m benchmarks.bench_portfolio_matching --companies 10 100 1000
+"""
+import argparse
+import random
+import string
+import time
+
+from app.services.data_collectors.keyword_matcher import KeywordMatcher
+
+
+def generate_keywords(company_name: str):
+    # Same aliases as LegalNewsCollector._generate_keywords
+    return [
+        company_name,
+        company_name.lower(),
+        company_name.replace(" ", "+"),
+        company_name.replace("Inc", "").replace("Ltd", "").strip(),
+    ]
+
+
+def company_names(count: int, rng: random.Random):
+    suffixes = ["Inc", "Ltd", "Group", "Holdings", ""]
+    return [
+        " ".join(
+            filter(
+                None,
+                [
+                    "".join(rng.choice(string.ascii_letters) for _ in range(7)),
+                    rng.choice(suffixes),
+                ],
+            )
+        )
+        for _ in range(count)
+    ]
+
+
+def entries(names, count: int, rng: random.Random):
+    filler = "shares markets rose fell quarter results outlook deal".split()
+    texts = []
+    for _ in range(count):
+        words = [rng.choice(filler) for _ in range(40)]
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice(names))
+        texts.append(" ".join(words))
+    return texts
+
+
+def loop_match(keywords, texts):
+    matches = []
+    for text in texts:
+        lowered = text.lower()
+        matches.append(
+            {
+                company_id
+                for company_id, aliases in keywords.items()
+                if any(alias.lower() in lowered for alias in aliases)
+            }
+        )
+    return matches
+
+
+def matcher_match(keywords, texts):
+    matcher = KeywordMatcher(keywords)
+    return [matcher.match(text) for text in texts]
+
+
+def best_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--companies", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'companies':>9} {'loop ms':>9} {'matcher ms':>11} {'speedup':>8}")
+    for count in args.companies:
+        names = company_names(count, rng)
+        keywords = {i: generate_keywords(name) for i, name in enumerate(names)}
+        texts = entries(names, args.entries, rng)
+        assert loop_match(keywords, texts) == matcher_match(keywords, texts)
+
+        loop_ms = best_ms(lambda: loop_match(keywords, texts), args.repeat)
+        matcher_ms = best_ms(lambda: matcher_match(keywords, texts), args.repeat)
+        print(
+            f"{count:>9} {loop_ms:>9.1f} {matcher_ms:>11.1f} "
+            f"{loop_ms / matcher_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# brandguard/backend/benchmarks/bench_risk_scorer.py
+"""
+Latency and memory of RiskScoringEngine.calculate_risk_score at several data sizes.
+
+Compares the previous implementation (every Article and Review of the last 30
+days hydrated as ORM objects, factors computed in Python loops) with the
+grouped SQL aggregation. Peak memory is the tracemalloc peak of Python
+allocations during one call, measured in a separate run from the timing.
+
+By default a temporary SQLite file is used; pass --database-url to run against
+PostgreSQL with the migrations applied.
+
+Usage:
+    cd backend && python -m benchmarks.bench_risk_scorer --rows 1000 100000 1000000
+    cd backend && python -m benchmarks.bench_risk_scorer --legacy-max-rows 100000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.company import Company
+from app.models.sentiment import Article, Review
+from app.services.analyzers.risk_scorer import RiskScoringEngine
+
+MIGRATION = os.path.join(
+    os.path.dirname(__file__),
+    os.pardir,
+    "alembic",
+    "versions",
+    "004_risk_aggregation_indexes.sql",
+)
+CONTENT = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8
+
+
+def legacy_risk_factors(db, company_id: int) -> dict:
+    start_date = datetime.utcnow() - timedelta(days=30)
+    articles = (
+        db.query(Article)
+        .filter(Article.company_id == company_id, Article.created_at >= start_date)
+        .all()
+    )
+    reviews = (
+        db.query(Review)
+        .filter(Review.company_id == company_id, Review.created_at >= start_date)
+        .all()
+    )
+
+    score_map = {"positive": 1.0, "neutral": 0.5, "negative": 0.0}
+    sentiments = [(a.created_at, score_map.get(a.sentiment, 0.5)) for a in articles]
+    sentiments += [(r.created_at, r.rating / 5.0) for r in reviews]
+    sentiments.sort(key=lambda x: x[0])
+    df = pd.DataFrame(sentiments, columns=["date", "score"])
+    df["rolling_avg"] = df["score"].rolling(window=3).mean()
+
+    daily_counts = {}
+    for item in articles + reviews:
+        day = item.created_at.date()
+        daily_counts[day] = daily_counts.get(day, 0) + 1
+    counts = list(daily_counts.values())
+    np.std(counts) / np.mean(counts)
+
+    max(1 - a.confidence_score for a in articles if a.sentiment == "negative")
+
+    weekly_ratings = {}
+    for review in reviews:
+        week = review.created_at.isocalendar()[1]
+        weekly_ratings.setdefault(week, []).append(review.rating)
+    [np.mean(weekly_ratings[week]) for week in sorted(weekly_ratings)]
+
+    weights = {"negative": 1, "positive": -0.5}
+    return sum(
+        a.confidence_score * a.relevance_score * weights.get(a.sentiment, 0)
+        for a in articles
+    ) / len(articles)
+
+
+def seed(session, rows: int, rng: random.Random) -> int:
+    company = Company(name=f"bench-{rows}")
+    session.add(company)
+    session.flush()
+
+    now = datetime.utcnow()
+    window = 29 * 24 * 3600
+    article_rows = int(rows * 0.7)
+    for start in range(0, rows, 50_000):
+        articles, reviews = [], []
+        for i in range(start, min(rows, start + 50_000)):
+            created_at = now - timedelta(seconds=rng.randint(0, window))
+            if i < article_rows:
+                articles.append(
+                    {
+                        "company_id": company.id,
+                        "source_id": 1,
+                        "title": f"Article {i}",
+                        "content": CONTENT,
+                        "url": f"https://example.com/{rows}/{i}",
+                        "published_date": created_at,
+                        "sentiment": rng.choice(("positive", "negative", "neutral")),
+                        "confidence_score": rng.random(),
+                        "relevance_score": rng.random(),
+                        "keywords": [],
+                        "entities": [],
+                        "mention_count": 1,
+                        "created_at": created_at,
+                    }
+                )
+            else:
+                reviews.append(
+                    {
+                        "company_id": company.id,
+                        "platform": "trustpilot",
+                        "rating": rng.randint(1, 5),
+                        "content": CONTENT,
+                        "review_date": created_at,
+                        "created_at": created_at,
+                    }
+                )
+        if articles:
+            session.execute(insert(Article), articles)
+        if reviews:
+            session.execute(insert(Review), reviews)
+    session.commit()
+    return company.id
+
+
+def measure(fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1000, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[1_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--legacy-max-rows", type=int, default=1_000_000)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    url = args.database_url
+    if not url:
+        path = os.path.join(tempfile.mkdtemp(), "risk_bench.sqlite")
+        url = f"sqlite:///{path}"
+    engine = create_engine(url)
+    if not args.database_url:
+        Base.metadata.create_all(engine)
+        with open(MIGRATION) as f, engine.begin() as conn:
+            for statement in f.read().split(";"):
+                lines = [
+                    line for line in statement.splitlines() if not line.startswith("--")
+                ]
+                if "".join(lines).strip():
+                    conn.exec_driver_sql("\n".join(lines))
+    session = sessionmaker(bind=engine)()
+    rng = random.Random(42)
+
+    print(
+        f"{'rows':>9} {'legacy ms':>10} {'legacy MB':>10} {'sql ms':>8} {'sql MB':>7}"
+    )
+    for rows in args.rows:
+        company_id = seed(session, rows, rng)
+        scorer = RiskScoringEngine(session)
+
+        legacy_ms = legacy_mb = float("nan")
+        if rows <= args.legacy_max_rows:
+            legacy_ms, legacy_mb = measure(
+                lambda: legacy_risk_factors(session, company_id)
+            )
+            session.expunge_all()
+        sql_ms, sql_mb = measure(lambda: scorer.calculate_risk_score(company_id))
+        print(
+            f"{rows:>9} {legacy_ms:>10.1f} {legacy_mb:>10.1f} "
+            f"{sql_ms:>8.1f} {sql_mb:>7.2f}"
+        )
+
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# brandguard/backend/benchmarks/bench_sentiment.py
+"""
+Throughput comparison for SentimentAnalyzer: per-text loop vs batched inference,
+for each selected inference backend.
+
+Usage:
+    cd backend && python -m benchmarks.bench_sentiment --texts 2000 --batch-size 32
+    cd backend && python -m benchmarks.bench_sentiment --backend pytorch onnx onnx-int8
+"""
+import argparse
+import random
+import time
+
+from app.services.analyzers.sentiment_analyzer import SentimentAnalyzer
+
+WORDS = (
+    "company reports strong growth this quarter while investors worry about "
+    "a product recall and weak guidance after the merger announcement today "
+    "customers love the new release but support issues remain a problem"
+).split()
+
+
+def make_texts(count: int, seed: int = 42) -> list:
+    """Generate article-like texts with a realistic spread of lengths"""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 90)))
+        for _ in range(count)
+    ]
+
+
+def timed(fn, texts):
+    start = time.perf_counter()
+    fn(texts)
+    elapsed = time.perf_counter() - start
+    return elapsed, len(texts) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument(
+        "--model", default="distilbert-base-uncased-finetuned-sst-2-english"
+    )
+    parser.add_argument(
+        "--backend",
+        nargs="+",
+        default=["pytorch"],
+        choices=["pytorch", "onnx", "onnx-int8"],
+    )
+    args = parser.parse_args()
+    texts = make_texts(args.texts)
+
+    for backend in args.backend:
+        analyzer = SentimentAnalyzer(
+            model_name=args.model, batch_size=args.batch_size, backend=backend
+        )
+        if not analyzer.pipeline or analyzer.backend != backend:
+            print(f"[{backend}] model unavailable; skipped")
+            continue
+
+        analyzer.batch_analyze(texts[:64])  # warm up
+
+        loop_time, loop_rate = timed(lambda t: [analyzer.analyze(x) for x in t], texts)
+        batch_time, batch_rate = timed(analyzer.batch_analyze, texts)
+
+        print(f"[{backend}] texts={len(texts)} batch_size={args.batch_size}")
+        print(f"  loop    : {loop_time:8.2f}s  {loop_rate:10.1f} texts/s")
+        print(f"  batched : {batch_time:8.2f}s  {batch_rate:10.1f} texts/s")
+        print(f"  speedup : {loop_time / batch_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+# brandguard/backend/benchmarks/bench_suite.py
+"""
+Sentiment analyzer benchmark suite over synthetic article and review corpora.
+
+For every (kind, length, size) corpus and every target it records throughput,
+latency percentiles and peak RSS, and writes the results as JSON so runs can
+be compared. Targets:
+- analyze: one call per text (latency per text)
+- batch_analyze: calls over chunks of --chunk texts (latency per chunk)
+- simple_analyze: the lexicon path, one call per text
+
+Each case runs in a freshly spawned process, so peak RSS is not inflated by
+earlier cases. The suite runs offline: Hugging Face downloads are disabled and
+when the model is not cached locally analyze/batch_analyze fall back to the
+lexicon path, which is recorded as the "engine" of each result.
+
+Usage:
+    cd backend && python -m benchmarks.bench_suite --output bench-results.json
+    cd backend && python -m benchmarks.bench_suite --sizes 100 1000 \
+        --lengths short long --compare bench-baseline.json
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from benchmarks.corpora import KINDS, LENGTHS, make_corpus
+
+TARGETS = ("analyze", "batch_analyze", "simple_analyze")
+TINY_MODEL = "sshleifer/tiny-distilbert-base-uncased-finetuned-sst-2-english"
+
+
+def current_rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "p50": pick(0.50) * 1000,
+        "p95": pick(0.95) * 1000,
+        "p99": pick(0.99) * 1000,
+        "max": ordered[-1] * 1000,
+    }
+
+
+def run_case(case: Dict) -> Dict:
+    """Run one benchmark case; executed inside a spawned process"""
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+    logging.basicConfig(level=os.environ.get("BENCH_LOG_LEVEL", "ERROR"))
+
+    from app.services.analyzers.sentiment_analyzer import SentimentAnalyzer
+
+    analyzer = SentimentAnalyzer(
+        model_name=case["model"], batch_size=case["batch_size"]
+    )
+    texts = make_corpus(case["kind"], case["size"], case["length"], case["seed"])
+    target = case["target"]
+
+    if target == "analyze":
+        call, units = analyzer.analyze, texts
+    elif target == "simple_analyze":
+        call, units = analyzer._simple_analyze, texts
+    else:
+        chunk = case["chunk"]
+        call = analyzer.batch_analyze
+        units = [texts[i : i + chunk] for i in range(0, len(texts), chunk)]
+
+    for unit in units[: case["warmup"]]:
+        call(unit)
+
+    rss_before = current_rss_mb()
+    latencies = []
+    start = time.perf_counter()
+    for unit in units:
+        t0 = time.perf_counter()
+        call(unit)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+
+    engine = "simple" if target == "simple_analyze" else analyzer.model_version
+    return {
+        **{k: case[k] for k in ("kind", "length", "size", "target")},
+        "engine": engine,
+        "calls": len(units),
+        "seconds": elapsed,
+        "texts_per_second": len(texts) / elapsed if elapsed else None,
+        "latency_ms": percentiles(latencies),
+        "rss_before_mb": rss_before,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def _case_entry(case: Dict, queue) -> None:
+    try:
+        queue.put(run_case(case))
+    except Exception as exc:  # report instead of hanging the parent
+        queue.put({**case, "error": repr(exc)})
+
+
+def run_isolated(case: Dict, timeout: Optional[float]) -> Dict:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_case_entry, args=(case, queue))
+    process.start()
+    try:
+        return queue.get(timeout=timeout)
+    except Exception:
+        process.terminate()
+        return {**case, "error": "timeout"}
+    finally:
+        process.join()
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def case_key(result: Dict) -> tuple:
+    return (result["kind"], result["length"], result["size"], result["target"])
+
+
+def compare(baseline: Dict, current: Dict) -> None:
+    """Print throughput and p99 changes for cases present in both runs"""
+    previous = {case_key(r): r for r in baseline["results"] if "error" not in r}
+    print(f"\nvs {baseline['meta'].get('git_revision') or 'baseline'}:")
+    for result in current["results"]:
+        old = previous.get(case_key(result))
+        if not old or "error" in result:
+            continue
+        speedup = result["texts_per_second"] / old["texts_per_second"]
+        p99 = result["latency_ms"]["p99"] / old["latency_ms"]["p99"]
+        print(
+            "  {:<7} {:<6} {:>7} {:<14} throughput x{:.2f}  p99 x{:.2f}".format(
+                *case_key(result), speedup, p99
+            )
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--kinds", nargs="+", default=list(KINDS), choices=KINDS)
+    parser.add_argument(
+        "--lengths", nargs="+", default=list(LENGTHS), choices=list(LENGTHS)
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000])
+    parser.add_argument("--targets", nargs="+", default=list(TARGETS), choices=TARGETS)
+    parser.add_argument("--model", default=TINY_MODEL)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--chunk", type=int, default=256)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=1800)
+    parser.add_argument("--output", default="bench-results.json")
+    parser.add_argument("--compare", help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    results = []
+    for kind in args.kinds:
+        for length in args.lengths:
+            for size in args.sizes:
+                for target in args.targets:
+                    case = {
+                        "kind": kind,
+                        "length": length,
+                        "size": size,
+                        "target": target,
+                        "model": args.model,
+                        "batch_size": args.batch_size,
+                        "chunk": args.chunk,
+                        "warmup": args.warmup,
+                        "seed": args.seed,
+                    }
+                    result = run_isolated(case, args.timeout)
+                    results.append(result)
+                    if "error" in result:
+                        print(f"{case_key(result)} failed: {result['error']}")
+                        continue
+                    print(
+                        "{:<7} {:<6} {:>7} {:<14} {:>10.1f} texts/s  "
+                        "p50 {:.2f}ms  p99 {:.2f}ms  peak {:.0f}MB  [{}]".format(
+                            *case_key(result),
+                            result["texts_per_second"],
+                            result["latency_ms"]["p50"],
+                            result["latency_ms"]["p99"],
+                            result["peak_rss_mb"],
+                            result["engine"],
+                        )
+                    )
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "model": args.model,
+            "batch_size": args.batch_size,
+            "chunk": args.chunk,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nwrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
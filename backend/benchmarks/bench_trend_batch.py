@@ -0,0 +1,100 @@
+# brandguard/backend/benchmarks/bench_trend_batch.py
+"""
+Trend analysis for N companies: one request per company against one batch.
+
+Companies get a year of synthetic daily rollups for both source types.
+"loop" calls analyze_company_trends once per company, as the dashboard did
+with GET /companies/{id}/trends; "batch" is analyze_companies, used by
+POST /companies/trends:batch. Latency is the best of --repeat runs.
+
+Usage:
+    cd backend && python -m benchmarks.bench_trend_batch --companies 1 10 50 200
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.company import Company
+from app.models.sentiment import SentimentRollup
+from app.services.analyzers.trend_analyzer import TrendAnalyzer
+
+
+def seed(session, companies: int, rng: random.Random, days: int = 365):
+    today = datetime.utcnow().date()
+    ids = []
+    for _ in range(companies):
+        company = Company(name=f"Company {rng.random()}")
+        session.add(company)
+        session.flush()
+        ids.append(company.id)
+
+        rows = []
+        for offset in range(days):
+            for source_type in ("article", "review"):
+                count = rng.randint(1, 20)
+                scores = [rng.random() for _ in range(count)]
+                rows.append(
+                    {
+                        "company_id": company.id,
+                        "day": today - timedelta(days=offset),
+                        "source_type": source_type,
+                        "count": count,
+                        "score_sum": sum(scores),
+                        "score_sq_sum": sum(s * s for s in scores),
+                        "confidence_sum": 0.8 * count,
+                    }
+                )
+        session.execute(insert(SentimentRollup), rows)
+    session.commit()
+    return ids
+
+
+def best_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--companies", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "trend_batch_bench.sqlite")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    company_ids = seed(session, max(args.companies), random.Random(42))
+    analyzer = TrendAnalyzer(session)
+
+    print(f"{'companies':>9} {'loop ms':>9} {'batch ms':>9} {'batch ms/co':>12}")
+    for count in args.companies:
+        ids = company_ids[:count]
+        loop_ms = best_ms(
+            lambda: [analyzer.analyze_company_trends(i, args.days) for i in ids],
+            args.repeat,
+        )
+        batch_ms = best_ms(
+            lambda: analyzer.analyze_companies(ids, args.days), args.repeat
+        )
+        print(f"{count:>9} {loop_ms:>9.1f} {batch_ms:>9.1f} {batch_ms / count:>12.2f}")
+
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+# brandguard/backend/benchmarks/bench_trend_loader.py
+"""
+TrendAnalyzer before the daily sentiment rollups, and as it is now.
+
+The previous implementation hydrated every Article and Review as ORM
+objects, built a list of dicts and converted it to a DataFrame again in
+each helper; the current one reads one rollup row per day. Latency is the
+best of --repeat runs; allocations are the tracemalloc peak of one call. Outputs of both versions are compared,
+except predictions: the closed-form forecast adds intervals and no longer
+skips the first future step.
+
+Usage:
+    cd backend && python -m benchmarks.bench_trend_loader --rows 1000 10000 100000
+"""
+import argparse
+import math
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.sentiment import Article, Review
+from app.services.analyzers import sentiment_rollups
+from app.services.analyzers.trend_analyzer import TrendAnalyzer
+from benchmarks.bench_risk_scorer import seed
+
+
+class LegacyTrendAnalyzer(TrendAnalyzer):
+    """TrendAnalyzer as it was before the rollups: ORM rows and DataFrames"""
+
+    def analyze_company_trends(self, company_id: int, days: int = 90) -> Dict:
+        start_date = datetime.utcnow() - timedelta(days=days)
+        articles = (
+            self.db.query(Article)
+            .filter(Article.company_id == company_id, Article.created_at >= start_date)
+            .all()
+        )
+        reviews = (
+            self.db.query(Review)
+            .filter(Review.company_id == company_id, Review.created_at >= start_date)
+            .all()
+        )
+        mapping = {"positive": 1.0, "negative": 0.0, "neutral": 0.5}
+        data_points = [
+            {
+                "date": article.created_at.date(),
+                "sentiment_score": mapping.get(article.sentiment, 0.5),
+                "confidence": article.confidence_score,
+                "type": "article",
+            }
+            for article in articles
+        ] + [
+            {
+                "date": review.created_at.date(),
+                "sentiment_score": review.rating / 5.0,
+                "confidence": 0.8,
+                "type": "review",
+            }
+            for review in reviews
+        ]
+        trend_analysis = self._calculate_trend(data_points)
+        return {
+            "trend": trend_analysis["trend"],
+            "momentum": trend_analysis["momentum"],
+            "predictions": self._predict_future(data_points, days=30),
+            "seasonal_patterns": self._detect_seasonal_patterns(data_points),
+            "volatility": self._calculate_volatility(data_points),
+            "data_points": len(data_points),
+        }
+
+    def _calculate_trend(self, data_points: List[Dict]) -> Dict:
+        """
+        Calculate overall trend direction and momentum
+        """
+        if len(data_points) < 7:
+            return {"trend": "stable", "momentum": 0.0}
+
+        # Convert to DataFrame
+        df = pd.DataFrame(data_points)
+        df["date"] = pd.to_datetime(df["date"])
+        df = df.groupby("date")["sentiment_score"].mean().reset_index()
+
+        # Calculate moving averages
+        df["ma_7"] = df["sentiment_score"].rolling(window=7).mean()
+        df["ma_14"] = df["sentiment_score"].rolling(window=14).mean()
+        df["ma_30"] = df["sentiment_score"].rolling(window=30).mean()
+
+        # Determine trend
+        recent_ma = (
+            df["ma_7"].iloc[-1]
+            if not pd.isna(df["ma_7"].iloc[-1])
+            else df["sentiment_score"].iloc[-1]
+        )
+        older_ma = df["ma_7"].iloc[-8] if len(df) > 8 else df["sentiment_score"].iloc[0]
+
+        momentum = recent_ma - older_ma
+
+        if momentum > 0.1:
+            trend = "improving"
+        elif momentum < -0.1:
+            trend = "declining"
+        else:
+            trend = "stable"
+
+        return {
+            "trend": trend,
+            "momentum": momentum,
+            "recent_score": recent_ma,
+            "change_percentage": (momentum / older_ma) * 100 if older_ma > 0 else 0,
+        }
+
+    def _detect_seasonal_patterns(self, data_points: List[Dict]) -> List[Dict]:
+        """
+        Detect seasonal patterns in sentiment
+        """
+        if len(data_points) < 90:
+            return []
+
+        df = pd.DataFrame(data_points)
+        df["date"] = pd.to_datetime(df["date"])
+        df["day_of_week"] = df["date"].dt.dayofweek
+        df["month"] = df["date"].dt.month
+
+        # Weekly patterns
+        weekly_pattern = df.groupby("day_of_week")["sentiment_score"].mean()
+
+        # Monthly patterns
+        monthly_pattern = df.groupby("month")["sentiment_score"].mean()
+
+        patterns = []
+
+        days = [
+            "Monday",
+            "Tuesday",
+            "Wednesday",
+            "Thursday",
+            "Friday",
+            "Saturday",
+            "Sunday",
+        ]
+        for i, score in weekly_pattern.items():
+            if score > 0.6 or score < 0.4:
+                patterns.append(
+                    {
+                        "type": "weekly",
+                        "period": days[i],
+                        "score": score,
+                        "significance": "high" if abs(score - 0.5) > 0.2 else "medium",
+                    }
+                )
+
+        months = [
+            "Jan",
+            "Feb",
+            "Mar",
+            "Apr",
+            "May",
+            "Jun",
+            "Jul",
+            "Aug",
+            "Sep",
+            "Oct",
+            "Nov",
+            "Dec",
+        ]
+        for i, score in monthly_pattern.items():
+            if score > 0.6 or score < 0.4:
+                patterns.append(
+                    {
+                        "type": "monthly",
+                        "period": months[i - 1],
+                        "score": score,
+                        "significance": "high" if abs(score - 0.5) > 0.2 else "medium",
+                    }
+                )
+
+        return patterns
+
+    def _predict_future(self, data_points: List[Dict], days: int = 30) -> List[Dict]:
+        """
+        Predict future sentiment trends
+        """
+        if len(data_points) < 14:
+            return []
+
+        df = pd.DataFrame(data_points)
+        df["date"] = pd.to_datetime(df["date"])
+        df = df.groupby("date")["sentiment_score"].mean().reset_index()
+
+        # Prepare data for linear regression
+        X = np.arange(len(df)).reshape(-1, 1)
+        y = df["sentiment_score"].values
+
+        # Fit model
+        model = LinearRegression()
+        model.fit(X, y)
+
+        # Generate predictions
+        predictions = []
+        last_date = df["date"].max()
+
+        for i in range(1, days + 1):
+            future_date = last_date + timedelta(days=i)
+            X_future = np.array([[len(df) + i]])
+            predicted_score = model.predict(X_future)[0]
+
+            # Ensure score is between 0 and 1
+            predicted_score = max(0, min(1, predicted_score))
+
+            predictions.append(
+                {
+                    "date": future_date.strftime("%Y-%m-%d"),
+                    "predicted_score": float(predicted_score),
+                    "confidence": float(1 - abs(model.score(X, y))),
+                }
+            )
+
+        return predictions[:7]  # Return only next 7 days
+
+    def _calculate_volatility(self, data_points: List[Dict]) -> float:
+        """
+        Calculate sentiment volatility
+        """
+        if len(data_points) < 7:
+            return 0.0
+
+        scores = [dp["sentiment_score"] for dp in data_points]
+        return float(np.std(scores))
+
+
+def same_result(a, b) -> bool:
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same_result(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(map(same_result, a, b))
+    if isinstance(a, float) or isinstance(b, float):
+        return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-12) or (
+            math.isnan(a) and math.isnan(b)
+        )
+    return a == b
+
+
+def measure(fn, repeat: int):
+    best = min(_timed(fn) for _ in range(repeat))
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / (1024 * 1024)
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "trend_bench.sqlite")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    rng = random.Random(42)
+
+    print(
+        f"{'rows':>8} {'before ms':>10} {'before MB':>10} {'after ms':>9} {'after MB':>9}"
+    )
+    for rows in args.rows:
+        company_id = seed(session, rows, rng)
+        sentiment_rollups.rebuild(
+            session, (datetime.utcnow() - timedelta(days=365)).date(), company_id
+        )
+        session.commit()
+        before = LegacyTrendAnalyzer(session)
+        after = TrendAnalyzer(session)
+        expected = before.analyze_company_trends(company_id)
+        got = after.analyze_company_trends(company_id)
+        expected.pop("predictions")
+        got.pop("predictions")
+        if not same_result(expected, got):
+            print(f"{rows:>8} results differ")
+        session.expunge_all()
+
+        before_ms, before_mb = measure(
+            lambda: before.analyze_company_trends(company_id), args.repeat
+        )
+        session.expunge_all()
+        after_ms, after_mb = measure(
+            lambda: after.analyze_company_trends(company_id), args.repeat
+        )
+        print(
+            f"{rows:>8} {before_ms:>10.1f} {before_mb:>10.1f} "
+            f"{after_ms:>9.1f} {after_mb:>9.1f}"
+        )
+
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# brandguard/backend/benchmarks/corpora.py
+"""
+Deterministic synthetic corpora for the sentiment benchmarks.
+
+Two kinds of documents are generated:
+- article: a headline plus news-style sentences about a company
+- review: short first-person customer reviews with a star rating
+
+Each document is given a polarity (positive/negative/neutral) and a sentiment
+word density so the lexicon path and the model see a realistic mix instead of
+uniform noise. Lengths are drawn from the named buckets in LENGTHS.
+"""
+import random
+from typing import Dict, List, Tuple
+
+KINDS = ("article", "review")
+
+# (min_words, max_words) per document
+LENGTHS: Dict[str, Tuple[int, int]] = {
+    "short": (10, 40),
+    "medium": (80, 250),
+    "long": (600, 1200),
+}
+
+COMPANIES = [
+    "Acme Corp",
+    "Globex",
+    "Initech",
+    "Umbrella Holdings",
+    "Stark Industries",
+    "Wayne Enterprises",
+    "Hooli",
+    "Vandelay Imports",
+]
+
+POSITIVE = [
+    "good",
+    "great",
+    "excellent",
+    "amazing",
+    "positive",
+    "success",
+    "profit",
+    "growth",
+    "win",
+    "beneficial",
+    "strong",
+    "improved",
+    "record",
+    "reliable",
+    "love",
+]
+
+NEGATIVE = [
+    "bad",
+    "terrible",
+    "awful",
+    "negative",
+    "failure",
+    "loss",
+    "decline",
+    "lawsuit",
+    "scandal",
+    "fraud",
+    "recall",
+    "weak",
+    "broken",
+    "delay",
+    "complaint",
+]
+
+FILLER = (
+    "the company said on monday that its quarterly results and the outlook "
+    "for next year will depend on demand in europe and asia as analysts "
+    "expect the board to review the plan after meetings with regulators "
+    "customers and suppliers while the market watched shares move in early "
+    "trading and executives declined to comment further on the report"
+).split()
+
+REVIEW_FILLER = (
+    "i bought this for my family and used it every day for a month the "
+    "delivery came on time but the packaging was plain and the price seems "
+    "fair compared to other brands we tried before so overall it does the job"
+).split()
+
+HEADLINES = {
+    "positive": "{company} posts {word} quarter as growth beats forecasts",
+    "negative": "{company} faces {word} after regulators open inquiry",
+    "neutral": "{company} schedules annual meeting for shareholders",
+}
+
+
+def _sentence(
+    rng: random.Random, filler: List[str], polarity: str, density: float, words: int
+) -> List[str]:
+    noise = {"positive": NEGATIVE, "negative": POSITIVE}.get(
+        polarity, POSITIVE + NEGATIVE
+    )
+    out = []
+    for _ in range(words):
+        roll = rng.random()
+        if polarity != "neutral" and roll < density:
+            out.append(rng.choice(POSITIVE if polarity == "positive" else NEGATIVE))
+        elif roll < density * 1.2:
+            # A little noise from the opposite side, as real text has
+            out.append(rng.choice(noise))
+        else:
+            out.append(rng.choice(filler))
+    return out
+
+
+def make_document(rng: random.Random, kind: str, length: str) -> str:
+    """Generate a single document of the given kind and length bucket"""
+    if kind not in KINDS:
+        raise ValueError(f"Unknown corpus kind: {kind}")
+    low, high = LENGTHS[length]
+    total = rng.randint(low, high)
+    polarity = rng.choices(("positive", "negative", "neutral"), (4, 4, 2))[0]
+    density = rng.uniform(0.02, 0.08)
+    company = rng.choice(COMPANIES)
+
+    if kind == "article":
+        headline = HEADLINES[polarity].format(
+            company=company, word=rng.choice(POSITIVE + NEGATIVE)
+        )
+        parts = [headline + "."]
+        filler = FILLER
+    else:
+        stars = {"positive": 5, "negative": 1, "neutral": 3}[polarity]
+        parts = [f"{stars} stars for {company}."]
+        filler = REVIEW_FILLER
+
+    written = 0
+    while written < total:
+        size = min(rng.randint(8, 24), total - written)
+        words = _sentence(rng, filler, polarity, density, size)
+        parts.append(" ".join(words).capitalize() + ".")
+        written += size
+    return " ".join(parts)
+
+
+def make_corpus(
+    kind: str, size: int, length: str = "medium", seed: int = 42
+) -> List[str]:
+    """Generate ``size`` documents; the same arguments always give the same corpus"""
+    rng = random.Random(f"{kind}:{length}:{seed}")
+    return [make_document(rng, kind, length) for _ in range(size)]
@@ -0,0 +1,14 @@
+# brandguard/backend/gunicorn.conf.py
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+
+def on_starting(server):
+    """Load ML models in the master so forked workers share them copy-on-write"""
+    if os.getenv("PRELOAD_MODELS", "true").lower() in ("1", "true", "yes"):
+        from app.services.analyzers.model_registry import preload_models
+
+        preload_models()
@@ -63,3 +63,58 @@ async def db_session():
 @pytest.fixture
 def test_company():
     return {"id": 1, "name": "Test Company"}
+
+
+@pytest.fixture
+def sqlite_session():
+    """In-memory SQLite session with the ORM schema created."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.db.base import Base
+    import app.models.company  # noqa: F401 - registers tables
+    import app.models.sentiment  # noqa: F401 - registers tables
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def news_collector(monkeypatch):
+    """
+    news_collector module imported without spaCy or data.xml, with the
+    collector's stores built without Redis.
+    """
+    import importlib
+    import sys
+    import types
+
+    import defusedxml
+    import defusedxml.ElementTree as ET
+
+    def load(name):
+        raise OSError(f"{name} is not installed")
+
+    monkeypatch.setitem(sys.modules, "spacy", types.SimpleNamespace(load=load))
+    monkeypatch.setattr(ET, "parse", lambda source: None)
+    monkeypatch.setattr(defusedxml, "defuse_stdlib", lambda: None)
+    module = importlib.import_module("app.services.data_collectors.news_collector")
+
+    from app.services.analyzers.result_cache import ResultCache
+    from app.services.data_collectors.rate_limiter import TokenBucketLimiter
+
+    monkeypatch.setattr(module, "get_rate_limiter", TokenBucketLimiter)
+    monkeypatch.setattr(module, "get_result_cache", ResultCache)
+    for store in ("NearDuplicateDetector", "RiskStateStore", "SpikeDetectorStore"):
+        cls = getattr(module, store)
+        monkeypatch.setattr(cls, "from_settings", cls)
+    return module
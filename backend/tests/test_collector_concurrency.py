@@ -0,0 +1,258 @@
+# backend/tests/test_collector_concurrency.py
+import asyncio
+import random
+import string
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.models.company import Company, DataSource
+from app.services.data_collectors.concurrency import HostLimiter, gather_isolated
+from app.services.data_collectors.feed_cache import FeedCache
+from app.services.data_collectors.http_client import HttpClient
+
+GOOGLE_NEWS = "https://news.google.com/rss/search"
+WORDS = random.Random(7)
+
+
+def story(company="Acme Corp"):
+    """A distinct story, so copies on different feeds aren't folded together"""
+    words = (
+        "".join(WORDS.choice(string.ascii_lowercase) for _ in range(6))
+        for _ in range(8)
+    )
+    return f"{company} {' '.join(words)}"
+
+
+class FeedServer:
+    """Local stand-in for a slow RSS host that records concurrent requests."""
+
+    def __init__(self, titles=None, delay=0.2, status=200):
+        self.titles = titles
+        self.delay = delay
+        self.status = status
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.shared = None
+        app = web.Application()
+        app.router.add_get("/feed/{n}", self.feed)
+        self.server = TestServer(app)
+
+    def rss(self, n):
+        published = format_datetime(datetime.now(timezone.utc))
+        items = "".join(
+            f"<item><title>{title}</title>"
+            f"<link>{self.url(n)}/{i}</link>"
+            f"<description>{title} summary</description>"
+            f"<pubDate>{published}</pubDate></item>"
+            for i, title in enumerate(self.titles or [story()])
+        )
+        return (
+            f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'
+        )
+
+    async def feed(self, request):
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if self.shared is not None:
+            self.shared["now"] += 1
+            self.shared["max"] = max(self.shared["max"], self.shared["now"])
+        try:
+            await asyncio.sleep(self.delay)
+            return web.Response(
+                text=self.rss(request.match_info["n"]), status=self.status
+            )
+        finally:
+            self.in_flight -= 1
+            if self.shared is not None:
+                self.shared["now"] -= 1
+
+    def url(self, n=0):
+        return str(self.server.make_url(f"/feed/{n}"))
+
+
+@pytest_asyncio.fixture
+async def servers():
+    started = []
+
+    async def start(*new):
+        for server in new:
+            await server.server.start_server()
+        started.extend(new)
+        return new
+
+    yield start
+    for server in started:
+        await server.server.close()
+
+
+@pytest_asyncio.fixture
+async def client():
+    client = HttpClient(retries=0)
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def make_collector(news_collector, sqlite_session, client):
+    sqlite_session.add_all(
+        [Company(id=1, name="Acme Corp"), Company(id=2, name="Globex")]
+    )
+    sqlite_session.commit()
+
+    def make(urls, max_concurrency=10, max_per_host=2):
+        for i, url in enumerate(urls):
+            sqlite_session.add(
+                DataSource(
+                    name=f"source {i}", url=url, source_type="news", rate_limit=6000
+                )
+            )
+        sqlite_session.commit()
+        collector = news_collector.LegalNewsCollector(sqlite_session)
+        collector.feeds = FeedCache(client)
+        collector.fetch_limiter = HostLimiter(max_concurrency, max_per_host)
+        return collector
+
+    return make
+
+
+def article(url):
+    return {
+        "title": "Search result",
+        "content": "Search result summary",
+        "url": url,
+        "published_date": datetime(2026, 1, 5),
+        "author": "",
+        "source": "Google News",
+        "relevance_score": 0.5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_sources_are_collected_concurrently(servers, make_collector):
+    feeds = await servers(FeedServer(), FeedServer(), FeedServer())
+    collector = make_collector([feed.url() for feed in feeds])
+
+    started = time.perf_counter()
+    stored = await collector.collect_for_company(1, "Acme Corp")
+    elapsed = time.perf_counter() - started
+
+    assert sorted(a["url"] for a in stored) == sorted(f"{f.url()}/0" for f in feeds)
+    assert [feed.requests for feed in feeds] == [1, 1, 1]
+    # Three 0.2 s feeds: about 0.6 s one by one
+    assert elapsed < 0.45
+
+
+@pytest.mark.asyncio
+async def test_global_and_per_host_caps_hold(servers, make_collector):
+    shared = {"now": 0, "max": 0}
+    feeds = await servers(FeedServer(delay=0.05), FeedServer(delay=0.05))
+    for feed in feeds:
+        feed.shared = shared
+    collector = make_collector(
+        [feed.url(n) for feed in feeds for n in range(6)],
+        max_concurrency=3,
+        max_per_host=2,
+    )
+
+    stored = await collector.collect_for_company(1, "Acme Corp")
+
+    assert len(stored) == 12
+    assert [feed.max_in_flight for feed in feeds] == [2, 2]
+    assert shared["max"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failing_sources_are_isolated(servers, make_collector, caplog):
+    healthy, broken = await servers(FeedServer(delay=0.01), FeedServer(status=500))
+    collector = make_collector([healthy.url(), broken.url(), GOOGLE_NEWS])
+
+    async def unreachable(*args):
+        raise RuntimeError("search crashed")
+
+    collector._collect_google_news = unreachable
+    stored = await collector.collect_for_company(1, "Acme Corp")
+
+    assert [a["url"] for a in stored] == [f"{healthy.url()}/0"]
+    assert "Failed to collect from source 2: search crashed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_entries_of_a_failed_run_are_collected_again(servers, make_collector):
+    (feed,) = await servers(FeedServer(delay=0.01))
+    collector = make_collector([feed.url()])
+    store = collector._store_articles
+
+    def rolled_back(company_id, articles):
+        collector.db.rollback()
+        raise RuntimeError("database went away")
+
+    collector._store_articles = rolled_back
+    with pytest.raises(RuntimeError):
+        await collector.collect_for_company(1, "Acme Corp")
+
+    collector._store_articles = store
+    stored = await collector.collect_for_company(1, "Acme Corp")
+    assert [a["url"] for a in stored] == [f"{feed.url()}/0"]
+    # Processed now: an unchanged feed yields nothing more
+    assert await collector.collect_for_company(1, "Acme Corp") == []
+
+
+@pytest.mark.asyncio
+async def test_portfolio_matches_shared_feeds_and_keeps_searches_apart(
+    servers, make_collector, sqlite_session
+):
+    (feed,) = await servers(
+        FeedServer(
+            titles=(story("Acme Corp"), story("Globex"), story("Acme sues Globex")),
+            delay=0.01,
+        )
+    )
+    collector = make_collector([feed.url(), GOOGLE_NEWS])
+
+    async def search(keyword, days_back, consumer=None):
+        company = keyword.replace("+", " ").lower()
+        return [article(f"http://search.example.com/{company}")]
+
+    collector._search_google_news = search
+    companies = sqlite_session.query(Company).order_by(Company.id).all()
+    stored = await collector.collect_for_portfolio(companies)
+
+    urls = {
+        company_id: sorted(a["url"] for a in found)
+        for company_id, found in stored.items()
+    }
+    assert feed.requests == 1
+    assert urls == {
+        # "Acme sues Globex" mentions neither full alias of Acme Corp
+        1: [f"{feed.url()}/0", "http://search.example.com/acme corp"],
+        2: [f"{feed.url()}/1", f"{feed.url()}/2", "http://search.example.com/globex"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_gather_isolated_keeps_input_order(caplog):
+    async def after(delay, value):
+        await asyncio.sleep(delay)
+        return [value]
+
+    async def explode():
+        raise RuntimeError("parser crashed")
+
+    results = await gather_isolated(
+        [
+            ("slow", after(0.05, "slow")),
+            ("crashing", explode()),
+            ("fast", after(0, "fast")),
+        ]
+    )
+
+    assert results == [["slow"], [], ["fast"]]
+    assert "Failed to collect from crashing: parser crashed" in caplog.text
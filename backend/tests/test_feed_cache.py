@@ -0,0 +1,219 @@
+# backend/tests/test_feed_cache.py
+import feedparser
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services.data_collectors import feed_cache as feed_cache_module
+from app.services.data_collectors.feed_cache import (
+    FeedCache,
+    FeedConsumer,
+    restore_entry,
+    slim_entry,
+)
+from app.services.data_collectors.http_client import HttpClient
+
+
+def rss(*titles):
+    items = "".join(
+        f"<item><title>{title}</title><link>http://example.com/{i}</link>"
+        f"<description>{title} summary</description>"
+        f"<pubDate>Mon, 05 Jan 2026 10:0{i}:00 GMT</pubDate></item>"
+        for i, title in enumerate(titles)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'
+
+
+class FeedHost:
+    """Stand-in feed host: /etag honours If-None-Match, /plain ignores it."""
+
+    def __init__(self):
+        self.body = rss("Acme Corp wins contract", "Globex recalls widgets")
+        self.statuses = []
+        app = web.Application()
+        app.router.add_get("/etag", self.etag)
+        app.router.add_get("/plain", self.plain)
+        self.server = TestServer(app)
+
+    def tag(self):
+        return f'"{hash(self.body) & 0xFFFFFFFF:x}"'
+
+    async def etag(self, request):
+        if request.headers.get("If-None-Match") == self.tag():
+            self.statuses.append(304)
+            return web.Response(status=304)
+        self.statuses.append(200)
+        return web.Response(text=self.body, headers={"ETag": self.tag()})
+
+    async def plain(self, request):
+        self.statuses.append(200)
+        return web.Response(text=self.body)
+
+    def url(self, path):
+        return str(self.server.make_url(path))
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+
+@pytest_asyncio.fixture
+async def host():
+    server = FeedHost()
+    await server.server.start_server()
+    yield server
+    await server.server.close()
+
+
+@pytest_asyncio.fixture
+async def client():
+    client = HttpClient()
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    calls = []
+    parse = feedparser.parse
+
+    def counting_parse(body):
+        calls.append(body)
+        return parse(body)
+
+    monkeypatch.setattr(feed_cache_module.feedparser, "parse", counting_parse)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_not_modified_skips_parsing(host, client, parses):
+    cache = FeedCache(client)
+    first = await cache.entries(host.url("/etag"))
+    second = await cache.entries(host.url("/etag"))
+
+    assert host.statuses == [200, 304]
+    assert len(parses) == 1
+    assert second is first
+    assert [entry.title for entry in second] == [
+        "Acme Corp wins contract",
+        "Globex recalls widgets",
+    ]
+
+    host.body = rss("Initech files for bankruptcy")
+    third = await cache.entries(host.url("/etag"))
+    assert host.statuses[-1] == 200 and len(parses) == 2
+    assert third[0].title == "Initech files for bankruptcy"
+    assert cache.stats()["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unchanged_body_is_parsed_once(host, client, parses):
+    cache = FeedCache(client)
+    for _ in range(3):
+        entries = await cache.entries(host.url("/plain"))
+
+    assert host.statuses == [200, 200, 200]
+    assert len(parses) == 1
+    assert cache.stats()["memo_hits"] == 2
+    assert entries[1].link == "http://example.com/1"
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_shares_validators_between_workers(host, client, parses):
+    redis = FakeRedis()
+    await FeedCache(client, redis).entries(host.url("/etag"))
+
+    other_worker = FeedCache(client, redis)
+    entries = await other_worker.entries(host.url("/etag"))
+
+    assert host.statuses == [200, 304]
+    assert len(parses) == 1
+    assert entries[0].published_parsed.tm_min == 0
+    assert other_worker.stats()["redis_hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_local_tier_is_bounded_by_size(host, client):
+    cache = FeedCache(client, max_bytes=1000)
+    for i in range(10):
+        await cache.entries(host.url("/plain"), params={"q": str(i)})
+
+    stats = cache.stats()
+    assert stats["size_bytes"] <= 1000
+    assert stats["evictions"] > 0
+
+
+@pytest.mark.unit
+def test_slim_entries_keep_what_collectors_read():
+    parsed = feedparser.parse(
+        '<?xml version="1.0"?><rss version="2.0" '
+        'xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel>'
+        "<item><title>Acme &amp; Co</title><link>http://example.com/a</link>"
+        "<description>Short</description><author>ann@example.com</author>"
+        "<content:encoded><![CDATA[<p>Full text</p>]]></content:encoded>"
+        "<pubDate>Mon, 05 Jan 2026 10:30:00 GMT</pubDate></item>"
+        "</channel></rss>"
+    ).entries[0]
+    restored = restore_entry(slim_entry(parsed))
+
+    for field in ("title", "summary", "link", "published", "published_parsed"):
+        assert getattr(restored, field) == getattr(parsed, field)
+    assert restored.get("author", "") == parsed.get("author", "")
+    assert restored.content[0].value == parsed.content[0].value
+
+
+@pytest.mark.asyncio
+async def test_consumers_only_get_entries_they_have_not_processed(host, client, parses):
+    cache = FeedCache(client)
+    url = host.url("/etag")
+    acme, globex = FeedConsumer("company:1"), FeedConsumer("company:2")
+    first = await cache.entries(url, consumer=acme)
+    assert [entry.title for entry in first] == [
+        "Acme Corp wins contract",
+        "Globex recalls widgets",
+    ]
+    await cache.mark_delivered(acme)
+    # Unchanged feed (304): nothing to process
+    assert await cache.entries(url, consumer=acme) == []
+    assert cache.stats()["unchanged"] == 1
+    # Another consumer still gets the whole feed
+    assert len(await cache.entries(url, consumer=globex)) == 2
+
+    host.body = rss(
+        "Acme Corp wins contract",
+        "Globex recalls widgets",
+        "Initech files for bankruptcy",
+    )
+    changed = await cache.entries(url, consumer=acme)
+    assert [entry.title for entry in changed] == ["Initech files for bankruptcy"]
+    assert host.statuses == [200, 304, 304, 200]
+
+
+@pytest.mark.asyncio
+async def test_entries_not_marked_processed_are_given_again(host, client):
+    cache, consumer = FeedCache(client), FeedConsumer("company:1")
+    url = host.url("/etag")
+    assert len(await cache.entries(url, consumer=consumer)) == 2
+
+    # The run failed before storing: a new pass gets the same entries
+    retry = FeedConsumer("company:1")
+    assert len(await cache.entries(url, consumer=retry)) == 2
+    await cache.mark_delivered(retry)
+    assert retry.pending == []
+    assert await cache.entries(url, consumer=FeedConsumer("company:1")) == []
+
+
+@pytest.mark.asyncio
+async def test_unchanged_body_without_validators_is_skipped_too(host, client):
+    cache, consumer = FeedCache(client), FeedConsumer("portfolio:x")
+    assert len(await cache.entries(host.url("/plain"), consumer=consumer)) == 2
+    await cache.mark_delivered(consumer)
+    assert await cache.entries(host.url("/plain"), consumer=consumer) == []
@@ -0,0 +1,130 @@
+# backend/tests/test_forecasting.py
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from app.services.analyzers.forecasting import (
+    forecast,
+    grouped_linear_forecast,
+    holt_forecast,
+    linear_forecast,
+    t_quantile,
+)
+
+
+@pytest.mark.unit
+def test_linear_forecast_matches_ols_prediction_interval():
+    rng = np.random.default_rng(0)
+    y = 0.4 + 0.01 * np.arange(30) + rng.normal(0, 0.05, 30)
+
+    result = linear_forecast(y, horizon=7, level=0.95)
+
+    x = np.arange(30)
+    slope, intercept = np.polyfit(x, y, 1)
+    future = np.arange(30, 37)
+    assert result.mean == pytest.approx(intercept + slope * future)
+
+    residuals = y - (intercept + slope * x)
+    s = np.sqrt(np.sum(residuals**2) / 28)
+    se = s * np.sqrt(
+        1 + 1 / 30 + (future - x.mean()) ** 2 / np.sum((x - x.mean()) ** 2)
+    )
+    half_width = (result.upper - result.lower) / 2
+    # t(0.975, 28) = 2.0484
+    assert half_width == pytest.approx(2.0484 * se, rel=1e-3)
+    assert np.all(np.diff(half_width) > 0)
+    assert result.r_squared == pytest.approx(np.corrcoef(x, y)[0, 1] ** 2)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "p, dof, expected",
+    [(0.975, 5, 2.5706), (0.975, 12, 2.1788), (0.95, 30, 1.6973), (0.995, 60, 2.6603)],
+)
+def test_t_quantile_approximation(p, dof, expected):
+    assert t_quantile(p, dof) == pytest.approx(expected, abs=0.01)
+
+
+@pytest.mark.unit
+def test_holt_continues_a_linear_series():
+    y = 0.2 + 0.02 * np.arange(20)
+
+    result = holt_forecast(y, horizon=5)
+
+    assert result.mean == pytest.approx(0.2 + 0.02 * np.arange(20, 25))
+    assert result.upper - result.lower == pytest.approx(np.zeros(5), abs=1e-9)
+
+
+@pytest.mark.unit
+def test_holt_intervals_widen_and_clip():
+    rng = np.random.default_rng(1)
+    y = np.clip(0.9 + rng.normal(0, 0.1, 40), 0, 1)
+
+    result = forecast(y, 7, model="holt").clip(0, 1)
+
+    assert np.all(np.diff(result.upper - result.lower) >= 0)
+    assert result.upper.max() <= 1.0
+    with pytest.raises(ValueError):
+        forecast(y, 7, model="arima")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("alpha, beta", [(0.5, 0.1), (0.3, 0.6), (0.9, 0.9)])
+def test_holt_interval_matches_error_correction_variance(alpha, beta):
+    rng = np.random.default_rng(2)
+    y = 0.5 + np.cumsum(rng.normal(0, 0.05, 50))
+
+    result = holt_forecast(y, horizon=8, alpha=alpha, beta=beta)
+
+    # In error-correction form the h-step error is e_h + sum over j < h of
+    # (alpha + j * alpha * beta) * e_{h-j}
+    expected = np.sqrt(
+        [
+            1 + sum((alpha + j * alpha * beta) ** 2 for j in range(1, h))
+            for h in range(1, 9)
+        ]
+    )
+    half_width = (result.upper - result.lower) / 2
+    assert half_width / half_width[0] == pytest.approx(expected)
+
+
+@pytest.mark.unit
+def test_holt_handles_a_single_point(recwarn):
+    result = holt_forecast(np.array([0.4]), horizon=3)
+
+    assert result.mean == pytest.approx([0.4, 0.4, 0.4])
+    assert result.upper - result.lower == pytest.approx(np.zeros(3))
+    assert result.r_squared == 1.0
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+
+@pytest.mark.unit
+def test_trend_path_does_not_import_sklearn():
+    code = (
+        "import sys; import app.services.analyzers.trend_analyzer; "
+        "print('sklearn' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert output.stdout.strip() == "False"
+
+
+@pytest.mark.unit
+def test_grouped_linear_forecast_matches_each_series():
+    rng = np.random.default_rng(2)
+    series = [rng.random(size) for size in (20, 1, 2, 35)]
+    group = np.repeat(np.arange(4), [len(y) for y in series])
+
+    result = grouped_linear_forecast(np.concatenate(series), group, 5, horizon=7)
+
+    for i, y in enumerate(series):
+        single = linear_forecast(y, horizon=7)
+        assert result.mean[i] == pytest.approx(single.mean)
+        assert result.lower[i] == pytest.approx(single.lower)
+        assert result.r_squared[i] == pytest.approx(single.r_squared)
+    # A series without observations forecasts zeros
+    assert result.mean[4] == pytest.approx(np.zeros(7))
+    assert series[1][0] == pytest.approx(result.mean[1][0])
@@ -0,0 +1,163 @@
+# backend/tests/test_http_client.py
+import asyncio
+import threading
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services.data_collectors.financial_collector import FinancialDataCollector
+from app.services.data_collectors.http_client import HttpClient
+
+NEWS = {
+    "feed": [
+        {
+            "title": "Acme beats estimates",
+            "summary": "Shares rose",
+            "url": "http://example.com/acme",
+            "time_published": "20260105T143000",
+            "overall_sentiment_label": "Bullish",
+            "overall_sentiment_score": 0.4,
+        }
+    ]
+}
+
+
+class StandIn:
+    """Local server that fails the first `failures` requests with a 503."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.requests = []
+        app = web.Application()
+        app.router.add_get("/feed", self.feed)
+        app.router.add_get("/query", self.query)
+        self.server = TestServer(app)
+
+    async def feed(self, request):
+        self.requests.append(request)
+        if len(self.requests) <= self.failures:
+            return web.Response(status=503)
+        response = web.Response(text="<rss>" + "entry " * 500 + "</rss>")
+        response.enable_compression()
+        return response
+
+    async def query(self, request):
+        self.requests.append(request)
+        return web.json_response(NEWS)
+
+    def url(self, path="/feed"):
+        return str(self.server.make_url(path))
+
+    @property
+    def host(self):
+        return self.server.make_url("/").raw_authority
+
+
+@pytest_asyncio.fixture
+async def stand_in():
+    server = StandIn()
+    await server.server.start_server()
+    yield server
+    await server.server.close()
+
+
+@pytest.fixture
+def threaded_stand_in():
+    """StandIn on its own loop and thread, for clients that switch loops"""
+    loop, server = asyncio.new_event_loop(), StandIn()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.server.start_server(), loop).result()
+    yield server
+    asyncio.run_coroutine_threadsafe(server.server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused_and_latency_recorded(stand_in):
+    client = HttpClient()
+    try:
+        bodies = [await client.get_text(stand_in.url()) for _ in range(5)]
+    finally:
+        await client.close()
+
+    assert all(body.startswith("<rss>entry") for body in bodies)
+    stats = client.stats()
+    assert stats["connections_created"] == 1
+    assert stats["connection_reuse_ratio"] == pytest.approx(0.8)
+    host = stats["hosts"][stand_in.host]
+    assert host["requests"] == 5 and host["errors"] == 0
+    assert 0 < host["mean_latency_ms"] <= host["max_latency_ms"]
+
+
+@pytest.mark.asyncio
+async def test_responses_are_decompressed(stand_in):
+    client = HttpClient()
+    try:
+        body = await client.get_text(stand_in.url())
+    finally:
+        await client.close()
+
+    assert "gzip" in stand_in.requests[0].headers["Accept-Encoding"]
+    assert body.count("entry") == 500
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    server = StandIn(failures=2)
+    await server.server.start_server()
+    client, host = HttpClient(retries=2, backoff_seconds=0), server.host
+    try:
+        body = await client.get_text(server.url())
+        server.failures = 10
+        assert await client.get_text(server.url()) is None
+    finally:
+        await client.close()
+        await server.server.close()
+
+    assert body.startswith("<rss>")
+    stats = client.stats()["hosts"][host]
+    assert stats["retries"] == 4 and stats["errors"] == 4
+
+
+@pytest.mark.asyncio
+async def test_financial_collector_uses_the_shared_client(stand_in, monkeypatch):
+    monkeypatch.setenv("ALPHA_VANTAGE_API_KEY", "test")
+    collector = FinancialDataCollector()
+    collector.API_URL = stand_in.url("/query")
+    collector.http = HttpClient()
+    try:
+        news = await collector._get_financial_news("ACME")
+        await collector._get_financial_news("ACME")
+    finally:
+        await collector.http.close()
+
+    assert news[0]["title"] == "Acme beats estimates"
+    assert news[0]["sentiment"] == "positive"
+    assert stand_in.requests[0].query["tickers"] == "ACME"
+    assert collector.http.stats()["connections_reused"] == 1
+
+
+@pytest.mark.unit
+def test_session_of_an_earlier_loop_is_closed(threaded_stand_in):
+    client, url = HttpClient(), threaded_stand_in.url()
+    first = asyncio.new_event_loop()
+    try:
+        first.run_until_complete(client.get_text(url))
+        stopped = client._session
+        # The first loop is only stopped: the session is closed on it
+        asyncio.run(client.get_text(url))
+        assert stopped.closed
+    finally:
+        first.close()
+
+    # That run's loop is closed now: its session is dropped, not reused
+    gone = client._session
+    asyncio.run(client.get_text(url))
+    assert gone.closed
+    assert client.stats()["connections_created"] == 3
+    asyncio.run(client.close())
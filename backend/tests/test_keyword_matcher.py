@@ -0,0 +1,69 @@
+# backend/tests/test_keyword_matcher.py
+import random
+import re
+import string
+
+import pytest
+
+from app.services.data_collectors.keyword_matcher import KeywordMatcher, trie_pattern
+
+
+def per_company(keywords, text):
+    """The collector's per-company check: any keyword as a substring"""
+    text = text.lower()
+    return {
+        company_id
+        for company_id, aliases in keywords.items()
+        if any(alias.lower() in text for alias in aliases if alias)
+    }
+
+
+@pytest.mark.unit
+def test_trie_pattern_prefers_the_longest_word():
+    pattern = re.compile(trie_pattern(["acme", "acme corp", "ac", "globex"]))
+    assert pattern.match("acme corporation").group() == "acme corp"
+    assert pattern.match("acne").group() == "ac"
+    assert pattern.fullmatch("globex")
+    assert not pattern.match("glob")
+
+
+@pytest.mark.unit
+def test_overlapping_aliases_match_every_company():
+    matcher = KeywordMatcher(
+        {
+            1: ["Acme Corp", "acme corp"],
+            2: ["Acme"],
+            3: ["Corp Holdings"],
+            4: ["me c"],
+            5: ["Globex"],
+        }
+    )
+    assert matcher.match("ACME CORP HOLDINGS reports") == {1, 2, 3, 4}
+    assert matcher.match("Acme sues Globex") == {2, 5}
+    assert matcher.match("nothing here") == set()
+    assert KeywordMatcher({}).match("anything") == set()
+    # Empty aliases (a name that was only "Inc") match nothing
+    assert KeywordMatcher({6: [""]}).match("anything") == set()
+
+
+@pytest.mark.unit
+def test_matches_the_per_company_check():
+    rng = random.Random(11)
+    words = [
+        "".join(rng.choice("abcde") for _ in range(rng.randint(2, 6)))
+        for _ in range(300)
+    ]
+    keywords = {
+        i: [name, name.lower(), name.replace(" ", "+"), name.replace("Inc", "").strip()]
+        for i, name in enumerate(
+            f"{rng.choice(words)} {rng.choice(['Inc', 'Ltd', 'Co', ''])}".strip()
+            for _ in range(200)
+        )
+    }
+    matcher = KeywordMatcher(keywords)
+
+    for _ in range(200):
+        text = " ".join(
+            rng.choice(words + list(string.ascii_lowercase)) for _ in range(30)
+        )
+        assert matcher.match(text) == per_company(keywords, text)
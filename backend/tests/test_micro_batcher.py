@@ -0,0 +1,51 @@
+# backend/tests/test_micro_batcher.py
+import asyncio
+import threading
+
+import pytest
+
+from app.services.analyzers.micro_batcher import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_a_batch():
+    batches = []
+
+    def batch_fn(items):
+        batches.append((list(items), threading.current_thread().name))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=20)
+    results = await asyncio.gather(*(batcher.submit(n) for n in range(5)))
+    await batcher.aclose()
+
+    assert results == [0, 2, 4, 6, 8]
+    assert len(batches) == 1
+    assert batches[0][1].startswith("micro-batcher")
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_splits_and_keeps_order():
+    sizes = []
+
+    def batch_fn(items):
+        sizes.append(len(items))
+        return [str(item) for item in items]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=3, max_wait_ms=50)
+    results = await batcher.submit_many(list(range(7)))
+    await batcher.aclose()
+
+    assert results == [str(n) for n in range(7)]
+    assert sizes == [3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller():
+    def batch_fn(items):
+        raise ValueError("model crashed")
+
+    batcher = MicroBatcher(batch_fn, max_wait_ms=1)
+    with pytest.raises(ValueError):
+        await batcher.submit("text")
+    await batcher.aclose()
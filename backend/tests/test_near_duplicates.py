@@ -0,0 +1,116 @@
+# backend/tests/test_near_duplicates.py
+from app.services.data_collectors.near_duplicates import (
+    LSHIndex,
+    MinHasher,
+    NearDuplicateDetector,
+)
+
+STORY = (
+    "Acme Corp shares fell sharply on Tuesday after the company warned that "
+    "supply chain disruptions would weigh on fourth quarter revenue, analysts "
+    "said the guidance cut was larger than expected and several brokers "
+    "lowered their price targets following the announcement"
+)
+
+
+def test_syndicated_copy_is_detected_and_unrelated_story_is_not():
+    detector = NearDuplicateDetector()
+    detector.add(1, 101, detector.signature(STORY))
+
+    syndicated = STORY.replace("Tuesday", "Tuesday, Reuters reported") + " (AP)"
+    unrelated = "Globex opens a new research campus and hires 500 engineers"
+
+    assert detector.find_duplicate(1, detector.signature(syndicated)) == 101
+    assert detector.find_duplicate(1, detector.signature(unrelated)) is None
+    assert detector.find_duplicate(2, detector.signature(STORY)) is None
+
+
+def test_index_round_trips_and_expires():
+    hasher = MinHasher()
+    index = LSHIndex()
+    index.insert(7, hasher.signature(STORY), timestamp=1000.0)
+    index.insert(8, hasher.signature("something else entirely"), timestamp=5000.0)
+
+    restored = LSHIndex.from_bytes(index.to_bytes())
+    assert restored.query(hasher.signature(STORY)) == 7
+
+    restored.expire(older_than=2000.0)
+    assert len(restored) == 1
+    assert restored.query(hasher.signature(STORY)) is None
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """WATCH/MULTI stand-in; commands after multi() run on execute()."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def watch(self, *keys):
+        pass
+
+    def get(self, key):
+        return self.redis.get(key)
+
+    def multi(self):
+        pass
+
+    def setex(self, key, ttl, value):
+        self.pending.append((key, ttl, value))
+
+    def execute(self):
+        for command in self.pending:
+            self.redis.setex(*command)
+        self.pending = []
+
+
+def test_seen_urls_are_persisted_with_the_index():
+    redis = FakeRedis()
+    detector = NearDuplicateDetector(redis)
+    detector.add_url(1, "http://a.com/1")
+    detector.save(1)
+
+    restarted = NearDuplicateDetector(redis)
+    assert restarted.seen_url(1, "http://a.com/1")
+    assert not restarted.seen_url(2, "http://a.com/1")
+
+
+def test_concurrent_saves_keep_both_collectors_entries():
+    redis = FakeRedis()
+    first, second = NearDuplicateDetector(redis), NearDuplicateDetector(redis)
+    unrelated = "Globex opens a new research campus and hires 500 engineers"
+    # Both load the (empty) index before either saves
+    first.add(1, 101, first.signature(STORY))
+    first.add_url(1, "http://a.com/1")
+    second.add(1, 202, second.signature(unrelated))
+    second.add_url(1, "http://b.com/2")
+    first.save(1)
+    second.save(1)
+
+    restarted = NearDuplicateDetector(redis)
+    assert restarted.find_duplicate(1, restarted.signature(STORY)) == 101
+    assert restarted.find_duplicate(1, restarted.signature(unrelated)) == 202
+    assert restarted.seen_url(1, "http://a.com/1")
+    assert restarted.seen_url(1, "http://b.com/2")
+    # The second saver now sees the first one's entry too
+    assert second.find_duplicate(1, second.signature(STORY)) == 101
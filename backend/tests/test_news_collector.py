@@ -0,0 +1,89 @@
+# backend/tests/test_news_collector.py
+from datetime import datetime
+
+import pytest
+
+from app.models.company import Company, DataSource
+from app.models.sentiment import Article
+
+STORY = (
+    "Acme Corp shares fell sharply on Tuesday after the company warned that "
+    "supply chain disruptions would weigh on fourth quarter revenue, analysts "
+    "said the guidance cut was larger than expected"
+)
+
+
+def article(url, content=STORY):
+    return {
+        "title": "Acme Corp warns on revenue",
+        "content": content,
+        "url": url,
+        "published_date": datetime(2026, 1, 5, 10, 0),
+        "author": "",
+        "source": "Reuters Business",
+        "relevance_score": 0.5,
+    }
+
+
+@pytest.fixture
+def collector(news_collector, sqlite_session):
+    sqlite_session.add(Company(id=1, name="Acme Corp"))
+    source = DataSource(id=1, name="Reuters Business", url="https://feeds.reuters.com")
+    sqlite_session.add(source)
+    sqlite_session.commit()
+    return news_collector.LegalNewsCollector(sqlite_session), source
+
+
+@pytest.mark.unit
+def test_reingested_article_is_not_counted_as_a_mention(collector):
+    collector, source = collector
+    first = collector._store_articles(1, [(source, article("http://a.com/1"))])
+    # The next poll returns the same item, once per keyword variant
+    again = collector._store_articles(
+        1, [(source, article("http://a.com/1")), (source, article("http://a.com/1"))]
+    )
+
+    assert len(first) == 1 and again == []
+    assert collector.db.query(Article).one().mention_count == 1
+
+
+@pytest.mark.unit
+def test_syndicated_copy_is_folded_once(collector):
+    collector, source = collector
+    collector._store_articles(1, [(source, article("http://a.com/1"))])
+    copy = article("http://b.com/acme", STORY + " (AP)")
+    collector._store_articles(1, [(source, copy)])
+    collector._store_articles(1, [(source, copy), (source, article("http://a.com/1"))])
+
+    stored = collector.db.query(Article).one()
+    assert stored.url == "http://a.com/1"
+    assert stored.mention_count == 2
+
+
+@pytest.mark.unit
+def test_new_articles_are_scored_in_one_batch(collector, news_collector, monkeypatch):
+    collector, source = collector
+    batches = []
+
+    def analyze_sentiments(texts):
+        batches.append(texts)
+        return [
+            {"sentiment": "negative", "confidence": 0.9, "model": "test"} for _ in texts
+        ]
+
+    monkeypatch.setattr(news_collector, "analyze_sentiments", analyze_sentiments)
+    other = "Globex opened a new plant in Ohio, adding four hundred jobs this year"
+    stored = collector._store_articles(
+        1,
+        [
+            (source, article("http://a.com/1")),
+            # Copy of the first within the same batch: folded, not scored
+            (source, article("http://b.com/acme", STORY + " (AP)")),
+            (source, article("http://a.com/2", other)),
+        ],
+    )
+
+    assert batches == [[STORY, other]]
+    assert [a["sentiment"] for a in stored] == ["negative", "negative"]
+    first = collector.db.query(Article).filter_by(url="http://a.com/1").one()
+    assert first.mention_count == 2 and first.sentiment_model == "test"
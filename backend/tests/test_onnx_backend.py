@@ -0,0 +1,35 @@
+# backend/tests/test_onnx_backend.py
+from pathlib import Path
+
+import pytest
+
+CORPUS = Path(__file__).parent / "fixtures" / "sentiment_corpus.txt"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("backend", ["onnx", "onnx-int8"])
+def test_onnx_labels_agree_with_pytorch(backend):
+    """ONNX Runtime backends must label the fixture corpus like PyTorch."""
+    pytest.importorskip("optimum.onnxruntime")
+    transformers = pytest.importorskip("transformers")
+    if not hasattr(transformers, "AutoTokenizer"):
+        pytest.skip("transformers is mocked in this session")
+
+    from app.services.analyzers.onnx_backend import check_label_agreement
+    from app.services.analyzers.sentiment_analyzer import SentimentAnalyzer
+
+    reference = SentimentAnalyzer(backend="pytorch")
+    if reference.pipeline is None:
+        pytest.skip("PyTorch model unavailable")
+
+    candidate = SentimentAnalyzer(backend=backend)
+    if candidate.backend != backend:
+        pytest.skip("ONNX export unavailable; the analyzer fell back to PyTorch")
+
+    texts = CORPUS.read_text().splitlines()
+    report = check_label_agreement(
+        texts, reference.batch_analyze, candidate.batch_analyze
+    )
+
+    min_agreement = 1.0 if backend == "onnx" else 0.9
+    assert report["agreement"] >= min_agreement, report["mismatches"]
@@ -0,0 +1,84 @@
+# backend/tests/test_portfolio_risk.py
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.company import Company
+from app.services.analyzers.portfolio_risk import PortfolioRiskScorer
+from app.services.analyzers.risk_scorer import RiskScoringEngine
+from tests.test_risk_scorer import seed_company
+
+PORTFOLIO = [(0, 0), (3, 1), (40, 0), (0, 25), (120, 60), (15, 9)]
+
+
+def seed_portfolio(session):
+    companies = [
+        seed_company(session, articles, reviews, seed)
+        for seed, (articles, reviews) in enumerate(PORTFOLIO, start=1)
+    ]
+    inactive = seed_company(session, 30, 30, 99)
+    inactive.is_active = False
+    session.commit()
+    return [company.id for company in companies], inactive.id
+
+
+def assert_same_result(batch, single):
+    assert batch["score"] == pytest.approx(single["score"])
+    assert batch["risk"] == single["risk"]
+    if single["factors"] == ["Insufficient data"]:
+        assert batch["factors"] == single["factors"]
+        return
+    for got, expected in zip(batch["factors"], single["factors"]):
+        assert got["name"] == expected["name"]
+        assert got["score"] == pytest.approx(expected["score"])
+        assert got["severity"] == expected["severity"]
+
+
+@pytest.mark.unit
+def test_batch_matches_per_company_scores(sqlite_session):
+    company_ids, inactive_id = seed_portfolio(sqlite_session)
+
+    results = PortfolioRiskScorer(sqlite_session).score()
+
+    assert sorted(results) == company_ids
+    engine = RiskScoringEngine(sqlite_session)
+    for company_id in company_ids:
+        assert_same_result(results[company_id], engine.calculate_risk_score(company_id))
+
+
+@pytest.mark.unit
+def test_run_bulk_updates_companies(sqlite_session):
+    company_ids, inactive_id = seed_portfolio(sqlite_session)
+
+    assert PortfolioRiskScorer(sqlite_session).run() == len(company_ids)
+
+    engine = RiskScoringEngine(sqlite_session)
+    for company_id in company_ids:
+        company = sqlite_session.get(Company, company_id)
+        sqlite_session.refresh(company)
+        expected = engine.calculate_risk_score(company_id)
+        assert company.risk_score == pytest.approx(expected["score"])
+        assert len(company.risk_factors) == len(expected["factors"])
+    assert sqlite_session.get(Company, inactive_id).risk_score == 0.0
+
+
+@pytest.mark.integration
+def test_process_pool_matches_single_pass(tmp_path):
+    url = f"sqlite:///{tmp_path / 'portfolio.sqlite'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        seed_portfolio(session)
+        single = PortfolioRiskScorer(session).score()
+        pooled = PortfolioRiskScorer(
+            session, workers=2, chunk_size=2, database_url=url
+        ).score()
+    finally:
+        session.close()
+        engine.dispose()
+
+    assert sorted(pooled) == sorted(single)
+    for company_id, result in single.items():
+        assert_same_result(pooled[company_id], result)
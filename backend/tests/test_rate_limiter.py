@@ -0,0 +1,157 @@
+# backend/tests/test_rate_limiter.py
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.data_collectors.rate_limiter import TokenBucketLimiter, take_token
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptRedis:
+    """
+    Stand-in for Redis running TAKE_SCRIPT: the bucket hash is stored here
+    and the script body is replaced by take_token, its Python twin.
+    """
+
+    def __init__(self):
+        self.hashes = {}
+        self.calls = 0
+
+    def register_script(self, script):
+        def run(keys, args):
+            self.calls += 1
+            rate, capacity, now = (float(arg) for arg in args)
+            state = self.hashes.setdefault(keys[0], [capacity, now])
+            return str(take_token(state, rate, capacity, now))
+
+        return run
+
+
+class BrokenRedis:
+    def register_script(self, script):
+        def run(keys, args):
+            raise ConnectionError("redis down")
+
+        return run
+
+
+@pytest.mark.unit
+def test_burst_then_exact_spacing():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(burst=3, clock=clock)
+
+    waits = [limiter.reserve("feeds.example.com", 60) for _ in range(5)]
+    assert waits == [0, 0, 0, pytest.approx(1.0), pytest.approx(2.0)]
+
+    # Ten idle seconds refill the bucket to its burst, not beyond
+    clock.now += 10
+    waits = [limiter.reserve("feeds.example.com", 60) for _ in range(4)]
+    assert waits == [0, 0, 0, pytest.approx(1.0)]
+
+
+@pytest.mark.unit
+def test_buckets_are_keyed_by_host_not_rate():
+    limiter = TokenBucketLimiter(burst=1, clock=FakeClock())
+    assert limiter.reserve("feeds.bbci.co.uk", 30) == 0
+    # Same rate, different host: its own bucket
+    assert limiter.reserve("feeds.a.dj.com", 30) == 0
+    assert limiter.reserve("feeds.bbci.co.uk", 30) == pytest.approx(2.0)
+
+
+@pytest.mark.unit
+def test_invalid_rate_is_rejected():
+    with pytest.raises(ValueError):
+        TokenBucketLimiter().reserve("host", 0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_sleep_once_each_for_the_exact_wait():
+    clock, sleeps = FakeClock(), []
+
+    async def sleep(seconds):
+        # All callers arrive before any of them wakes up
+        sleeps.append(seconds)
+        await asyncio.sleep(0)
+
+    limiter = TokenBucketLimiter(burst=2, clock=clock, sleep=sleep)
+    waits = await asyncio.gather(*(limiter.acquire("host", 120) for _ in range(5)))
+
+    assert waits == [0, 0, pytest.approx(0.5), pytest.approx(1.0), pytest.approx(1.5)]
+    # One sleep per waiting caller, for exactly its wait: no polling
+    assert sleeps == waits[2:]
+
+
+@pytest.mark.unit
+def test_redis_buckets_are_shared_between_processes():
+    redis, clock = ScriptRedis(), FakeClock()
+    worker_a = TokenBucketLimiter(redis, burst=2, clock=clock)
+    worker_b = TokenBucketLimiter(redis, burst=2, clock=clock)
+
+    assert worker_a.reserve("news.google.com", 30) == 0
+    assert worker_b.reserve("news.google.com", 30) == 0
+    assert worker_a.reserve("news.google.com", 30) == pytest.approx(2.0)
+    assert worker_b.reserve("news.google.com", 30) == pytest.approx(4.0)
+    assert redis.calls == 4
+    assert list(redis.hashes) == ["rate_limit:v1:news.google.com"]
+
+
+class HangingRedis:
+    """Redis that never answers until released"""
+
+    def __init__(self):
+        self.released = threading.Event()
+
+    def register_script(self, script):
+        def run(keys, args):
+            self.released.wait(5)
+            raise ConnectionError("redis timed out")
+
+        return run
+
+
+@pytest.mark.unit
+def test_redis_failure_falls_back_to_local_buckets():
+    limiter = TokenBucketLimiter(BrokenRedis(), burst=1, clock=FakeClock())
+    assert limiter.reserve("host", 60) == 0
+    assert limiter.reserve("host", 60) == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_acquire_does_not_block_the_loop_on_redis():
+    redis = ScriptRedis()
+    limiter = TokenBucketLimiter(redis, burst=1, clock=FakeClock())
+    assert await limiter.acquire("host", 60) == 0
+    assert redis.calls == 1
+
+    hanging = HangingRedis()
+    limiter = TokenBucketLimiter(
+        hanging, burst=1, clock=FakeClock(), redis_timeout=0.05
+    )
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    try:
+        # Gives up on Redis after redis_timeout and uses the local bucket
+        assert await limiter.acquire("host", 60) == 0
+    finally:
+        task.cancel()
+        hanging.released.set()
+    assert time.perf_counter() - started < 1
+    # The loop kept running while Redis hung
+    assert ticks > 3
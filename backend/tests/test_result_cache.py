@@ -0,0 +1,167 @@
+# backend/tests/test_result_cache.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.analyzers import sentiment_rollups
+from app.services.analyzers.result_cache import ResultCache
+from app.services.analyzers.risk_scorer import RiskScoringEngine
+from app.services.analyzers.trend_analyzer import TrendAnalyzer
+from tests.test_risk_scorer import seed_company
+from tests.test_risk_state import add_rows
+
+
+class FakeRedis:
+    """In-memory stand-in for the string commands the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.calls = []
+
+    def mget(self, keys):
+        self.calls.append("mget")
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        self.calls.append("delete")
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    def execute(self):
+        self.redis.calls.append("pipeline")
+        return [
+            getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+class BrokenRedis:
+    def __getattr__(self, name):
+        raise ConnectionError("redis down")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+def test_unchanged_company_costs_one_mget():
+    redis, clock = FakeRedis(), FakeClock()
+    cache = ResultCache(redis, clock=clock)
+    calls = []
+
+    def compute(missing):
+        calls.append(list(missing))
+        return {company_id: {"score": company_id} for company_id in missing}
+
+    first = cache.get_or_compute_many("risk", [1, 2], "w", compute)
+    assert first[1] == {"score": 1, "cache": {"hit": False, "age_seconds": None}}
+
+    clock.now += 30
+    redis.calls.clear()
+    second = cache.get_or_compute_many("risk", [1, 2], "w", compute)
+
+    assert redis.calls == ["mget"]
+    assert calls == [[1, 2]]
+    assert second[2] == {"score": 2, "cache": {"hit": True, "age_seconds": 30.0}}
+    stats = cache.stats()
+    assert stats["hit_ratio"] == pytest.approx(0.5)
+    assert stats["max_hit_age_seconds"] == pytest.approx(30.0)
+
+
+@pytest.mark.unit
+def test_invalidation_during_compute_is_never_served():
+    cache = ResultCache(FakeRedis())
+    version = {"value": 1}
+
+    def compute(missing):
+        result = {company_id: {"value": version["value"]} for company_id in missing}
+        # New data is committed while the old result is being computed
+        version["value"] = 2
+        cache.invalidate([1])
+        return result
+
+    assert cache.get_or_compute("trends", 1, "w", lambda: compute([1])[1])["value"] == 1
+    again = cache.get_or_compute("trends", 1, "w", lambda: {"value": version["value"]})
+    assert again == {"value": 2, "cache": {"hit": False, "age_seconds": None}}
+    assert cache.stats()["stale"] == 1
+
+
+@pytest.mark.unit
+def test_errors_are_not_cached_and_redis_failures_compute():
+    cache = ResultCache(FakeRedis())
+    cache.get_or_compute("risk", 5, "w", lambda: {"error": "Company not found"})
+    result = cache.get_or_compute("risk", 5, "w", lambda: {"error": "again"})
+    assert result["error"] == "again"
+
+    broken = ResultCache(BrokenRedis())
+    assert broken.get_or_compute("risk", 5, "w", lambda: {"score": 1}) == {"score": 1}
+    assert broken.stats()["errors"] == 1
+
+
+@pytest.mark.unit
+def test_trends_refresh_after_ingest(sqlite_session):
+    company = seed_company(sqlite_session, 60, 20, seed=61)
+    other = seed_company(sqlite_session, 40, 10, seed=62)
+    sentiment_rollups.rebuild(
+        sqlite_session, (datetime.utcnow() - timedelta(days=90)).date()
+    )
+    sqlite_session.commit()
+    cache = ResultCache(FakeRedis())
+    analyzer = TrendAnalyzer(sqlite_session, result_cache=cache)
+
+    before = analyzer.analyze_companies([company.id, other.id])
+    assert analyzer.analyze_companies([company.id, other.id])[other.id]["cache"]["hit"]
+
+    articles, reviews = add_rows(sqlite_session, company.id, 3, datetime.utcnow())
+    sentiment_rollups.record_articles(sqlite_session, articles)
+    sentiment_rollups.record_reviews(sqlite_session, reviews)
+    sqlite_session.commit()
+    cache.invalidate([company.id])
+
+    after = analyzer.analyze_companies([company.id, other.id])
+    assert not after[company.id]["cache"]["hit"]
+    assert after[company.id]["data_points"] == before[company.id]["data_points"] + 4
+    assert after[other.id]["cache"]["hit"]
+
+
+@pytest.mark.unit
+def test_cached_risk_score_matches_uncached(sqlite_session):
+    company = seed_company(sqlite_session, 80, 30, seed=63)
+    cached = RiskScoringEngine(sqlite_session, result_cache=ResultCache(FakeRedis()))
+
+    cached.calculate_risk_score(company.id)
+    result = cached.calculate_risk_score(company.id)
+
+    assert result.pop("cache")["hit"]
+    expected = RiskScoringEngine(sqlite_session).calculate_risk_score(company.id)
+    assert result.pop("last_updated") <= expected.pop("last_updated")
+    assert result == expected
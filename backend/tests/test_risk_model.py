@@ -0,0 +1,110 @@
+# backend/tests/test_risk_model.py
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.analyzers.model_registry import model_registry
+from app.services.analyzers.portfolio_risk import PortfolioRiskScorer
+from app.services.analyzers.risk_model import (
+    RiskModel,
+    build_training_set,
+    latest_artifact,
+    load_risk_model,
+    save_artifact,
+    train,
+)
+from app.services.analyzers.risk_scorer import FACTOR_NAMES, RiskScoringEngine
+from tests.test_risk_scorer import seed_company
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    model_registry.clear()
+    yield
+    model_registry.clear()
+
+
+def synthetic_training_set(rows=200, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.random((rows, len(FACTOR_NAMES))), columns=FACTOR_NAMES)
+    X["as_of"] = np.repeat(pd.date_range("2024-01-01", periods=10), rows // 10)
+    y = pd.Series(X[FACTOR_NAMES].sum(axis=1) * 20)
+    return X, y
+
+
+@pytest.mark.unit
+def test_artifact_round_trip_and_batch_predict(tmp_path):
+    X, y = synthetic_training_set()
+    artifact = train(X, y)
+    assert artifact["metrics"]["validation_rows"] == 40
+
+    path = save_artifact(artifact, str(tmp_path))
+    assert latest_artifact(str(tmp_path)) == path
+
+    model = load_risk_model(str(tmp_path))
+    assert isinstance(model, RiskModel)
+    assert model.version == artifact["version"]
+    # Loaded once per process
+    assert load_risk_model(str(tmp_path)) is model
+
+    scores = model.predict(X.head(50))
+    assert scores.shape == (50,)
+    assert np.all((scores >= 0) & (scores <= 100))
+    assert np.corrcoef(scores, y.head(50))[0, 1] > 0.9
+
+
+@pytest.mark.unit
+def test_weighted_sum_fallback_without_artifact(sqlite_session, tmp_path):
+    assert load_risk_model(str(tmp_path)) is None
+
+    engine = RiskScoringEngine(sqlite_session, risk_model=None)
+    factors = pd.DataFrame([dict.fromkeys(FACTOR_NAMES, 0.5)])
+    assert engine.weighted_scores(factors)[0] == pytest.approx(50.0)
+    assert engine.forecast_scores(factors) is None
+    assert engine.build_result(dict.fromkeys(FACTOR_NAMES, 0.5))["forecast"] is None
+
+
+@pytest.mark.unit
+def test_trained_model_is_a_forecast_beside_the_current_score(sqlite_session, tmp_path):
+    X, y = synthetic_training_set()
+    save_artifact(train(X, y, horizon_days=14), str(tmp_path))
+    model = load_risk_model(str(tmp_path))
+    companies = [seed_company(sqlite_session, 40, 20, seed) for seed in (21, 22)]
+
+    engine = RiskScoringEngine(sqlite_session, risk_model=model)
+    portfolio = PortfolioRiskScorer(sqlite_session)
+    portfolio.engine = engine
+    batch = portfolio.score()
+
+    for company in companies:
+        single = engine.calculate_risk_score(company.id)
+        factors = pd.DataFrame(
+            [{factor["name"]: factor["score"] for factor in single["factors"]}]
+        )
+        # The current score stays the weighted sum; the model only forecasts
+        assert single["score"] == pytest.approx(engine.weighted_scores(factors)[0])
+        assert single["forecast"] == {
+            "score": pytest.approx(model.predict(factors)[0]),
+            "horizon_days": 14,
+            "model_version": model.version,
+        }
+        assert batch[company.id]["score"] == pytest.approx(single["score"])
+        assert batch[company.id]["forecast"] == single["forecast"]
+
+
+@pytest.mark.unit
+def test_build_training_set_from_history(sqlite_session):
+    for seed in (31, 32, 33):
+        seed_company(sqlite_session, 150, 50, seed)
+
+    X, y = build_training_set(
+        sqlite_session, history_days=21, step_days=7, horizon_days=7
+    )
+
+    assert list(X.columns) == FACTOR_NAMES + ["as_of"]
+    assert len(X) == len(y) > 0
+    assert X["as_of"].nunique() == 3
+    assert y.between(0, 100).all()
+    assert X["as_of"].max() <= datetime.utcnow() - timedelta(days=7)
@@ -0,0 +1,154 @@
+# backend/tests/test_risk_scorer.py
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.models.company import Company
+from app.models.sentiment import Article, Review
+from app.services.analyzers.risk_scorer import RiskScoringEngine
+
+
+def reference_factors(articles, reviews):
+    """Row-by-row factor computation the SQL aggregation has to reproduce"""
+    score_map = {"positive": 1.0, "neutral": 0.5, "negative": 0.0}
+    sentiments = [(a.created_at, score_map.get(a.sentiment, 0.5)) for a in articles]
+    sentiments += [(r.created_at, r.rating / 5.0) for r in reviews]
+    trend = 0.0
+    if len(sentiments) >= 5:
+        sentiments.sort(key=lambda x: x[0])
+        rolling = pd.Series([s for _, s in sentiments]).rolling(window=3).mean()
+        trend = (0.5 - (rolling.iloc[-1] - rolling.dropna().iloc[0])) * 2
+
+    volatility = 0.0
+    items = articles + reviews
+    daily = {}
+    for item in items:
+        daily[item.created_at.date()] = daily.get(item.created_at.date(), 0) + 1
+    if len(items) >= 7 and len(daily) >= 3:
+        counts = list(daily.values())
+        volatility = min(1.0, np.std(counts) / np.mean(counts) / 3.0)
+
+    negative = [1 - a.confidence_score for a in articles if a.sentiment == "negative"]
+    spikes = min(1.0, max(negative) * 1.5) if negative else 0.0
+
+    decline = 0.0
+    if len(reviews) >= 5:
+        weekly = {}
+        for review in reviews:
+            weekly.setdefault(review.created_at.isocalendar()[1], []).append(
+                review.rating
+            )
+        averages = [np.mean(weekly[week]) for week in sorted(weekly)]
+        if len(averages) >= 2:
+            decline = max(0, (averages[0] - averages[-1]) / 5)
+
+    impact = 0.0
+    if articles:
+        weights = {"negative": 1, "positive": -0.5}
+        impact = max(
+            0,
+            sum(
+                a.confidence_score * a.relevance_score * weights.get(a.sentiment, 0)
+                for a in articles
+            )
+            / len(articles),
+        )
+
+    return {
+        "sentiment_trend": trend,
+        "volume_volatility": volatility,
+        "negative_spikes": spikes,
+        "review_decline": decline,
+        "news_impact": impact,
+    }
+
+
+def seed_company(session, articles, reviews, seed):
+    rng = random.Random(seed)
+    company = Company(name=f"Company {seed}")
+    session.add(company)
+    session.flush()
+
+    now = datetime.utcnow()
+    for i in range(articles):
+        session.add(
+            Article(
+                company_id=company.id,
+                source_id=1,
+                title=f"a{i}",
+                content="text",
+                url=f"https://example.com/{seed}/{i}",
+                published_date=now,
+                sentiment=rng.choice(["positive", "negative", "neutral"]),
+                confidence_score=round(rng.random(), 3),
+                relevance_score=round(rng.random(), 3),
+                created_at=now - timedelta(minutes=rng.randint(0, 29 * 24 * 60)),
+            )
+        )
+    for i in range(reviews):
+        session.add(
+            Review(
+                company_id=company.id,
+                platform="trustpilot",
+                rating=rng.randint(1, 5),
+                content="text",
+                review_date=now,
+                created_at=now - timedelta(minutes=rng.randint(0, 29 * 24 * 60)),
+            )
+        )
+    # Rows outside the 30-day window must be ignored
+    session.add(
+        Review(
+            company_id=company.id,
+            platform="trustpilot",
+            rating=1,
+            content="old",
+            review_date=now,
+            created_at=now - timedelta(days=45),
+        )
+    )
+    session.commit()
+    return company
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "articles,reviews,seed",
+    [(0, 0, 1), (3, 1, 2), (40, 0, 3), (0, 25, 4), (120, 60, 5), (500, 300, 6)],
+)
+def test_factors_match_row_by_row_reference(sqlite_session, articles, reviews, seed):
+    company = seed_company(sqlite_session, articles, reviews, seed)
+    engine = RiskScoringEngine(sqlite_session)
+
+    start = datetime.utcnow() - timedelta(days=30)
+    loaded_articles = (
+        sqlite_session.query(Article)
+        .filter(Article.company_id == company.id, Article.created_at >= start)
+        .all()
+    )
+    loaded_reviews = (
+        sqlite_session.query(Review)
+        .filter(Review.company_id == company.id, Review.created_at >= start)
+        .all()
+    )
+    expected = reference_factors(loaded_articles, loaded_reviews)
+
+    result = engine.calculate_risk_score(company.id)
+    if not articles and not reviews:
+        assert result["factors"] == ["Insufficient data"]
+        return
+
+    factors = {factor["name"]: factor["score"] for factor in result["factors"]}
+    assert factors == pytest.approx(expected)
+    weights = {name: cfg["weight"] for name, cfg in engine.risk_factors.items()}
+    total = sum(expected[name] * weight for name, weight in weights.items())
+    assert result["score"] == pytest.approx(min(100, max(0, total * 100)))
+
+
+@pytest.mark.unit
+def test_unknown_company(sqlite_session):
+    engine = RiskScoringEngine(sqlite_session)
+    assert engine.calculate_risk_score(999) == {"error": "Company not found"}
@@ -0,0 +1,225 @@
+# backend/tests/test_risk_state.py
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.sentiment import Article, Review
+from app.services.analyzers.risk_scorer import RiskScoringEngine, window_start
+from app.services.analyzers.risk_state import RiskFactorState, RiskStateStore
+from app.services.analyzers.sentiment_backfill import SentimentBackfillJob
+from tests.test_risk_scorer import seed_company
+from tests.test_sentiment_backfill import FakeAnalyzer
+
+
+class FakeRedis:
+    """In-memory stand-in for get/set and WATCH/MULTI pipelines."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def watch(self, key):
+        pass
+
+    def get(self, key):
+        return self.redis.get(key)
+
+    def multi(self):
+        pass
+
+    def set(self, key, value):
+        self.pending.append((key, value))
+
+    def execute(self):
+        for key, value in self.pending:
+            self.redis.set(key, value)
+        self.pending = []
+
+    def reset(self):
+        self.pending = []
+
+
+def add_rows(session, company_id, count, now):
+    articles = [
+        Article(
+            company_id=company_id,
+            source_id=1,
+            title=f"new {i}",
+            content="text",
+            url=f"https://example.com/new/{company_id}/{i}",
+            published_date=now,
+            sentiment="negative",
+            confidence_score=0.0,
+            relevance_score=0.9,
+            created_at=now + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+    review = Review(
+        company_id=company_id,
+        platform="trustpilot",
+        rating=1,
+        content="text",
+        review_date=now,
+        created_at=now + timedelta(seconds=count),
+    )
+    session.add_all(articles + [review])
+    session.commit()
+    return articles, [review]
+
+
+@pytest.mark.unit
+def test_rebuild_matches_full_recompute(sqlite_session):
+    company = seed_company(sqlite_session, 200, 80, seed=11)
+    store = RiskStateStore(FakeRedis())
+
+    store.rebuild(sqlite_session, company.id)
+
+    assert store.check(sqlite_session, company.id) == []
+
+
+@pytest.mark.unit
+def test_incremental_updates_stay_consistent(sqlite_session):
+    company = seed_company(sqlite_session, 50, 20, seed=12)
+    store = RiskStateStore(FakeRedis())
+    store.rebuild(sqlite_session, company.id)
+
+    articles, reviews = add_rows(sqlite_session, company.id, 5, datetime.utcnow())
+    store.record_articles(company.id, articles)
+    store.record_reviews(company.id, reviews)
+
+    assert store.check(sqlite_session, company.id) == []
+    inputs = store.load(company.id).to_inputs(datetime.utcnow())
+    assert inputs.tail[-1] == pytest.approx(0.2)
+    assert inputs.negative_max == pytest.approx(1.0)
+
+
+@pytest.mark.unit
+def test_rows_read_by_a_rebuild_are_not_recorded_again(sqlite_session):
+    company = seed_company(sqlite_session, 50, 20, seed=14)
+    store = RiskStateStore(FakeRedis())
+
+    # The collector commits, a reader rebuilds the missing state, and only
+    # then does the collector record what it stored
+    articles, reviews = add_rows(sqlite_session, company.id, 5, datetime.utcnow())
+    store.rebuild(sqlite_session, company.id)
+    store.record_articles(company.id, articles)
+    store.record_reviews(company.id, reviews)
+
+    assert store.check(sqlite_session, company.id) == []
+
+
+@pytest.mark.unit
+def test_check_reports_drift_and_missing_state(sqlite_session):
+    company = seed_company(sqlite_session, 30, 10, seed=13)
+    store = RiskStateStore(FakeRedis())
+    assert store.check(sqlite_session, company.id) == ["missing"]
+    # Updates for a company without state are skipped, not partially applied
+    store.record_reviews(company.id, [])
+    assert store.load(company.id) is None
+
+    store.rebuild(sqlite_session, company.id)
+    state = store.load(company.id)
+    state.add_review(datetime.utcnow(), 10_000, 5)
+    store.save(company.id, state)
+
+    assert "daily" in store.check(sqlite_session, company.id)
+
+
+@pytest.mark.unit
+def test_buckets_expire_as_the_window_slides():
+    state = RiskFactorState(window_days=30)
+    now = datetime(2024, 3, 31, 12)
+    state.add_review(now - timedelta(days=29), 1, 5)
+    state.add_review(now - timedelta(days=2), 2, 1)
+    state.add_article(now, 3, "positive", 0.9, 0.5)
+
+    inputs = state.to_inputs(now)
+    assert len(inputs.daily) == 3
+    assert inputs.head == [1.0, 0.2, 1.0]
+
+    inputs = state.to_inputs(now + timedelta(days=5))
+    assert len(inputs.daily) == 2
+    assert inputs.review_count == 1
+    assert inputs.head == [0.2, 1.0]
+
+
+@pytest.mark.unit
+def test_engine_reads_state(sqlite_session):
+    company = seed_company(sqlite_session, 120, 60, seed=14)
+    store = RiskStateStore(FakeRedis())
+
+    from_state = RiskScoringEngine(sqlite_session, state_store=store)
+    result = from_state.calculate_risk_score(company.id)
+
+    # The state was built on first read and gives the recomputed score
+    assert store.load(company.id) is not None
+    expected = RiskScoringEngine(sqlite_session).calculate_risk_score(company.id)
+    assert result["score"] == pytest.approx(expected["score"])
+    for got, want in zip(result["factors"], expected["factors"]):
+        assert got["score"] == pytest.approx(want["score"])
+
+
+def assert_same_score(result, expected):
+    assert result["score"] == pytest.approx(expected["score"])
+    for got, want in zip(result["factors"], expected["factors"]):
+        assert got["score"] == pytest.approx(want["score"])
+
+
+@pytest.mark.unit
+def test_state_and_sql_share_the_day_aligned_window(sqlite_session):
+    company = seed_company(sqlite_session, 40, 10, seed=15)
+    # Inside the window's first day, but more than 30 x 24h ago
+    edge = window_start(datetime.utcnow()) + timedelta(minutes=1)
+    add_rows(sqlite_session, company.id, 1, edge)
+    store = RiskStateStore(FakeRedis())
+
+    expected = RiskScoringEngine(sqlite_session).calculate_risk_score(company.id)
+    result = RiskScoringEngine(sqlite_session, state_store=store).calculate_risk_score(
+        company.id
+    )
+
+    assert edge.date() in store.load(company.id).to_inputs(datetime.utcnow()).daily
+    assert_same_score(result, expected)
+
+
+@pytest.mark.unit
+def test_backfill_invalidates_the_rescored_companies_state(sqlite_session):
+    company = seed_company(sqlite_session, 60, 20, seed=16)
+    store = RiskStateStore(FakeRedis())
+    store.rebuild(sqlite_session, company.id)
+
+    SentimentBackfillJob(sqlite_session, FakeAnalyzer(), risk_state=store).run()
+
+    assert store.load(company.id) is None
+    result = RiskScoringEngine(sqlite_session, state_store=store).calculate_risk_score(
+        company.id
+    )
+    assert store.check(sqlite_session, company.id) == []
+    assert_same_score(
+        result, RiskScoringEngine(sqlite_session).calculate_risk_score(company.id)
+    )
@@ -79,3 +79,136 @@ class TestSentimentAnalyzerClass:
     def test_batch_analyze_method_exists(self):
         assert hasattr(self.analyzer, "batch_analyze")
         assert callable(self.analyzer.batch_analyze)
+
+
+def _fake_pipeline(texts, **kwargs):
+    """Stand-in for a transformers pipeline that scores by text length."""
+    if isinstance(texts, str):
+        texts = [texts]
+    return [
+        {"label": "positive" if len(text) % 2 else "negative", "score": 0.9}
+        for text in texts
+    ]
+
+
+def test_batch_analyze_preserves_input_order():
+    """Batched results come back in input order despite length bucketing."""
+    analyzer = SentimentAnalyzer(batch_size=2)
+    texts = ["a much longer piece of text", "", "odd", "even", "xx"]
+
+    with patch.object(analyzer, "pipeline", Mock(side_effect=_fake_pipeline)):
+        results = analyzer.batch_analyze(texts)
+        calls = analyzer.pipeline.call_count
+
+    assert calls == 2
+    assert results[1]["method"].startswith("fallback")
+    for text, result in zip(texts, results):
+        if text:
+            assert result == analyzer._format_pipeline_output(_fake_pipeline(text)[0])
+
+
+def test_batch_analyze_falls_back_per_item():
+    """A failing batch is retried per item, falling back to the simple path."""
+    analyzer = SentimentAnalyzer()
+
+    def flaky(texts, **kwargs):
+        if isinstance(texts, list) or "bad" in texts:
+            raise RuntimeError("boom")
+        return _fake_pipeline(texts)
+
+    with patch.object(analyzer, "pipeline", Mock(side_effect=flaky)):
+        results = analyzer.batch_analyze(["fine text", "bad and terrible"])
+
+    assert results[0]["method"] == "transformers"
+    assert results[1]["method"] == "simple"
+    assert results[1]["sentiment"] == "NEGATIVE"
+
+
+def test_analyzers_share_one_model_per_name():
+    """The model registry loads each model once per process."""
+    from app.services.analyzers.model_registry import model_registry
+
+    model_registry.clear()
+    loader = sys.modules["transformers"].pipeline
+    loader.reset_mock()
+
+    first = SentimentAnalyzer(model_name="shared-model")
+    second = SentimentAnalyzer(model_name="shared-model")
+
+    assert first.pipeline is second.pipeline
+    assert loader.call_count == 1
+
+
+def test_failed_onnx_load_reports_the_pytorch_backend():
+    """A fallback to PyTorch is not tagged as an ONNX model version."""
+    from app.services.analyzers import onnx_backend
+    from app.services.analyzers.model_registry import model_registry
+
+    model_registry.clear()
+    with patch.object(
+        onnx_backend, "load_onnx_pipeline", Mock(side_effect=ImportError("no ort"))
+    ):
+        analyzer = SentimentAnalyzer(model_name="fallback-model", backend="onnx")
+
+    assert analyzer.pipeline is not None
+    assert analyzer.backend == "pytorch"
+    assert "+onnx" not in analyzer.model_version
+
+
+def test_long_document_windows_go_through_one_batch():
+    """All windows of all documents are scored together and length-weighted."""
+    analyzer = SentimentAnalyzer(
+        batch_size=64, long_document=True, window_tokens=20, window_overlap=4
+    )
+    long_positive = " ".join(["upbeat"] * 100)
+    mixed = " ".join(["upbeat"] * 30 + ["gloomy"] * 60)
+
+    def by_word(texts, **kwargs):
+        return [
+            {
+                "label": "NEGATIVE"
+                if text.count("gloomy") > text.count("upbeat")
+                else "POSITIVE",
+                "score": 0.8,
+            }
+            for text in texts
+        ]
+
+    pipeline = Mock(side_effect=by_word)
+    with patch.object(analyzer, "pipeline", pipeline):
+        results = analyzer.batch_analyze([long_positive, "upbeat", mixed])
+
+    assert pipeline.call_count == 1
+    assert len(pipeline.call_args.args[0]) > 3
+    assert results[0] == {
+        "sentiment": "POSITIVE",
+        "confidence": 0.8,
+        "method": "transformers",
+    }
+    assert results[1]["confidence"] == 0.8
+    assert results[2]["sentiment"] == "NEGATIVE"
+    assert 0.5 < results[2]["confidence"] < 0.8
+
+
+def test_simple_analyze_matches_through_punctuation():
+    """The compiled lexicon matches words followed by punctuation."""
+    analyzer = SentimentAnalyzer()
+    result = analyzer._simple_analyze("Great! Excellent, strong growth.")
+    assert result == {"sentiment": "POSITIVE", "confidence": 0.9, "method": "simple"}
+
+
+def test_simple_batch_matches_single_text_scoring():
+    """Vectorized lexicon scoring gives the same results as per-text scoring."""
+    analyzer = SentimentAnalyzer()
+    texts = [
+        "good news for the company today",
+        "bad quarter with a loss and a problem",
+        "nothing to see here",
+        "growth and decline this year",
+    ]
+
+    with patch.object(analyzer, "pipeline", None):
+        batch = analyzer.batch_analyze(texts)
+
+    assert batch == [analyzer._simple_analyze(text) for text in texts]
+    assert batch[2]["method"] == "fallback (no_keywords)"
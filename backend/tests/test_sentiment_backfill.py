@@ -0,0 +1,185 @@
+# backend/tests/test_sentiment_backfill.py
+from datetime import datetime
+
+import pytest
+
+from app.models.sentiment import Article
+from app.services.analyzers import sentiment_analyzer
+from app.services.analyzers.sentiment_backfill import (
+    BackfillCheckpoint,
+    SentimentBackfillJob,
+)
+
+
+class FakeAnalyzer:
+    model_version = "new-model@2"
+    pipeline = object()
+
+    def __init__(self, fallback_texts=()):
+        self.batches = []
+        self.fallback_texts = set(fallback_texts)
+
+    def batch_analyze(self, texts):
+        self.batches.append(list(texts))
+        return [
+            (
+                {"sentiment": "NEUTRAL", "confidence": 0.0, "method": "simple"}
+                if text in self.fallback_texts
+                else {
+                    "sentiment": "POSITIVE",
+                    "confidence": 0.9,
+                    "method": "transformers",
+                }
+            )
+            for text in texts
+        ]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _add_articles(session, models):
+    for n, model in enumerate(models):
+        session.add(
+            Article(
+                company_id=1,
+                source_id=1,
+                title=f"title {n}",
+                content=f"content {n}",
+                url=f"https://example.com/{n}",
+                published_date=datetime(2024, 1, 1),
+                sentiment="neutral",
+                sentiment_model=model,
+            )
+        )
+    session.commit()
+
+
+def test_backfill_is_resumable_and_skips_current_rows(sqlite_session):
+    _add_articles(sqlite_session, [None, "old@1", "new-model@2", "old@1", "old@1"])
+    analyzer = FakeAnalyzer()
+    checkpoint = BackfillCheckpoint("test")
+
+    first = SentimentBackfillJob(
+        sqlite_session, analyzer, batch_size=2, checkpoint=checkpoint
+    ).run(max_batches=1)
+    assert first["processed"] == 2
+    assert checkpoint.load() == 2
+
+    second = SentimentBackfillJob(
+        sqlite_session, analyzer, batch_size=2, checkpoint=checkpoint
+    ).run()
+    assert second["processed"] == 2
+    assert analyzer.batches == [["content 0", "content 1"], ["content 3", "content 4"]]
+
+    rows = sqlite_session.query(Article).order_by(Article.id).all()
+    assert {row.sentiment_model for row in rows} == {"new-model@2"}
+    assert [row.sentiment for row in rows] == [
+        "positive",
+        "positive",
+        "neutral",
+        "positive",
+        "positive",
+    ]
+
+
+def test_backfill_rate_limit_sleeps_to_target(sqlite_session):
+    _add_articles(sqlite_session, ["old@1"] * 4)
+    clock = FakeClock()
+
+    SentimentBackfillJob(
+        sqlite_session,
+        FakeAnalyzer(),
+        batch_size=2,
+        max_rows_per_second=4,
+        clock=clock,
+        sleep=clock.sleep,
+    ).run()
+
+    assert clock.slept == [0.5, 0.5]
+
+
+def test_rows_the_model_did_not_score_stay_stale(sqlite_session):
+    _add_articles(sqlite_session, ["old@1"] * 3)
+    checkpoint = BackfillCheckpoint("test")
+
+    stats = SentimentBackfillJob(
+        sqlite_session,
+        FakeAnalyzer(fallback_texts=["content 1"]),
+        checkpoint=checkpoint,
+    ).run()
+    assert stats["processed"] == 3 and stats["skipped"] == 1
+    assert stats["completed"] and checkpoint.load() == 0
+
+    rows = sqlite_session.query(Article).order_by(Article.id).all()
+    assert [row.sentiment_model for row in rows] == [
+        "new-model@2",
+        "old@1",
+        "new-model@2",
+    ]
+    assert rows[1].sentiment == "neutral"
+
+    # The next pass starts over and retries only the skipped row
+    analyzer = FakeAnalyzer()
+    SentimentBackfillJob(sqlite_session, analyzer, checkpoint=checkpoint).run()
+    assert analyzer.batches == [["content 1"]]
+
+
+def test_rows_without_text_are_stamped_once(sqlite_session):
+    _add_articles(sqlite_session, ["old@1"] * 2)
+    empty = sqlite_session.query(Article).order_by(Article.id).first()
+    empty.content, empty.sentiment = " \n ", "negative"
+    sqlite_session.commit()
+    checkpoint = BackfillCheckpoint("test")
+
+    analyzer = FakeAnalyzer(fallback_texts=[" \n "])
+    stats = SentimentBackfillJob(sqlite_session, analyzer, checkpoint=checkpoint).run()
+    assert stats["skipped"] == 0
+    assert (empty.sentiment_model, empty.sentiment) == ("new-model@2", "neutral")
+
+    # Nothing is left for the next pass to re-read
+    analyzer = FakeAnalyzer()
+    SentimentBackfillJob(sqlite_session, analyzer, checkpoint=checkpoint).run()
+    assert analyzer.batches == []
+
+
+def test_backfill_refuses_to_run_without_the_model(sqlite_session):
+    _add_articles(sqlite_session, ["old@1"])
+    analyzer = FakeAnalyzer()
+    analyzer.pipeline = None
+
+    with pytest.raises(RuntimeError):
+        SentimentBackfillJob(sqlite_session, analyzer).run()
+    assert analyzer.batches == []
+    assert sqlite_session.query(Article).one().sentiment_model == "old@1"
+
+
+def test_analyze_sentiment_reports_the_method_used(monkeypatch):
+    class Analyzer:
+        model_version = "new-model@2"
+
+        def __init__(self, method):
+            self.method = method
+
+        def analyze(self, text):
+            return {"sentiment": "NEGATIVE", "confidence": 0.7, "method": self.method}
+
+    for method, model in [
+        ("transformers", "new-model@2"),
+        ("simple", "simple"),
+        ("fallback (empty)", "fallback (empty)"),
+    ]:
+        monkeypatch.setattr(
+            sentiment_analyzer, "get_sentiment_analyzer", lambda: Analyzer(method)
+        )
+        assert sentiment_analyzer.analyze_sentiment("text")["model"] == model
@@ -0,0 +1,85 @@
+# backend/tests/test_sentiment_cache.py
+import json
+from unittest.mock import Mock, patch
+
+from app.services.analyzers.sentiment_analyzer import SentimentAnalyzer
+from app.services.analyzers.sentiment_cache import SentimentCache
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis client API we use."""
+
+    def __init__(self):
+        self.data = {}
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+
+def test_key_ignores_whitespace_but_not_model():
+    cache = SentimentCache()
+    key = cache.make_key("Shares  rose\ntoday ", "model@1")
+    assert key == cache.make_key("Shares rose today", "model@1")
+    assert key != cache.make_key("Shares rose today", "model@2")
+
+
+def test_lru_bound_and_ttl_expiry():
+    cache = SentimentCache(max_entries=2, ttl_seconds=60)
+    for name in ("a", "b", "c"):
+        cache.set(name, {"sentiment": name})
+
+    assert cache.get("a") is None
+    assert cache.get("c") == {"sentiment": "c"}
+
+    with patch("app.services.analyzers.sentiment_cache.time.monotonic") as clock:
+        clock.return_value = 10**9
+        assert cache.get("c") is None
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["expirations"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_redis_tier_is_shared_between_processes():
+    redis = FakeRedis()
+    SentimentCache(redis_client=redis).set("k", {"sentiment": "POSITIVE"})
+
+    other = SentimentCache(redis_client=redis)
+    assert other.get("k") == {"sentiment": "POSITIVE"}
+    assert other.get("k") == {"sentiment": "POSITIVE"}
+    assert other.stats()["redis_hits"] == 1
+    assert other.stats()["hits"] == 1
+    assert json.loads(redis.data["k"]) == {"sentiment": "POSITIVE"}
+
+
+def test_analyzer_runs_model_once_per_content():
+    analyzer = SentimentAnalyzer(cache=SentimentCache())
+    pipeline = Mock(
+        side_effect=lambda texts, **kwargs: [
+            {"label": "positive", "score": 0.9}
+            for _ in (texts if isinstance(texts, list) else [texts])
+        ]
+    )
+
+    with patch.object(analyzer, "pipeline", pipeline):
+        first = analyzer.analyze("Wire story about growth")
+        results = analyzer.batch_analyze(
+            ["Wire story  about growth", "Another story", "Another story"]
+        )
+
+    assert pipeline.call_count == 2
+    assert pipeline.call_args.args[0] == ["Another story"]
+    assert results[0] == first
+    assert results[1] == results[2]
+    assert analyzer.cache.stats()["hits"] == 1
@@ -0,0 +1,124 @@
+# backend/tests/test_sentiment_rollups.py
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import select
+
+from app.models.sentiment import Article, Review, SentimentRollup
+from app.services.analyzers import sentiment_rollups
+from app.services.analyzers.risk_scorer import ARTICLE_SCORE, REVIEW_SCORE
+from app.services.analyzers.sentiment_backfill import SentimentBackfillJob
+from tests.test_risk_scorer import seed_company
+from tests.test_risk_state import add_rows
+from tests.test_sentiment_backfill import FakeAnalyzer
+
+START = (datetime.utcnow() - timedelta(days=365)).date()
+
+
+def raw_points(session, company_id, since):
+    """One row per article and review since `since`: what the rollups sum"""
+    articles = session.execute(
+        select(Article.created_at, ARTICLE_SCORE, Article.confidence_score).where(
+            Article.company_id == company_id, Article.created_at >= since
+        )
+    ).all()
+    reviews = session.execute(
+        select(Review.created_at, REVIEW_SCORE).where(
+            Review.company_id == company_id, Review.created_at >= since
+        )
+    ).all()
+    frame = pd.DataFrame(
+        [
+            (created_at, score, confidence, False)
+            for created_at, score, confidence in articles
+        ]
+        + [
+            (created_at, score, sentiment_rollups.REVIEW_CONFIDENCE, True)
+            for created_at, score in reviews
+        ],
+        columns=["created_at", "score", "confidence", "is_review"],
+    ).sort_values("created_at", kind="stable", ignore_index=True)
+    frame["date"] = frame["created_at"].dt.normalize()
+    return frame
+
+
+@pytest.mark.unit
+def test_rebuild_matches_raw_points(sqlite_session):
+    company = seed_company(sqlite_session, 120, 40, seed=51)
+    seed_company(sqlite_session, 30, 10, seed=52)
+
+    written = sentiment_rollups.rebuild(sqlite_session, START)
+
+    assert written == sqlite_session.query(SentimentRollup).count()
+    assert sentiment_rollups.check(sqlite_session, START) == []
+
+    since = datetime.combine(START, datetime.min.time())
+    points = raw_points(sqlite_session, company.id, since)
+    rollups = sentiment_rollups.load_company_rollups(
+        sqlite_session, [company.id], since
+    )
+    daily = rollups.company(0)
+    means = points.groupby("date")["score"].mean()
+    assert rollups.totals()[0] == len(points)
+    assert np.array_equal(daily.day, means.index.values.astype("datetime64[D]"))
+    assert np.allclose(daily.mean, means)
+    assert daily.confidence_sum.sum() == pytest.approx(points["confidence"].sum())
+
+    reviews = sentiment_rollups.load_company_rollups(
+        sqlite_session, [company.id], since, source_type="review"
+    )
+    assert reviews.totals()[0] == points["is_review"].sum()
+
+
+@pytest.mark.unit
+def test_ingest_updates_match_rebuild(sqlite_session):
+    company = seed_company(sqlite_session, 40, 20, seed=53)
+    sentiment_rollups.rebuild(sqlite_session, START)
+    sqlite_session.commit()
+
+    # Twice, so the second batch adds to rows the first one created
+    for _ in range(2):
+        articles, reviews = add_rows(
+            sqlite_session, company.id, 3, datetime.utcnow() + timedelta(days=1)
+        )
+        sentiment_rollups.record_articles(sqlite_session, articles)
+        sentiment_rollups.record_reviews(sqlite_session, reviews)
+        sqlite_session.commit()
+
+    assert sentiment_rollups.check(sqlite_session, START, company.id) == []
+    tomorrow = sqlite_session.get(
+        SentimentRollup, (company.id, date.today() + timedelta(days=1), "article")
+    )
+    assert tomorrow.count == 6
+    assert tomorrow.score_sq_sum == 0.0
+
+
+@pytest.mark.unit
+def test_check_reports_drift_and_rebuild_repairs(sqlite_session):
+    company = seed_company(sqlite_session, 40, 20, seed=54)
+    sentiment_rollups.rebuild(sqlite_session, START)
+
+    # Ingested without going through the rollups
+    add_rows(sqlite_session, company.id, 2, datetime.utcnow() + timedelta(days=2))
+    day = date.today() + timedelta(days=2)
+    assert sentiment_rollups.check(sqlite_session, START) == [
+        (company.id, day, "article"),
+        (company.id, day, "review"),
+    ]
+
+    sentiment_rollups.rebuild(sqlite_session, START, company.id)
+    assert sentiment_rollups.check(sqlite_session, START) == []
+
+
+@pytest.mark.unit
+def test_backfill_moves_rescored_articles(sqlite_session):
+    seed_company(sqlite_session, 30, 5, seed=55)
+    sentiment_rollups.rebuild(sqlite_session, START)
+    sqlite_session.commit()
+
+    SentimentBackfillJob(sqlite_session, FakeAnalyzer()).run()
+
+    assert sqlite_session.query(Article).filter_by(sentiment="positive").count() == 30
+    assert sentiment_rollups.check(sqlite_session, START) == []
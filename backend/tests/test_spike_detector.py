@@ -0,0 +1,157 @@
+# backend/tests/test_spike_detector.py
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.sentiment import Article
+from app.services.analyzers.spike_detector import (
+    CompanySpikeState,
+    SpikeDetectorStore,
+)
+from tests.test_risk_state import FakePipeline, FakeRedis
+
+START = datetime(2026, 1, 5)
+
+
+class StreamRedis(FakeRedis):
+    """FakeRedis with the XADD the detector appends events with."""
+
+    def __init__(self):
+        super().__init__()
+        self.streams = {}
+
+    def xadd(self, key, fields, maxlen=None, approximate=False):
+        self.streams.setdefault(key, []).append(fields)
+
+    def pipeline(self):
+        return StreamPipeline(self)
+
+
+class StreamPipeline(FakePipeline):
+    def xadd(self, key, fields, **kwargs):
+        self.pending.append((key, fields))
+
+    def execute(self):
+        for key, value in self.pending:
+            if isinstance(value, dict):
+                self.redis.xadd(key, value)
+            else:
+                self.redis.set(key, value)
+        self.pending = []
+
+
+def steady_stream(hours, rng, per_hour=3, negative_rate=0.1, start=START):
+    """(time, negative) mentions, a few per hour"""
+    mentions = []
+    for hour in range(hours):
+        for _ in range(rng.randint(per_hour - 1, per_hour + 1)):
+            minute = timedelta(hours=hour, minutes=rng.randrange(60))
+            mentions.append((start + minute, rng.random() < negative_rate))
+    return sorted(mentions)
+
+
+def feed(state, mentions, company_id=1):
+    events = []
+    for timestamp, negative in mentions:
+        events.extend(state.observe(company_id, timestamp, negative))
+    return events
+
+
+@pytest.mark.unit
+def test_steady_stream_is_quiet():
+    state = CompanySpikeState()
+    assert feed(state, steady_stream(24 * 14, random.Random(1))) == []
+
+
+@pytest.mark.unit
+def test_burst_is_reported_once_when_it_happens():
+    rng = random.Random(2)
+    state = CompanySpikeState()
+    feed(state, steady_stream(72, rng))
+
+    burst_start = START + timedelta(hours=72, minutes=5)
+    burst = [(burst_start + timedelta(seconds=20 * i), False) for i in range(40)]
+    events = feed(state, burst)
+
+    assert len(events) == 1
+    spike = events[0]
+    assert (spike.kind, spike.metric) == ("spike", "volume")
+    # Reported on the mention that crossed the threshold, not at bucket close
+    assert spike.timestamp < burst[15][0].isoformat()
+    assert spike.value < 15 and spike.score > 4
+
+
+@pytest.mark.unit
+def test_late_backlog_is_not_a_spike():
+    state = CompanySpikeState()
+    feed(state, steady_stream(72, random.Random(6)))
+    open_count = state.bucket_count
+
+    # A source catching up delivers a day of older, negative mentions at once
+    backlog_start = START + timedelta(hours=48)
+    backlog = [(backlog_start + timedelta(minutes=10 * i), True) for i in range(120)]
+
+    assert feed(state, backlog) == []
+    assert state.bucket_count == open_count
+
+
+@pytest.mark.unit
+def test_negative_shift_is_a_change_point():
+    rng = random.Random(3)
+    state = CompanySpikeState()
+    assert feed(state, steady_stream(96, rng, negative_rate=0.1)) == []
+
+    shifted = steady_stream(
+        48, rng, negative_rate=0.6, start=START + timedelta(hours=96)
+    )
+    events = [e for e in feed(state, shifted) if e.metric == "negative_share"]
+
+    assert events and events[0].kind == "change_point"
+    assert events[0].baseline < 0.2
+    # Detected within a few hours of the shift
+    first = datetime.fromisoformat(events[0].timestamp)
+    assert first < START + timedelta(hours=96 + 12)
+
+
+@pytest.mark.unit
+def test_checkpoint_resumes_identically():
+    mentions = steady_stream(24 * 5, random.Random(4), negative_rate=0.3)
+    mentions += [(START + timedelta(days=5, seconds=i), True) for i in range(60)]
+    half = len(mentions) // 2
+
+    uninterrupted = CompanySpikeState()
+    expected = feed(uninterrupted, mentions)
+
+    resumed = CompanySpikeState()
+    events = feed(resumed, mentions[:half])
+    resumed = CompanySpikeState.from_json(resumed.to_json())
+    events += feed(resumed, mentions[half:])
+
+    assert events == expected and expected
+    assert resumed.to_json() == uninterrupted.to_json()
+
+
+@pytest.mark.unit
+def test_store_checkpoints_and_streams_events():
+    redis = StreamRedis()
+    store = SpikeDetectorStore(redis)
+    rng = random.Random(5)
+    for day in range(3):
+        batch = steady_stream(24, rng, start=START + timedelta(days=day))
+        store.observe(7, batch)
+    assert store.load(7).volume.count >= 24 * 3 - 1
+
+    burst_time = START + timedelta(days=3, minutes=1)
+    articles = [
+        Article(company_id=7, sentiment="negative", published_date=burst_time)
+        for _ in range(30)
+    ]
+    events = store.record_articles(7, articles)
+
+    assert any(e.kind == "spike" for e in events)
+    stream = redis.streams[store.events_key]
+    assert len(stream) == len(events)
+    assert stream[0]["company_id"] == "7"
+    assert stream[0]["timestamp"] == burst_time.isoformat()
+    assert SpikeDetectorStore().record_articles(7, articles) == []
@@ -0,0 +1,94 @@
+# backend/tests/test_trend_analyzer.py
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from app.services.analyzers import sentiment_rollups
+from app.services.analyzers.trend_analyzer import TrendAnalyzer
+from tests.test_risk_scorer import seed_company
+from tests.test_sentiment_rollups import raw_points
+
+
+@pytest.mark.unit
+def test_trends_from_rollups_match_raw_points(sqlite_session):
+    company = seed_company(sqlite_session, 150, 60, seed=42)
+    start = datetime.combine(
+        (datetime.utcnow() - timedelta(days=90)).date(), datetime.min.time()
+    )
+    sentiment_rollups.rebuild(sqlite_session, start.date())
+
+    result = TrendAnalyzer(sqlite_session).analyze_company_trends(company.id)
+
+    frame = raw_points(sqlite_session, company.id, start)
+    daily = frame.groupby("date")["score"].mean()
+    ma_7 = daily.rolling(window=7).mean()
+
+    assert result["data_points"] == len(frame) > 0
+    assert result["volatility"] == pytest.approx(frame["score"].std(ddof=0))
+    assert result["momentum"] == pytest.approx(ma_7.iloc[-1] - ma_7.iloc[-8])
+    assert len(result["predictions"]) == 7
+    for prediction in result["predictions"]:
+        assert 0 <= prediction["lower"] <= prediction["predicted_score"] <= 1
+        assert prediction["predicted_score"] <= prediction["upper"] <= 1
+    assert result["predictions"][0]["date"] == (
+        daily.index[-1] + timedelta(days=1)
+    ).strftime("%Y-%m-%d")
+
+    weekly = frame.groupby(frame["date"].dt.dayofweek)["score"].mean()
+    expected = [
+        score for score in weekly if score > 0.6 or score < 0.4
+    ]  # weekly patterns come first
+    reported = [
+        p["score"] for p in result["seasonal_patterns"] if p["type"] == "weekly"
+    ]
+    assert reported == pytest.approx(expected)
+
+
+@pytest.mark.unit
+def test_no_data_is_stable(sqlite_session):
+    result = TrendAnalyzer(sqlite_session).analyze_company_trends(12345)
+    assert result["trend"] == "stable"
+    assert result["predictions"] == []
+
+
+@pytest.mark.unit
+def test_holt_forecast_model(sqlite_session):
+    company = seed_company(sqlite_session, 150, 60, seed=43)
+    sentiment_rollups.rebuild(
+        sqlite_session, (datetime.utcnow() - timedelta(days=90)).date()
+    )
+
+    analyzer = TrendAnalyzer(sqlite_session, forecast_model="holt")
+    predictions = analyzer.analyze_company_trends(company.id)["predictions"]
+
+    dates = pd.to_datetime([p["date"] for p in predictions])
+    assert len(predictions) == 7
+    assert (dates[1:] - dates[:-1]).days.tolist() == [1] * 6
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("model", ["linear", "holt"])
+def test_batch_matches_single_company_analysis(sqlite_session, model):
+    companies = [
+        seed_company(sqlite_session, articles, reviews, seed)
+        for articles, reviews, seed in [(150, 60, 44), (4, 2, 45), (60, 20, 46)]
+    ]
+    sentiment_rollups.rebuild(
+        sqlite_session, (datetime.utcnow() - timedelta(days=90)).date()
+    )
+    company_ids = [companies[2].id, 999, companies[0].id, companies[1].id]
+
+    analyzer = TrendAnalyzer(sqlite_session, forecast_model=model)
+    batch = analyzer.analyze_companies(company_ids)
+
+    assert list(batch) == company_ids
+    assert batch[999]["predictions"] == []
+    assert batch[companies[1].id]["trend"] == "stable"
+    for company_id in company_ids:
+        single = analyzer.analyze_company_trends(company_id)
+        # Moving averages are cumulative sums over all companies' rows
+        assert batch[company_id].pop("momentum") == pytest.approx(
+            single.pop("momentum")
+        )
+        assert batch[company_id] == single